@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from functools import partial
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_state_change_event
 
-from .const import CONF_DOMAIN, DOMAIN
-from .coordinator import PorkbunDdnsCoordinator
+# Only what async_setup_entry needs is imported here. config_flow, repairs and diagnostics
+# are loaded by Home Assistant on its own, so nothing on this path may import them.
+from .const import API_WARM_UP_LEAD, CONF_DOMAIN, DOMAIN
+from .coordinator import PorkbunDdnsCoordinator, async_remove_stored_state
+from .shared import async_release_client
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.BUTTON, Platform.SENSOR]
 
@@ -20,6 +26,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: PorkbunDdnsConfigEntry)
     """Set up Porkbun DDNS from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     coordinator = PorkbunDdnsCoordinator(hass, entry)
+    entry.async_on_unload(partial(async_release_client, hass, entry.entry_id))
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -36,6 +43,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: PorkbunDdnsConfigEntry)
             )
         )
 
+        if coordinator.warm_up_enabled:
+
+            @callback
+            def _warm_up_before_startup_refresh(_: object) -> None:
+                coordinator.async_warm_up_connection()
+
+            entry.async_on_unload(
+                async_track_point_in_utc_time(
+                    hass,
+                    _warm_up_before_startup_refresh,
+                    coordinator.startup_delay_until - timedelta(seconds=API_WARM_UP_LEAD),
+                )
+            )
+
+    if coordinator.ip_source_entity is not None:
+        entry.async_on_unload(
+            async_track_state_change_event(
+                hass, coordinator.ip_source_entity, coordinator.async_handle_ip_source_change
+            )
+        )
+
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -48,6 +76,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: PorkbunDdnsConfigEntry)
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: PorkbunDdnsConfigEntry) -> None:
+    """Delete persisted state when a config entry is removed."""
+    await async_remove_stored_state(hass, entry.entry_id)
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: PorkbunDdnsConfigEntry,
@@ -3,19 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import secrets
+import time
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
 
 from .const import (
+    API_CIRCUIT_FAILURE_THRESHOLD,
+    API_CIRCUIT_RESET_TIMEOUT,
+    API_HEDGE_DEFAULT_DELAY,
+    API_HEDGE_MAX_DELAY,
+    API_HEDGE_MIN_DELAY,
+    API_HEDGE_MIN_SAMPLES,
+    API_LATENCY_WINDOW,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_METRICS_LATENCY_BUCKETS,
+    API_METRICS_SIZE_BUCKETS,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
     API_REQUEST_MAX_ATTEMPTS,
     API_REQUEST_RETRY_BASE,
-    API_REQUEST_RETRY_JITTER_MAX,
+    API_REQUEST_RETRY_BASE_MAX,
+    API_REQUEST_RETRY_BASE_MIN,
+    API_REQUEST_RETRY_JITTER,
     API_REQUEST_TIMEOUT,
+    API_REQUEST_TIMEOUT_MAX,
+    API_REQUEST_TIMEOUT_MIN,
+    API_RETRY_AFTER_MAX,
+    API_WARM_UP_WINDOW,
+    DOMAIN_LIST_PAGE_SIZE,
     LOGGER,
     PORKBUN_API_BASE,
+    PORKBUN_API_BASE_IPV6,
+)
+from .metrics import EndpointStats
+from .resilience import (
+    CircuitBreaker,
+    CircuitState,
+    LatencyWindow,
+    RetryBudget,
+    RttEstimator,
+    TokenBucket,
+    parse_retry_after,
 )
 
 
@@ -27,6 +61,14 @@ class PorkbunAuthError(PorkbunApiError):
     """Authentication failure."""
 
 
+class PorkbunCircuitOpenError(PorkbunApiError):
+    """Request rejected without being sent because the API is failing."""
+
+
+class PorkbunRetryBudgetError(PorkbunApiError):
+    """Request rejected without being sent because the update cycle ran out of retries."""
+
+
 @dataclass
 class DnsRecord:
     """A DNS record from Porkbun."""
@@ -38,6 +80,59 @@ class DnsRecord:
     ttl: str
 
 
+# DNS records grouped by (lower-cased FQDN, record type).
+type RecordIndex = dict[tuple[str, str], list[DnsRecord]]
+
+
+def _parse_record(raw: dict[str, Any]) -> DnsRecord:
+    """Build a DnsRecord from a raw API record object."""
+    return DnsRecord(
+        id=raw["id"],
+        name=raw["name"],
+        record_type=raw["type"],
+        content=raw["content"],
+        ttl=raw["ttl"],
+    )
+
+
+def index_records(records: Iterable[DnsRecord]) -> RecordIndex:
+    """Group records by (name, type) so per-record lookups are O(1)."""
+    index: RecordIndex = {}
+    for record in records:
+        index.setdefault((record.name.lower(), record.record_type), []).append(record)
+    return index
+
+
+def _endpoint_name(endpoint: str) -> str:
+    """Return the endpoint without its per-domain path arguments (e.g. "dns/retrieve")."""
+    return "/".join(endpoint.strip("/").split("/")[:2])
+
+
+def _failure_cause(err: BaseException) -> str:
+    """Return a short metrics label for why a request failed."""
+    if isinstance(err, PorkbunCircuitOpenError):
+        return "circuit_open"
+    if isinstance(err, PorkbunRetryBudgetError):
+        return "retry_budget"
+    if isinstance(err, PorkbunAuthError):
+        return "auth"
+    if isinstance(err, PorkbunApiError):
+        return "api_error"
+    if isinstance(err, TimeoutError):
+        return "timeout"
+    if isinstance(err, aiohttp.ClientError):
+        return "connection"
+    if isinstance(err, asyncio.CancelledError):
+        return "cancelled"
+    return type(err).__name__
+
+
+def _is_missing_records_error(err: PorkbunApiError) -> bool:
+    """Return True when Porkbun reports an empty result as an error."""
+    text = str(err).lower()
+    return "no records" in text or "could not find" in text
+
+
 @dataclass
 class DomainInfo:
     """Domain registration info from Porkbun."""
@@ -49,6 +144,17 @@ class DomainInfo:
     auto_renew: bool
 
 
+def _parse_domain(raw: dict[str, Any]) -> DomainInfo:
+    """Build a DomainInfo from a raw domain/listAll entry."""
+    return DomainInfo(
+        domain=raw["domain"],
+        status=raw.get("status", "UNKNOWN"),
+        expire_date=raw.get("expireDate", ""),
+        whois_privacy=raw.get("whoisPrivacy", "0") == "1",
+        auto_renew=raw.get("autoRenew", "0") == "1",
+    )
+
+
 class PorkbunClient:
     """Async client for the Porkbun API v3."""
 
@@ -58,12 +164,40 @@ class PorkbunClient:
         api_key: str,
         secret_key: str,
         api_base: str = PORKBUN_API_BASE,
+        max_concurrent_requests: int = API_MAX_CONCURRENT_REQUESTS,
+        rate_limit: float = API_RATE_LIMIT,
+        rate_burst: int = API_RATE_BURST,
+        ipv6_session: aiohttp.ClientSession | None = None,
+        ipv6_api_base: str = PORKBUN_API_BASE_IPV6,
     ) -> None:
-        """Initialize the client."""
+        """Initialize the client.
+
+        ipv6_session should only connect over IPv6 (e.g. an AF_INET6 connector), so that
+        ping_ipv6() reaches the dual-stack API host over IPv6 and learns the IPv6 address.
+        """
         self._session = session
         self._api_key = api_key
         self._secret_key = secret_key
         self._api_base = api_base.rstrip("/")
+        self._ipv6_session = ipv6_session or session
+        self._ipv6_api_base = ipv6_api_base.rstrip("/")
+        # Caps in-flight requests for everyone sharing this client (i.e. the whole account).
+        self._request_slots = asyncio.Semaphore(max(1, max_concurrent_requests))
+        # Paces requests just under Porkbun's rate limit; 429/503 Retry-After hints pause it for everyone.
+        self._rate_limiter = TokenBucket(rate_limit, rate_burst)
+        # Fails fast for everyone on the account while the API is unreachable.
+        self._circuit = CircuitBreaker(API_CIRCUIT_FAILURE_THRESHOLD, API_CIRCUIT_RESET_TIMEOUT)
+        # IPv6 reachability is independent: a missing IPv6 route mustn't fail IPv4 traffic fast.
+        self._ipv6_circuit = CircuitBreaker(API_CIRCUIT_FAILURE_THRESHOLD, API_CIRCUIT_RESET_TIMEOUT)
+        self._latency: dict[str, LatencyWindow] = {}
+        self._rtt: dict[str, RttEstimator] = {}
+        self._stats: dict[str, EndpointStats] = {}
+        self._warmed_up_at = float("-inf")
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the state of the circuit breaker guarding this client."""
+        return self._circuit.state
 
     @staticmethod
     def _is_retryable_http_status(status_code: int) -> bool:
@@ -75,109 +209,364 @@ class PorkbunClient:
         """Return a useful error string even when str(exception) is empty."""
         return str(err) or type(err).__name__
 
-    async def _sleep_before_retry(self, attempt: int) -> None:
+    def _rtt_for(self, endpoint: str) -> RttEstimator:
+        """Return the round-trip estimate for an endpoint, creating it on first use."""
+        name = _endpoint_name(endpoint)
+        if (rtt := self._rtt.get(name)) is None:
+            rtt = self._rtt[name] = RttEstimator(API_REQUEST_TIMEOUT, API_REQUEST_TIMEOUT_MIN, API_REQUEST_TIMEOUT_MAX)
+        return rtt
+
+    def request_timeout(self, endpoint: str) -> float:
+        """Return the timeout for the next request to an endpoint, from its observed latency."""
+        return self._rtt_for(endpoint).timeout
+
+    def retry_delay(self, endpoint: str, attempt: int) -> float:
+        """Return the backoff (before jitter) after a failed attempt, scaled by the endpoint's latency."""
+        if (rto := self._rtt_for(endpoint).rto) is None:
+            base = API_REQUEST_RETRY_BASE
+        else:
+            base = min(max(rto, API_REQUEST_RETRY_BASE_MIN), API_REQUEST_RETRY_BASE_MAX)
+        return float(base * 2 ** (attempt - 1))
+
+    async def _sleep_before_retry(self, endpoint: str, attempt: int) -> None:
         """Sleep with exponential backoff and jitter before retrying."""
-        delay = API_REQUEST_RETRY_BASE * (2 ** (attempt - 1))
-        max_jitter_ms = max(1, int(API_REQUEST_RETRY_JITTER_MAX * 1000))
+        delay = self.retry_delay(endpoint, attempt)
+        max_jitter_ms = max(1, int(delay * API_REQUEST_RETRY_JITTER * 1000))
         delay += secrets.randbelow(max_jitter_ms + 1) / 1000
         await asyncio.sleep(delay)
 
-    async def _request(self, endpoint: str, extra: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a POST request to the Porkbun API."""
-        url = f"{self._api_base}/{endpoint.lstrip('/')}"
+    def _honour_retry_after(self, resp: aiohttp.ClientResponse) -> None:
+        """Pause the shared rate limiter when the server asks clients to slow down."""
+        if resp.status not in (429, 503):
+            return
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"), API_RETRY_AFTER_MAX)
+        if retry_after:
+            LOGGER.debug("Porkbun API asked to retry after %.1fs (HTTP %s)", retry_after, resp.status)
+            self._rate_limiter.pause(retry_after)
+
+    @staticmethod
+    def _record_transport_failure(circuit: CircuitBreaker) -> None:
+        """Count a failed exchange against a circuit breaker."""
+        was_closed = circuit.state is CircuitState.CLOSED
+        if circuit.record_failure():
+            (LOGGER.warning if was_closed else LOGGER.debug)(
+                "Porkbun API is failing; pausing requests for %.0fs before probing again",
+                circuit.retry_in,
+            )
+
+    @staticmethod
+    def _metrics_key(endpoint: str, ipv6: bool) -> str:
+        """Return the endpoint metrics and latency estimates are kept under; IPv6 requests are tracked apart."""
+        return f"{_endpoint_name(endpoint)} (IPv6)" if ipv6 else endpoint
+
+    @staticmethod
+    def _may_retry(budget: RetryBudget | None) -> bool:
+        """Return True if a failed attempt may be retried, spending from the budget if there is one."""
+        if budget is None or budget.try_spend():
+            return True
+        LOGGER.debug("Porkbun API retry budget used up; not retrying")
+        return False
+
+    def hedge_delay(self, endpoint: str) -> float:
+        """Return how long a hedged request waits before sending its backup, from observed p95 latency."""
+        window = self._latency.get(_endpoint_name(endpoint))
+        if window is None or len(window) < API_HEDGE_MIN_SAMPLES or (p95 := window.percentile(95)) is None:
+            return API_HEDGE_DEFAULT_DELAY
+        return min(max(p95, API_HEDGE_MIN_DELAY), API_HEDGE_MAX_DELAY)
+
+    def _stats_for(self, endpoint: str) -> EndpointStats:
+        """Return the metrics bucket for an endpoint, creating it on first use."""
+        name = _endpoint_name(endpoint)
+        if (stats := self._stats.get(name)) is None:
+            stats = self._stats[name] = EndpointStats(
+                API_METRICS_LATENCY_BUCKETS, range(1, API_REQUEST_MAX_ATTEMPTS + 1), API_METRICS_SIZE_BUCKETS
+            )
+        return stats
+
+    @staticmethod
+    def _observe_response(stats: EndpointStats, resp: aiohttp.ClientResponse, started: float) -> None:
+        """Record time to response and, when the server sends Content-Length, the body size."""
+        stats.latency.observe(time.monotonic() - started)
+        if isinstance(size := resp.content_length, int):
+            stats.response_bytes.observe(size)
+
+    def endpoint_stats(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of per-endpoint request metrics for everyone sharing this client."""
+        return {
+            name: {
+                **stats.as_dict(),
+                "timeout_seconds": round(self._rtt_for(name).timeout, 3),
+                "recent_latency_seconds": self._recent_latency(name),
+            }
+            for name, stats in sorted(self._stats.items())
+        }
+
+    def _recent_latency(self, name: str) -> dict[str, float] | None:
+        """Return the median and p95 latency of an endpoint's recent successful requests."""
+        window = self._latency.get(name)
+        if window is None or (p50 := window.percentile(50)) is None or (p95 := window.percentile(95)) is None:
+            return None
+        return {"p50": round(p50, 3), "p95": round(p95, 3)}
+
+    async def _request(
+        self,
+        endpoint: str,
+        extra: dict[str, Any] | None = None,
+        *,
+        hedge: bool = False,
+        budget: RetryBudget | None = None,
+        ipv6: bool = False,
+    ) -> dict[str, Any]:
+        """Make a POST request to the Porkbun API.
+
+        With hedge=True (idempotent endpoints only) a second identical request is sent if the
+        first has not answered within hedge_delay(); the first success wins and the other is
+        cancelled. Retries are drawn from budget when one is given. ipv6=True sends it to the
+        API over the IPv6 session.
+        """
+        if not hedge:
+            return await self._send(endpoint, extra, budget, ipv6=ipv6)
+
+        circuit = self._ipv6_circuit if ipv6 else self._circuit
+        primary = asyncio.create_task(self._send(endpoint, extra, budget, ipv6=ipv6))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay(self._metrics_key(endpoint, ipv6)))
+            # A backup only helps against a slow exchange; with every slot busy it would just queue too.
+            if not done and circuit.state is CircuitState.CLOSED and not self._request_slots.locked():
+                LOGGER.debug("Porkbun API %s slower than usual, sending hedged request", _endpoint_name(endpoint))
+                tasks.append(asyncio.create_task(self._send(endpoint, extra, budget, ipv6=ipv6)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Every attempt failed: surface the original request's error.
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved; a losing request's error is expected
+
+    async def _send(
+        self,
+        endpoint: str,
+        extra: dict[str, Any] | None = None,
+        budget: RetryBudget | None = None,
+        *,
+        ipv6: bool = False,
+    ) -> dict[str, Any]:
+        """Send one POST request, retrying transient failures and recording per-endpoint metrics."""
+        if ipv6:
+            session, api_base, circuit = self._ipv6_session, self._ipv6_api_base, self._ipv6_circuit
+        else:
+            session, api_base, circuit = self._session, self._api_base, self._circuit
+        url = f"{api_base}/{endpoint.lstrip('/')}"
         payload = {"apikey": self._api_key, "secretapikey": self._secret_key}
         if extra:
             payload.update(extra)
 
-        timeout = aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)
-        for attempt in range(1, API_REQUEST_MAX_ATTEMPTS + 1):
-            try:
-                LOGGER.debug("Porkbun API request: POST %s (attempt %d/%d)", url, attempt, API_REQUEST_MAX_ATTEMPTS)
-                async with self._session.post(url, json=payload, timeout=timeout) as resp:
-                    parse_error: Exception | None = None
-                    try:
-                        parsed = await resp.json(content_type=None)
-                    except ValueError as err:
-                        parsed = None
-                        parse_error = err
-
-                    if not isinstance(parsed, dict):
-                        body = (await resp.text()).strip().replace("\n", " ")
-                        snippet = body[:200] if body else "<empty body>"
-                        msg = f"Invalid API response (HTTP {resp.status}): {snippet}"
-                        if attempt < API_REQUEST_MAX_ATTEMPTS and self._is_retryable_http_status(resp.status):
-                            LOGGER.debug(
-                                "Porkbun API transient response error, retrying (%d/%d): %s",
-                                attempt,
-                                API_REQUEST_MAX_ATTEMPTS,
-                                msg,
-                            )
-                            await self._sleep_before_retry(attempt)
-                            continue
-                        raise PorkbunApiError(msg) from parse_error
-
-                    data: dict[str, Any] = parsed
-                    LOGGER.debug("Porkbun API response: %s %s", resp.status, data.get("status"))
-                    status = data.get("status")
-                    if resp.status == 403 or status != "SUCCESS":
-                        msg = data.get("message") or (
-                            "Unknown API error"
-                            if resp.status == 403 or status == "ERROR"
-                            else f"Unexpected status: {status}"
-                        )
-                        if "invalid api key" in msg.lower() or "invalid" in msg.lower():
-                            raise PorkbunAuthError(msg)
-                        if attempt < API_REQUEST_MAX_ATTEMPTS and self._is_retryable_http_status(resp.status):
-                            LOGGER.debug(
-                                "Porkbun API transient status error, retrying (%d/%d): HTTP %s %s",
-                                attempt,
-                                API_REQUEST_MAX_ATTEMPTS,
-                                resp.status,
-                                msg,
+        metrics_key = self._metrics_key(endpoint, ipv6)
+        rtt = self._rtt_for(metrics_key)
+        stats = self._stats_for(metrics_key)
+        sent = 0
+        failure: str | None = None
+        try:
+            if budget is not None:
+                if budget.exhausted:
+                    raise PorkbunRetryBudgetError(
+                        "Porkbun API retry budget for this update used up; deferring to the next update"
+                    )
+                budget.record_attempt()
+            for attempt in range(1, API_REQUEST_MAX_ATTEMPTS + 1):
+                if attempt > 1:
+                    # Back off outside the request slot so waiting retries don't block other callers.
+                    await self._sleep_before_retry(metrics_key, attempt - 1)
+                if not circuit.allow_request():
+                    raise PorkbunCircuitOpenError(
+                        f"Porkbun API{' (IPv6)' if ipv6 else ''} unavailable after repeated failures; "
+                        f"next attempt in {circuit.retry_in:.0f}s"
+                    )
+                probe = circuit.state is CircuitState.HALF_OPEN
+                settled = False
+                try:
+                    await self._rate_limiter.acquire()
+                    LOGGER.debug("Porkbun API request: POST %s (attempt %d/%d)", url, attempt, API_REQUEST_MAX_ATTEMPTS)
+                    async with self._request_slots:
+                        # Time the exchange only; queueing for a slot is local contention, not API latency.
+                        started = time.monotonic()
+                        sent += 1
+                        timeout = aiohttp.ClientTimeout(total=rtt.timeout)
+                        async with session.post(url, json=payload, timeout=timeout) as resp:
+                            self._honour_retry_after(resp)
+                            settled = True
+                            self._observe_response(stats, resp, started)
+                            if resp.status >= 500:
+                                self._record_transport_failure(circuit)
+                            else:
+                                circuit.record_success()
+                            parse_error: Exception | None = None
+                            try:
+                                parsed = await resp.json(content_type=None)
+                            except ValueError as err:
+                                parsed = None
+                                parse_error = err
+
+                            if not isinstance(parsed, dict):
+                                body = (await resp.text()).strip().replace("\n", " ")
+                                snippet = body[:200] if body else "<empty body>"
+                                msg = f"Invalid API response (HTTP {resp.status}): {snippet}"
+                                if (
+                                    attempt < API_REQUEST_MAX_ATTEMPTS
+                                    and self._is_retryable_http_status(resp.status)
+                                    and self._may_retry(budget)
+                                ):
+                                    LOGGER.debug(
+                                        "Porkbun API transient response error, retrying (%d/%d): %s",
+                                        attempt,
+                                        API_REQUEST_MAX_ATTEMPTS,
+                                        msg,
+                                    )
+                                    stats.retry_causes[f"http_{resp.status}"] += 1
+                                    continue
+                                raise PorkbunApiError(msg) from parse_error
+
+                            data: dict[str, Any] = parsed
+                            LOGGER.debug("Porkbun API response: %s %s", resp.status, data.get("status"))
+                            status = data.get("status")
+                            if resp.status == 403 or status != "SUCCESS":
+                                msg = data.get("message") or (
+                                    "Unknown API error"
+                                    if resp.status == 403 or status == "ERROR"
+                                    else f"Unexpected status: {status}"
+                                )
+                                if "invalid api key" in msg.lower() or "invalid" in msg.lower():
+                                    raise PorkbunAuthError(msg)
+                                if (
+                                    attempt < API_REQUEST_MAX_ATTEMPTS
+                                    and self._is_retryable_http_status(resp.status)
+                                    and self._may_retry(budget)
+                                ):
+                                    LOGGER.debug(
+                                        "Porkbun API transient status error, retrying (%d/%d): HTTP %s %s",
+                                        attempt,
+                                        API_REQUEST_MAX_ATTEMPTS,
+                                        resp.status,
+                                        msg,
+                                    )
+                                    stats.retry_causes[f"http_{resp.status}"] += 1
+                                    continue
+                                raise PorkbunApiError(msg)
+
+                            elapsed = time.monotonic() - started
+                            latency = self._latency.setdefault(
+                                _endpoint_name(metrics_key), LatencyWindow(API_LATENCY_WINDOW)
                             )
-                            await self._sleep_before_retry(attempt)
-                            continue
-                        raise PorkbunApiError(msg)
-
-                    return data
-            except PorkbunAuthError:
-                raise
-            except (aiohttp.ClientError, TimeoutError) as err:
-                if attempt >= API_REQUEST_MAX_ATTEMPTS:
+                            latency.add(elapsed)
+                            rtt.add(elapsed)
+                            return data
+                except PorkbunAuthError:
                     raise
-                LOGGER.debug(
-                    "Porkbun API transient connection error, retrying (%d/%d): %s",
-                    attempt,
-                    API_REQUEST_MAX_ATTEMPTS,
-                    self._error_text(err),
-                )
-                await self._sleep_before_retry(attempt)
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    if not settled:
+                        settled = True
+                        self._record_transport_failure(circuit)
+                    if isinstance(err, TimeoutError):
+                        rtt.backoff()
+                    if attempt >= API_REQUEST_MAX_ATTEMPTS or not self._may_retry(budget):
+                        raise
+                    stats.retry_causes[_failure_cause(err)] += 1
+                    LOGGER.debug(
+                        "Porkbun API transient connection error, retrying (%d/%d): %s",
+                        attempt,
+                        API_REQUEST_MAX_ATTEMPTS,
+                        self._error_text(err),
+                    )
+                finally:
+                    if probe and not settled:
+                        circuit.release_probe()
+
+            raise PorkbunApiError("Porkbun API request failed after retries")
+        except BaseException as err:
+            failure = _failure_cause(err)
+            raise
+        finally:
+            stats.observe_call(sent, failure)
+
+    async def warm_up(self) -> None:
+        """Open (or keep alive) a pooled connection to the API host ahead of the next requests.
 
-        raise PorkbunApiError("Porkbun API request failed after retries")
+        Best effort and coalesced: entries sharing this client get one warm-up per window, it
+        waits for the rate limiter and a request slot like any other request, failures are
+        only logged, and nothing is sent unless the circuit is closed.
+        """
+        now = time.monotonic()
+        if self._circuit.state is not CircuitState.CLOSED or now - self._warmed_up_at < API_WARM_UP_WINDOW:
+            return
+        self._warmed_up_at = now
+        try:
+            await self._rate_limiter.acquire()
+            async with (
+                self._request_slots,
+                self._session.head(self._api_base, timeout=aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)),
+            ):
+                pass
+        except (aiohttp.ClientError, TimeoutError) as err:
+            LOGGER.debug("Porkbun API connection warm-up failed: %s", self._error_text(err))
 
-    async def ping(self) -> str:
+    async def ping(self, *, hedge: bool = False, budget: RetryBudget | None = None) -> str:
         """Validate credentials and return the caller's public IPv4 address."""
-        return str((await self._request("ping"))["yourIp"])
+        return str((await self._request("ping", hedge=hedge, budget=budget))["yourIp"])
+
+    async def ping_ipv6(self, *, hedge: bool = False, budget: RetryBudget | None = None) -> str:
+        """Return the caller's public IPv6 address, pinging the API over the IPv6 session."""
+        address = str((await self._request("ping", hedge=hedge, budget=budget, ipv6=True))["yourIp"])
+        try:
+            if ipaddress.ip_address(address).version == 6:
+                return address
+        except ValueError:
+            pass
+        raise PorkbunApiError(f"IPv6 ping answered with a non-IPv6 address: {address}")
 
-    async def get_records(self, domain: str, record_type: str, subdomain: str = "") -> list[DnsRecord]:
+    async def get_records(
+        self,
+        domain: str,
+        record_type: str,
+        subdomain: str = "",
+        *,
+        hedge: bool = False,
+        budget: RetryBudget | None = None,
+    ) -> list[DnsRecord]:
         """Retrieve DNS records by domain, type, and optional subdomain."""
         endpoint = f"dns/retrieveByNameType/{domain}/{record_type}{f'/{subdomain}' if subdomain else ''}"
         try:
-            data = await self._request(endpoint)
+            data = await self._request(endpoint, hedge=hedge, budget=budget)
         except PorkbunApiError as err:
-            if "no records" in str(err).lower() or "could not find" in str(err).lower():
+            if _is_missing_records_error(err):
                 return []
             raise
-        return [
-            DnsRecord(
-                id=r["id"],
-                name=r["name"],
-                record_type=r["type"],
-                content=r["content"],
-                ttl=r["ttl"],
-            )
-            for r in data.get("records", [])
-        ]
+        return [_parse_record(r) for r in data.get("records", [])]
+
+    async def get_all_records(
+        self, domain: str, *, hedge: bool = False, budget: RetryBudget | None = None
+    ) -> list[DnsRecord]:
+        """Retrieve every DNS record in the domain's zone with a single request."""
+        try:
+            data = await self._request(f"dns/retrieve/{domain}", hedge=hedge, budget=budget)
+        except PorkbunApiError as err:
+            if _is_missing_records_error(err):
+                return []
+            raise
+        return [_parse_record(r) for r in data.get("records", [])]
+
+    async def get_record_index(
+        self, domain: str, *, hedge: bool = False, budget: RetryBudget | None = None
+    ) -> RecordIndex:
+        """Retrieve the whole zone and index it by (name, type)."""
+        return index_records(await self.get_all_records(domain, hedge=hedge, budget=budget))
 
     async def create_record(
         self,
@@ -186,6 +575,8 @@ class PorkbunClient:
         content: str,
         subdomain: str = "",
         ttl: int = 600,
+        *,
+        budget: RetryBudget | None = None,
     ) -> str:
         """Create a DNS record. Returns the record ID."""
         extra: dict[str, Any] = {
@@ -195,7 +586,7 @@ class PorkbunClient:
         }
         if subdomain:
             extra["name"] = subdomain
-        data = await self._request(f"dns/create/{domain}", extra)
+        data = await self._request(f"dns/create/{domain}", extra, budget=budget)
         return str(data.get("id", ""))
 
     async def edit_record_by_name_type(
@@ -205,22 +596,30 @@ class PorkbunClient:
         content: str,
         subdomain: str = "",
         ttl: int = 600,
+        *,
+        budget: RetryBudget | None = None,
     ) -> None:
         """Edit DNS records matching domain, type, and optional subdomain."""
         endpoint = f"dns/editByNameType/{domain}/{record_type}{f'/{subdomain}' if subdomain else ''}"
         extra: dict[str, Any] = {"content": content, "ttl": str(ttl)}
-        await self._request(endpoint, extra)
+        await self._request(endpoint, extra, budget=budget)
+
+    async def iter_domains(self) -> AsyncGenerator[DomainInfo]:
+        """Yield every domain on the account, fetching domain/listAll one page at a time."""
+        start = 0
+        while True:
+            data = await self._request("domain/listAll", {"start": str(start)})
+            page = data.get("domains") or []
+            for d in page:
+                yield _parse_domain(d)
+            if len(page) < DOMAIN_LIST_PAGE_SIZE:
+                return
+            start += len(page)
 
     async def get_domain_info(self, domain: str) -> DomainInfo | None:
-        """Get domain registration info via domain/listAll."""
-        data = await self._request("domain/listAll")
-        for d in data.get("domains", []):
-            if d.get("domain") == domain:
-                return DomainInfo(
-                    domain=d["domain"],
-                    status=d.get("status", "UNKNOWN"),
-                    expire_date=d.get("expireDate", ""),
-                    whois_privacy=d.get("whoisPrivacy", "0") == "1",
-                    auto_renew=d.get("autoRenew", "0") == "1",
-                )
+        """Get domain registration info, stopping at the first listAll page that has it."""
+        async with aclosing(self.iter_domains()) as domains:
+            async for info in domains:
+                if info.domain == domain:
+                    return info
         return None
@@ -51,6 +51,7 @@ class DdnsHealthSensor(_DdnsBinarySensorBase):
         attrs: dict[str, str | list[str]] = {
             "summary": f"{ok}/{total} OK",
             "managed_subdomains": managed_subdomains,
+            "api_circuit": coord.api_circuit_state,
         }
 
         if coord.data.records:
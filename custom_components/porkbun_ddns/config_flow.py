@@ -11,6 +11,8 @@ from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResu
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -21,21 +23,35 @@ from homeassistant.helpers.selector import (
 
 from .api import PorkbunAuthError, PorkbunClient
 from .const import (
+    API_MAX_CONCURRENT_REQUESTS,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
     CONF_DOMAIN,
+    CONF_DOMAIN_INFO_INTERVAL,
     CONF_FAILURE_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
+    CONF_IP_SOURCE_ENTITY,
     CONF_IPV4,
     CONF_IPV6,
     CONF_MANAGE_ROOT,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_SECRET_KEY,
     CONF_STARTUP_DELAY,
     CONF_SUBDOMAINS,
     CONF_UPDATE_INTERVAL,
+    CONF_WARM_UP_CONNECTION,
     DATA_FORCE_IMMEDIATE_REFRESH,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DOMAIN_INFO_INTERVAL,
     DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_HEDGE_REQUESTS,
     DEFAULT_MANAGE_ROOT,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_STARTUP_DELAY,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_WARM_UP_CONNECTION,
     DOMAIN,
     LOGGER,
 )
@@ -66,6 +82,11 @@ STEP_USER_SCHEMA = vol.Schema(
 UPDATE_INTERVAL_SELECTOR = NumberSelector(NumberSelectorConfig(min=60, step=60, mode=NumberSelectorMode.BOX))
 STARTUP_DELAY_SELECTOR = NumberSelector(NumberSelectorConfig(min=0, step=60, mode=NumberSelectorMode.BOX))
 FAILURE_THRESHOLD_SELECTOR = NumberSelector(NumberSelectorConfig(min=1, max=10, step=1, mode=NumberSelectorMode.BOX))
+MAX_CONCURRENT_UPDATES_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=1, max=API_MAX_CONCURRENT_REQUESTS, step=1, mode=NumberSelectorMode.BOX)
+)
+DOMAIN_INFO_INTERVAL_SELECTOR = NumberSelector(NumberSelectorConfig(min=3600, step=3600, mode=NumberSelectorMode.BOX))
+IP_SOURCE_ENTITY_SELECTOR = EntitySelector(EntitySelectorConfig(domain=["sensor", "input_text"]))
 
 
 def _domain_schema(
@@ -110,8 +131,20 @@ def _options_from_input(user_input: dict[str, Any], *, include_interval: bool =
     }
     if include_interval:
         options[CONF_UPDATE_INTERVAL] = int(user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        options[CONF_ADAPTIVE_POLLING] = bool(user_input.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING))
+        options[CONF_MAX_UPDATE_INTERVAL] = int(user_input.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL))
         options[CONF_STARTUP_DELAY] = int(user_input.get(CONF_STARTUP_DELAY, DEFAULT_STARTUP_DELAY))
         options[CONF_FAILURE_THRESHOLD] = int(user_input.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD))
+        options[CONF_MAX_CONCURRENT_UPDATES] = int(
+            user_input.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES)
+        )
+        options[CONF_DOMAIN_INFO_INTERVAL] = int(
+            user_input.get(CONF_DOMAIN_INFO_INTERVAL, DEFAULT_DOMAIN_INFO_INTERVAL)
+        )
+        options[CONF_HEDGE_REQUESTS] = bool(user_input.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS))
+        options[CONF_WARM_UP_CONNECTION] = bool(user_input.get(CONF_WARM_UP_CONNECTION, DEFAULT_WARM_UP_CONNECTION))
+        if ip_source_entity := user_input.get(CONF_IP_SOURCE_ENTITY):
+            options[CONF_IP_SOURCE_ENTITY] = str(ip_source_entity)
     return options
 
 
@@ -314,8 +347,17 @@ class PorkbunDdnsOptionsFlow(OptionsFlowWithReload):
         if user_input is not None:
             defaults = {
                 CONF_UPDATE_INTERVAL: user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                CONF_ADAPTIVE_POLLING: bool(user_input.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)),
+                CONF_MAX_UPDATE_INTERVAL: user_input.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
                 CONF_STARTUP_DELAY: user_input.get(CONF_STARTUP_DELAY, DEFAULT_STARTUP_DELAY),
                 CONF_FAILURE_THRESHOLD: user_input.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+                CONF_MAX_CONCURRENT_UPDATES: user_input.get(
+                    CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES
+                ),
+                CONF_DOMAIN_INFO_INTERVAL: user_input.get(CONF_DOMAIN_INFO_INTERVAL, DEFAULT_DOMAIN_INFO_INTERVAL),
+                CONF_HEDGE_REQUESTS: bool(user_input.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)),
+                CONF_WARM_UP_CONNECTION: bool(user_input.get(CONF_WARM_UP_CONNECTION, DEFAULT_WARM_UP_CONNECTION)),
+                CONF_IP_SOURCE_ENTITY: user_input.get(CONF_IP_SOURCE_ENTITY),
                 CONF_SUBDOMAINS: user_input.get(CONF_SUBDOMAINS, ""),
                 CONF_MANAGE_ROOT: bool(user_input.get(CONF_MANAGE_ROOT, DEFAULT_MANAGE_ROOT)),
                 CONF_IPV4: bool(user_input.get(CONF_IPV4, True)),
@@ -325,8 +367,15 @@ class PorkbunDdnsOptionsFlow(OptionsFlowWithReload):
             current = self.config_entry.options
             defaults = {
                 CONF_UPDATE_INTERVAL: current.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                CONF_ADAPTIVE_POLLING: bool(current.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)),
+                CONF_MAX_UPDATE_INTERVAL: current.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
                 CONF_STARTUP_DELAY: current.get(CONF_STARTUP_DELAY, DEFAULT_STARTUP_DELAY),
                 CONF_FAILURE_THRESHOLD: current.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+                CONF_MAX_CONCURRENT_UPDATES: current.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES),
+                CONF_DOMAIN_INFO_INTERVAL: current.get(CONF_DOMAIN_INFO_INTERVAL, DEFAULT_DOMAIN_INFO_INTERVAL),
+                CONF_HEDGE_REQUESTS: bool(current.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)),
+                CONF_WARM_UP_CONNECTION: bool(current.get(CONF_WARM_UP_CONNECTION, DEFAULT_WARM_UP_CONNECTION)),
+                CONF_IP_SOURCE_ENTITY: current.get(CONF_IP_SOURCE_ENTITY),
                 CONF_SUBDOMAINS: ", ".join(current.get(CONF_SUBDOMAINS, [])),
                 CONF_MANAGE_ROOT: bool(current.get(CONF_MANAGE_ROOT, DEFAULT_MANAGE_ROOT)),
                 CONF_IPV4: bool(current.get(CONF_IPV4, True)),
@@ -341,10 +390,26 @@ class PorkbunDdnsOptionsFlow(OptionsFlowWithReload):
                     vol.Optional(
                         CONF_UPDATE_INTERVAL, default=defaults[CONF_UPDATE_INTERVAL]
                     ): UPDATE_INTERVAL_SELECTOR,
+                    vol.Optional(CONF_ADAPTIVE_POLLING, default=defaults[CONF_ADAPTIVE_POLLING]): bool,
+                    vol.Optional(
+                        CONF_MAX_UPDATE_INTERVAL, default=defaults[CONF_MAX_UPDATE_INTERVAL]
+                    ): UPDATE_INTERVAL_SELECTOR,
                     vol.Optional(CONF_STARTUP_DELAY, default=defaults[CONF_STARTUP_DELAY]): STARTUP_DELAY_SELECTOR,
                     vol.Optional(
                         CONF_FAILURE_THRESHOLD, default=defaults[CONF_FAILURE_THRESHOLD]
                     ): FAILURE_THRESHOLD_SELECTOR,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_UPDATES, default=defaults[CONF_MAX_CONCURRENT_UPDATES]
+                    ): MAX_CONCURRENT_UPDATES_SELECTOR,
+                    vol.Optional(
+                        CONF_DOMAIN_INFO_INTERVAL, default=defaults[CONF_DOMAIN_INFO_INTERVAL]
+                    ): DOMAIN_INFO_INTERVAL_SELECTOR,
+                    vol.Optional(CONF_HEDGE_REQUESTS, default=defaults[CONF_HEDGE_REQUESTS]): bool,
+                    vol.Optional(CONF_WARM_UP_CONNECTION, default=defaults[CONF_WARM_UP_CONNECTION]): bool,
+                    # No default, so the entity can be cleared again.
+                    vol.Optional(
+                        CONF_IP_SOURCE_ENTITY, description={"suggested_value": defaults[CONF_IP_SOURCE_ENTITY]}
+                    ): IP_SOURCE_ENTITY_SELECTOR,
                     vol.Optional(CONF_SUBDOMAINS, default=defaults[CONF_SUBDOMAINS]): str,
                     vol.Optional(CONF_MANAGE_ROOT, default=defaults[CONF_MANAGE_ROOT]): bool,
                     vol.Optional(CONF_IPV4, default=defaults[CONF_IPV4]): bool,
@@ -8,9 +8,21 @@ DOMAIN = "porkbun_ddns"
 
 # hass.data[DOMAIN] key: set of entry_ids whose next coordinator init skips startup delay.
 DATA_FORCE_IMMEDIATE_REFRESH = "force_immediate_refresh"
+# hass.data[DOMAIN] key: shared PorkbunClient instances keyed by account credentials.
+DATA_CLIENTS = "clients"
+# hass.data[DOMAIN] key: PublicIpCache shared by all entries.
+DATA_IP_CACHE = "ip_cache"
+# hass.data[DOMAIN] key: RecordWriteQueue shared by all entries.
+DATA_WRITE_QUEUE = "write_queue"
+
+# Per-entry reconciled record state, so a restart doesn't re-read the whole zone.
+STORAGE_KEY = f"{DOMAIN}.state"
+STORAGE_VERSION = 1
 
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes
+DEFAULT_MAX_UPDATE_INTERVAL = 3600  # ceiling for adaptive polling: 1 hour
 DEFAULT_STARTUP_DELAY = 300  # 5 minutes
+DEFAULT_DOMAIN_INFO_INTERVAL = 86400  # registration details change rarely; refresh daily
 DEFAULT_TTL = 600  # Porkbun minimum
 
 CONF_API_KEY = "api_key"
@@ -21,15 +33,54 @@ CONF_MANAGE_ROOT = "manage_root"
 CONF_IPV4 = "ipv4"
 CONF_IPV6 = "ipv6"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
 CONF_STARTUP_DELAY = "startup_delay"
 CONF_FAILURE_THRESHOLD = "failure_threshold"
+CONF_MAX_CONCURRENT_UPDATES = "max_concurrent_updates"
+CONF_DOMAIN_INFO_INTERVAL = "domain_info_interval"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_WARM_UP_CONNECTION = "warm_up_connection"
+CONF_IP_SOURCE_ENTITY = "ip_source_entity"
 
 DEFAULT_MANAGE_ROOT = True
 
 PORKBUN_API_BASE = "https://api-ipv4.porkbun.com/api/json/v3"
-IPV6_DETECT_URL = "https://api6.ipify.org"
-API_REQUEST_TIMEOUT = 15  # seconds per API call
+PORKBUN_API_BASE_IPV6 = "https://api.porkbun.com/api/json/v3"  # dual-stack host, reached over IPv6 to detect AAAA
+IP_DETECT_CACHE_FRACTION = 0.5  # share of its update interval an entry reuses another entry's detected IP for
+API_REQUEST_TIMEOUT = 15  # seconds per API call until the endpoint's latency has been observed
+API_REQUEST_TIMEOUT_MIN = 5.0  # bounds for the latency-derived timeout (seconds)
+API_REQUEST_TIMEOUT_MAX = 30.0
 API_REQUEST_MAX_ATTEMPTS = 3  # initial request + retries for transient errors
-API_REQUEST_RETRY_BASE = 1.0  # exponential backoff base (seconds)
-API_REQUEST_RETRY_JITTER_MAX = 0.25  # random jitter upper bound (seconds)
+API_REQUEST_RETRY_BASE = 1.0  # exponential backoff base until the endpoint's latency has been observed (seconds)
+API_REQUEST_RETRY_BASE_MIN = 0.5  # bounds for the latency-derived backoff base (seconds)
+API_REQUEST_RETRY_BASE_MAX = 5.0
+API_REQUEST_RETRY_JITTER = 0.25  # random jitter upper bound, as a fraction of the retry delay
+DOMAIN_LIST_PAGE_SIZE = 1000  # domains per domain/listAll page (advance "start" by this)
+API_MAX_CONCURRENT_REQUESTS = 4  # in-flight requests per account, shared by all entries
+API_RATE_LIMIT = 2.0  # sustained requests per second per account, shared by all entries
+API_RATE_BURST = 10  # requests an idle account may send back to back
+API_RETRY_AFTER_MAX = 60.0  # cap on how long a Retry-After hint may pause an account (seconds)
+API_DNS_CACHE_TTL = 300  # seconds the dedicated connector caches api-ipv4.porkbun.com lookups
+API_KEEPALIVE_MARGIN = 30  # idle connections outlive the update interval by this much (seconds)
+API_WARM_UP_LEAD = 10  # seconds before a scheduled update to open a connection to the API host
+API_WARM_UP_WINDOW = 30  # seconds in which entries sharing a client reuse one warm-up
+API_LATENCY_WINDOW = 100  # recent successful requests per endpoint used for latency percentiles
+API_METRICS_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0)  # seconds, per-endpoint histograms
+API_METRICS_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144)  # response bytes, per-endpoint histograms
+API_HEDGE_MIN_SAMPLES = 10  # samples needed before the hedge delay tracks observed latency
+API_HEDGE_DEFAULT_DELAY = 2.0  # hedge delay until enough samples exist (seconds)
+API_HEDGE_MIN_DELAY = 0.25  # bounds for the p95-based hedge delay (seconds)
+API_HEDGE_MAX_DELAY = 5.0
+API_CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive transport failures before requests fail fast
+API_CIRCUIT_RESET_TIMEOUT = 60.0  # seconds an open circuit waits before letting one probe through
+API_RETRY_BUDGET_RATIO = 0.2  # retries an update cycle may spend per request it sends
+API_RETRY_BUDGET_MIN = 2  # retries every update cycle may spend, so a lone request can still retry
+CYCLE_TRACE_HISTORY = 20  # recent update-cycle timing traces kept per entry for diagnostics
 DEFAULT_FAILURE_THRESHOLD = 3  # escalate repeated failures from warning to error
+DEFAULT_MAX_CONCURRENT_UPDATES = 4  # records reconciled in parallel per domain
+DEFAULT_ADAPTIVE_POLLING = False  # poll at a fixed update_interval
+DEFAULT_HEDGE_REQUESTS = False  # send a second read when the first is slower than usual
+DEFAULT_WARM_UP_CONNECTION = False  # open the API connection just before each update
+ADAPTIVE_INTERVAL_STABILITY_FRACTION = 0.1  # adaptive polling waits this share of how long the IP has held
+IP_SOURCE_SAFETY_INTERVAL = 3600  # polling floor while a WAN IP entity triggers updates (seconds)
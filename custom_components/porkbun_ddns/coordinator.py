@@ -2,42 +2,80 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
+import asyncio
+import hashlib
+import ipaddress
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from functools import cached_property
+from functools import cached_property, partial
+from typing import Any
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import issue_registry as ir
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import DomainInfo, PorkbunApiError, PorkbunAuthError, PorkbunClient
+from .api import (
+    DomainInfo,
+    PorkbunApiError,
+    PorkbunAuthError,
+    PorkbunCircuitOpenError,
+    PorkbunRetryBudgetError,
+    RecordIndex,
+)
 from .const import (
+    ADAPTIVE_INTERVAL_STABILITY_FRACTION,
+    API_KEEPALIVE_MARGIN,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_RETRY_BUDGET_MIN,
+    API_RETRY_BUDGET_RATIO,
+    API_WARM_UP_LEAD,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
     CONF_DOMAIN,
+    CONF_DOMAIN_INFO_INTERVAL,
     CONF_FAILURE_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
+    CONF_IP_SOURCE_ENTITY,
     CONF_IPV4,
     CONF_IPV6,
     CONF_MANAGE_ROOT,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_SECRET_KEY,
     CONF_STARTUP_DELAY,
     CONF_SUBDOMAINS,
     CONF_UPDATE_INTERVAL,
+    CONF_WARM_UP_CONNECTION,
+    CYCLE_TRACE_HISTORY,
     DATA_FORCE_IMMEDIATE_REFRESH,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DOMAIN_INFO_INTERVAL,
     DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_HEDGE_REQUESTS,
     DEFAULT_MANAGE_ROOT,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_STARTUP_DELAY,
-    DEFAULT_TTL,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_WARM_UP_CONNECTION,
     DOMAIN,
-    IPV6_DETECT_URL,
+    IP_DETECT_CACHE_FRACTION,
+    IP_SOURCE_SAFETY_INTERVAL,
     LOGGER,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
+from .metrics import Span
+from .resilience import RetryBudget
+from .shared import async_acquire_client, async_get_ip_cache, async_get_write_queue
 
 
 def _error_text(err: Exception) -> str:
@@ -53,6 +91,7 @@ class RecordState:
     ok: bool = True
     error: str | None = None
     consecutive_failures: int = 0
+    record_id: str | None = None
 
 
 @dataclass
@@ -71,6 +110,41 @@ def _record_key(subdomain: str, record_type: str) -> str:
     return f"{subdomain or '@'}_{record_type}"
 
 
+def _state_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's reconciled record state."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+
+
+async def async_remove_stored_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted state of a removed config entry."""
+    await _state_store(hass, entry_id).async_remove()
+
+
+class _BufferedLog:
+    """Collect log calls from a concurrent task so they can be replayed in a fixed order."""
+
+    def __init__(self) -> None:
+        self._lines: list[tuple[str, str, tuple[object, ...]]] = []
+
+    def debug(self, msg: str, *args: object) -> None:
+        self._lines.append(("debug", msg, args))
+
+    def info(self, msg: str, *args: object) -> None:
+        self._lines.append(("info", msg, args))
+
+    def warning(self, msg: str, *args: object) -> None:
+        self._lines.append(("warning", msg, args))
+
+    def error(self, msg: str, *args: object) -> None:
+        self._lines.append(("error", msg, args))
+
+    def flush(self) -> None:
+        """Emit buffered lines through the integration logger."""
+        for level, msg, args in self._lines:
+            getattr(LOGGER, level)(msg, *args)
+        self._lines.clear()
+
+
 class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
     """Coordinator that manages DDNS updates for a single domain."""
 
@@ -81,6 +155,17 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
         self._domain = str(config_entry.data[CONF_DOMAIN])
 
         interval = int(config_entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        self._ip_source_entity: str | None = config_entry.options.get(CONF_IP_SOURCE_ENTITY) or None
+        if self._ip_source_entity is not None:
+            # The entity triggers updates as the IP changes; polling is only a safety net.
+            interval = max(interval, IP_SOURCE_SAFETY_INTERVAL)
+        # update_interval is the floor for adaptive polling; with it off, the ceiling is the floor.
+        self._min_interval = self._max_interval = timedelta(seconds=interval)
+        if config_entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            max_interval = int(config_entry.options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL))
+            self._max_interval = timedelta(seconds=max(interval, max_interval))
+        self._ip_stable_since: datetime | None = None
+        self._cycle_finished_at: datetime | None = None
         self._startup_delay = max(0, int(config_entry.options.get(CONF_STARTUP_DELAY, DEFAULT_STARTUP_DELAY)))
         # One-shot bypass set by config/options/reauth flows after a successful ping.
         force_refresh: set[str] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_FORCE_IMMEDIATE_REFRESH, set())
@@ -89,9 +174,27 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
             self._startup_delay_until = datetime.now(tz=UTC)
         else:
             self._startup_delay_until = datetime.now(tz=UTC) + timedelta(seconds=self._startup_delay)
+        # Entries start together when Home Assistant boots or reloads them, which is when the
+        # startup delay applies. Stretching the wait after the first update by a share of the
+        # interval fixed by the entry ID moves each to its own point in the interval; the
+        # coordinator schedules every update from the end of the last, so it stays there.
+        self._phase_offset = timedelta(0)
+        if self._startup_delay_until > datetime.now(tz=UTC):
+            digest = hashlib.sha256(config_entry.entry_id.encode()).digest()
+            self._phase_offset = timedelta(seconds=int(int.from_bytes(digest[:8]) / 2**64 * interval))
         self._failure_threshold = max(
             1, int(config_entry.options.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD))
         )
+        # More parallel records than the account's request slots would only queue on the client.
+        self._max_concurrent_updates = min(
+            API_MAX_CONCURRENT_REQUESTS,
+            max(1, int(config_entry.options.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES))),
+        )
+        self._hedge_requests = bool(config_entry.options.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS))
+        domain_info_interval = int(config_entry.options.get(CONF_DOMAIN_INFO_INTERVAL, DEFAULT_DOMAIN_INFO_INTERVAL))
+        self._domain_info_interval = timedelta(seconds=max(interval, domain_info_interval))
+        self._domain_info_refreshed_at: datetime | None = None
+        self._domain_info_task: asyncio.Task[None] | None = None
 
         super().__init__(
             hass,
@@ -106,11 +209,26 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
         self._consecutive_update_failures = 0
         self._last_ipv4: str | None = None
         self._last_ipv6: str | None = None
-        self._client = PorkbunClient(
-            async_get_clientsession(hass),
-            str(config_entry.data[CONF_API_KEY]),
+        self._api_key = str(config_entry.data[CONF_API_KEY])
+        self._client = async_acquire_client(
+            hass,
+            config_entry.entry_id,
+            self._api_key,
             str(config_entry.data[CONF_SECRET_KEY]),
+            keepalive_timeout=interval + API_KEEPALIVE_MARGIN,
         )
+        self._ip_cache = async_get_ip_cache(hass)
+        self._ip_cache_max_age = interval * IP_DETECT_CACHE_FRACTION
+        self._fresh_ip_requested = False
+        self._ipv4_seen_at = float("-inf")
+        self._ipv6_seen_at = float("-inf")
+        self._write_queue = async_get_write_queue(hass)
+        self._store = _state_store(hass, config_entry.entry_id)
+        self._stored_state: dict[str, Any] | None = None
+        self._warm_up = bool(config_entry.options.get(CONF_WARM_UP_CONNECTION, DEFAULT_WARM_UP_CONNECTION))
+        self._cancel_warm_up: Callable[[], None] | None = None
+        config_entry.async_on_unload(self._async_cancel_warm_up)
+        self._traces: deque[Span] = deque(maxlen=CYCLE_TRACE_HISTORY)
 
     @property
     def domain(self) -> str:
@@ -177,6 +295,62 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
         """Return True if all records updated successfully."""
         return self.record_count > 0 and self.ok_count == self.record_count
 
+    @property
+    def ip_source_entity(self) -> str | None:
+        """Return the entity whose state changes trigger an update, if one is configured."""
+        return self._ip_source_entity
+
+    @property
+    def warm_up_enabled(self) -> bool:
+        """Return whether the API connection is warmed up ahead of updates."""
+        return self._warm_up
+
+    @property
+    def api_circuit_state(self) -> str:
+        """Return the state of the circuit breaker guarding this account's API client."""
+        return str(self._client.circuit_state)
+
+    @property
+    def api_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-endpoint request metrics for this account's API client."""
+        return self._client.endpoint_stats()
+
+    @property
+    def cycle_traces(self) -> list[dict[str, Any]]:
+        """Return timing traces of the most recent update cycles, oldest first."""
+        return [trace.as_dict() for trace in self._traces]
+
+    @property
+    def next_update(self) -> datetime | None:
+        """Return when the next update is due, to the second, or None if polling is off."""
+        if self._cycle_finished_at is None or self.update_interval is None or self.config_entry.pref_disable_polling:
+            return None
+        # The coordinator schedules each update an interval after the last one finished.
+        next_update = self._cycle_finished_at + self.update_interval
+        if self.data.last_updated is None and self._startup_delay_until > datetime.now(tz=UTC):
+            # The deferred first update runs on its own timer, usually ahead of the regular one.
+            next_update = min(next_update, self._startup_delay_until)
+        return next_update.replace(microsecond=0)
+
+    @callback
+    def _async_adapt_update_interval(self, *, failed: bool) -> None:
+        """Poll less often the longer the public IP has held, and at the floor after a change or failure.
+
+        Waiting a fixed share of the stable time bounds how late a change is noticed relative
+        to how long the address had lasted, e.g. 6 minutes after an hour, 1 hour after 10.
+        The first update after a startup delay also waits out the entry's phase offset once.
+        """
+        interval = self._min_interval
+        if not failed and self._ip_stable_since is not None and self._max_interval > self._min_interval:
+            stable_for = datetime.now(tz=UTC) - self._ip_stable_since
+            interval = min(self._max_interval, max(interval, stable_for * ADAPTIVE_INTERVAL_STABILITY_FRACTION))
+            interval = timedelta(seconds=int(interval.total_seconds()))
+        interval += self._phase_offset
+        self._phase_offset = timedelta(0)
+        if interval != self.update_interval:
+            LOGGER.debug("Next update for %s in %ss", self._domain, int(interval.total_seconds()))
+            self.update_interval = interval
+
     @property
     def startup_delay_remaining(self) -> float:
         """Return seconds until the first update should run."""
@@ -189,15 +363,131 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
         """Return when the first update may run."""
         return self._startup_delay_until
 
+    @callback
+    def _async_schedule_warm_up(self) -> None:
+        """Warm the API connection shortly before the next scheduled update, if enabled.
+
+        Called as a cycle finishes: the coordinator schedules the next update right after, so
+        interval - lead from now lands about the lead ahead of it without touching its timer.
+        """
+        self._async_cancel_warm_up()
+        if not self._warm_up or self.update_interval is None or self.config_entry.pref_disable_polling:
+            return
+        delay = self.update_interval.total_seconds() - API_WARM_UP_LEAD
+        if delay > 0:
+            self._cancel_warm_up = async_call_later(self.hass, delay, self._async_scheduled_warm_up)
+
+    @callback
+    def _async_cancel_warm_up(self) -> None:
+        if self._cancel_warm_up is not None:
+            self._cancel_warm_up()
+            self._cancel_warm_up = None
+
+    @callback
+    def _async_scheduled_warm_up(self, _now: datetime) -> None:
+        self._cancel_warm_up = None
+        self.async_warm_up_connection()
+
+    @callback
+    def async_warm_up_connection(self) -> None:
+        """Open a connection to the API host in the background so the next update skips the handshake."""
+        if not self._warm_up:
+            return
+        self.config_entry.async_create_background_task(
+            self.hass, self._client.warm_up(), f"porkbun_ddns connection warm-up {self._domain}"
+        )
+
+    @callback
+    def async_handle_ip_source_change(self, event: Event[EventStateChangedData]) -> None:
+        """Request an update when the source entity reports a public IP that isn't published yet.
+
+        The request is debounced by the coordinator, so a flapping entity runs one update
+        straight away and at most one more per cooldown. The update still detects the IP
+        with Porkbun's ping; the entity only decides when to look.
+        """
+        if (new_state := event.data["new_state"]) is None:
+            return
+        try:
+            address = ipaddress.ip_address(new_state.state)
+        except ValueError:
+            return  # unknown, unavailable, or not an address
+        if not (self.ipv4_enabled if address.version == 4 else self.ipv6_enabled):
+            return
+        if str(address) in (self.data.public_ipv4, self.data.public_ipv6):
+            return
+        LOGGER.debug("%s reports public IP %s; updating %s", new_state.entity_id, address, self._domain)
+        self.config_entry.async_create_task(
+            self.hass, self.async_request_refresh(), f"porkbun_ddns ip source refresh {self._domain}"
+        )
+
+    async def async_request_refresh(self) -> None:
+        """Request a debounced refresh that detects the public IP afresh.
+
+        Used by the Refresh button and the IP source entity, which both expect the update to
+        look for themselves rather than reuse another entry's recent lookup.
+        """
+        self._fresh_ip_requested = True
+        await super().async_request_refresh()
+
+    async def _async_setup(self) -> None:
+        """Restore record state saved by a previous run so an unchanged IP skips the zone fetch."""
+        stored = await self._store.async_load()
+        if not stored or stored.get("domain") != self._domain:
+            return
+        self._stored_state = stored
+        if self.ipv4_enabled and isinstance(last_ipv4 := stored.get("last_ipv4"), str):
+            self._last_ipv4 = last_ipv4
+        if self.ipv6_enabled and isinstance(last_ipv6 := stored.get("last_ipv6"), str):
+            self._last_ipv6 = last_ipv6
+
+        # Only restore records that are still managed; anything else is re-read on the first cycle.
+        records = stored.get("records") or {}
+        record_types = [rt for rt, enabled in (("A", self.ipv4_enabled), ("AAAA", self.ipv6_enabled)) if enabled]
+        for subdomain in self._record_targets:
+            for record_type in record_types:
+                key = _record_key(subdomain, record_type)
+                saved = records.get(key)
+                if not isinstance(saved, dict) or not isinstance(current_ip := saved.get("current_ip"), str):
+                    continue
+                record_id = saved.get("record_id")
+                self.data.records[key] = RecordState(
+                    current_ip=current_ip,
+                    record_id=record_id if isinstance(record_id, str) else None,
+                )
+        LOGGER.debug("Restored %d record state(s) for %s", len(self.data.records), self._domain)
+
+    async def _async_save_state(self) -> None:
+        """Persist reconciled records and the public IPs they were reconciled against."""
+        snapshot: dict[str, Any] = {
+            "domain": self._domain,
+            "last_ipv4": self._last_ipv4,
+            "last_ipv6": self._last_ipv6,
+            "records": {
+                key: {"record_id": state.record_id, "current_ip": state.current_ip}
+                for key, state in self.data.records.items()
+                if state.ok and state.current_ip is not None
+            },
+        }
+        if snapshot != self._stored_state:
+            await self._store.async_save(snapshot)
+            self._stored_state = snapshot
+
     async def _async_update_data(self) -> DdnsData:
         """Fetch current IP and update DNS records if needed."""
         data = self.data
         issue_id = f"api_access_{self._domain}"
+        now = datetime.now(tz=UTC)
+        # Kept while running, so diagnostics taken mid-cycle show how far a slow cycle got.
+        cycle = Span("cycle", started_at=now.isoformat())
+        self._traces.append(cycle)
+        # Shared by every request this cycle, so a degraded API can't multiply them with retries.
+        budget = RetryBudget(API_RETRY_BUDGET_RATIO, API_RETRY_BUDGET_MIN)
         try:
             # Optional startup delay (default 5 minutes) to avoid transient network/DNS issues
             # immediately after Home Assistant starts or the config entry reloads.
-            now = datetime.now(tz=UTC)
-            if data.last_updated is None and now < self._startup_delay_until:
+            with cycle.child("startup_delay") as span:
+                deferred = span.attrs["deferred"] = data.last_updated is None and now < self._startup_delay_until
+            if deferred:
                 if not self._startup_delay_logged:
                     remaining = int((self._startup_delay_until - now).total_seconds())
                     LOGGER.debug(
@@ -208,14 +498,20 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
                     self._startup_delay_logged = True
                 return data
 
-            # Get current public IPs
-            if self.ipv4_enabled:
-                data.public_ipv4 = await self._client.ping()
-                LOGGER.debug("Current public IPv4: %s", data.public_ipv4)
-
-            if self.ipv6_enabled:
-                data.public_ipv6 = await self._get_ipv6(async_get_clientsession(self.hass))
-                LOGGER.debug("Current public IPv6: %s", data.public_ipv6)
+            # Get current public IPs, reusing another entry's recent lookup on the same account
+            # unless this refresh was asked for by the user or the IP source entity.
+            max_age = 0.0 if self._fresh_ip_requested else self._ip_cache_max_age
+            self._fresh_ip_requested = False
+            # A and AAAA detection are independent requests, so they run side by side. A single
+            # lookup is awaited inline rather than through gather, which would wrap it in a task.
+            if self.ipv4_enabled and self.ipv6_enabled:
+                await asyncio.gather(
+                    self._async_detect_ipv4(cycle, budget, max_age), self._async_detect_ipv6(cycle, budget, max_age)
+                )
+            elif self.ipv4_enabled:
+                await self._async_detect_ipv4(cycle, budget, max_age)
+            elif self.ipv6_enabled:
+                await self._async_detect_ipv6(cycle, budget, max_age)
 
             updates: list[tuple[str, str]] = []
             if self.ipv4_enabled and data.public_ipv4:
@@ -228,13 +524,21 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
                 self.ipv6_enabled and data.public_ipv6 != self._last_ipv6
             )
 
-            for subdomain in self._record_targets:
-                for record_type, ip in updates:
-                    await self._update_record(subdomain, record_type, ip, skip_fetch=not ip_changed)
+            # One dns/retrieve call per cycle replaces a retrieveByNameType call per record.
+            zone: RecordIndex = {}
+            if any(
+                self._needs_fetch(subdomain, record_type, ip, ip_changed)
+                for subdomain in self._record_targets
+                for record_type, ip in updates
+            ):
+                with cycle.child("zone_fetch"):
+                    zone = await self._client.get_record_index(self._domain, hedge=self._hedge_requests, budget=budget)
 
-            # Fetch domain registration info (non-critical, don't fail on error)
-            with suppress(PorkbunApiError, aiohttp.ClientError, TimeoutError):
-                data.domain_info = await self._client.get_domain_info(self._domain)
+            with cycle.child("reconcile") as span:
+                await self._reconcile_records(updates, zone, span, budget, skip_fetch=not ip_changed)
+
+            # Registration info is slow-changing and non-critical; refresh it off the critical path.
+            self._async_schedule_domain_info_refresh(cycle)
 
             if self._consecutive_update_failures:
                 LOGGER.info(
@@ -246,17 +550,25 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
             self._last_ipv4 = data.public_ipv4
             self._last_ipv6 = data.public_ipv6
             data.last_updated = datetime.now(tz=UTC)
-            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+            if ip_changed or self._ip_stable_since is None:
+                self._ip_stable_since = data.last_updated
+            self._async_adapt_update_interval(failed=not all(state.ok for state in data.records.values()))
+            with cycle.child("issue_registry"):
+                ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+            with cycle.child("save_state"):
+                await self._async_save_state()
             return data
 
         except PorkbunAuthError as err:
+            cycle.error = _error_text(err)
             raise ConfigEntryAuthFailed(
                 translation_domain=DOMAIN,
                 translation_key="auth_failed",
             ) from err
         except (PorkbunApiError, aiohttp.ClientError, TimeoutError) as err:
-            err_text = _error_text(err)
+            err_text = cycle.error = _error_text(err)
             self._consecutive_update_failures += 1
+            self._async_adapt_update_interval(failed=True)
             update_log = (
                 LOGGER.error if self._consecutive_update_failures >= self._failure_threshold else LOGGER.warning
             )
@@ -276,29 +588,126 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
             if self._consecutive_update_failures < self._failure_threshold:
                 return data
 
-            if isinstance(err, PorkbunApiError):
-                ir.async_create_issue(
-                    self.hass,
-                    DOMAIN,
-                    issue_id,
-                    is_fixable=True,
-                    is_persistent=False,
-                    severity=ir.IssueSeverity.ERROR,
-                    translation_key="api_access_disabled",
-                    translation_placeholders={"domain": self._domain},
-                    data={"entry_id": self.config_entry.entry_id},
-                )
+            # Requests rejected client-side mean Porkbun is struggling, not that API access is disabled.
+            if isinstance(err, PorkbunApiError) and not isinstance(
+                err, (PorkbunCircuitOpenError, PorkbunRetryBudgetError)
+            ):
+                with cycle.child("issue_registry"):
+                    ir.async_create_issue(
+                        self.hass,
+                        DOMAIN,
+                        issue_id,
+                        is_fixable=True,
+                        is_persistent=False,
+                        severity=ir.IssueSeverity.ERROR,
+                        translation_key="api_access_disabled",
+                        translation_placeholders={"domain": self._domain},
+                        data={"entry_id": self.config_entry.entry_id},
+                    )
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="update_failed",
                 translation_placeholders={"domain": self._domain, "error": err_text},
             ) from err
+        finally:
+            cycle.finish()
+            self._cycle_finished_at = datetime.now(tz=UTC)
+            self._async_schedule_warm_up()
+
+    async def _async_detect_ipv4(self, cycle: Span, budget: RetryBudget, max_age: float) -> None:
+        with cycle.child("ipv4"):
+            self.data.public_ipv4, self._ipv4_seen_at = await self._ip_cache.async_lookup(
+                ("A", self._api_key),
+                partial(self._client.ping, hedge=self._hedge_requests, budget=budget),
+                max_age=max_age,
+                newer_than=self._ipv4_seen_at,
+            )
+        LOGGER.debug("Current public IPv4: %s", self.data.public_ipv4)
+
+    async def _async_detect_ipv6(self, cycle: Span, budget: RetryBudget, max_age: float) -> None:
+        with cycle.child("ipv6"):
+            self.data.public_ipv6, self._ipv6_seen_at = await self._ip_cache.async_lookup(
+                ("AAAA", self._api_key), partial(self._get_ipv6, budget), max_age=max_age, newer_than=self._ipv6_seen_at
+            )
+        LOGGER.debug("Current public IPv6: %s", self.data.public_ipv6)
+
+    @callback
+    def _async_schedule_domain_info_refresh(self, cycle: Span) -> None:
+        """Start a background domain info refresh once its own interval has elapsed."""
+        if self._domain_info_task is not None and not self._domain_info_task.done():
+            return
+        if (
+            self._domain_info_refreshed_at is not None
+            and datetime.now(tz=UTC) - self._domain_info_refreshed_at < self._domain_info_interval
+        ):
+            return
+        self._domain_info_task = self.config_entry.async_create_background_task(
+            self.hass, self._async_refresh_domain_info(cycle), f"porkbun_ddns domain info {self._domain}"
+        )
+
+    async def _async_refresh_domain_info(self, cycle: Span) -> None:
+        """Fetch domain registration info; failures keep the cached value and retry next cycle."""
+        # Traced under the cycle that started it, even though it usually outlives that cycle.
+        with cycle.child("domain_info") as span:
+            try:
+                self.data.domain_info = await self._client.get_domain_info(self._domain)
+            except (PorkbunApiError, aiohttp.ClientError, TimeoutError) as err:
+                span.error = _error_text(err)
+                LOGGER.debug("Could not refresh domain info for %s: %s", self._domain, span.error)
+                return
+        self._domain_info_refreshed_at = datetime.now(tz=UTC)
+        self.async_update_listeners()
+
+    def _needs_fetch(self, subdomain: str, record_type: str, target_ip: str, ip_changed: bool) -> bool:
+        """Return True when a record's current content must be read from the zone."""
+        state = self.data.records.get(_record_key(subdomain, record_type))
+        return ip_changed or state is None or state.current_ip != target_ip
+
+    async def _reconcile_records(
+        self,
+        updates: list[tuple[str, str]],
+        zone: RecordIndex,
+        trace: Span,
+        budget: RetryBudget,
+        *,
+        skip_fetch: bool,
+    ) -> None:
+        """Reconcile every managed record, running at most the configured number at once."""
+        jobs = [(subdomain, record_type, ip) for subdomain in self._record_targets for record_type, ip in updates]
+        # Create states up front so record ordering never depends on task scheduling.
+        for subdomain, record_type, _ in jobs:
+            self.data.records.setdefault(_record_key(subdomain, record_type), RecordState())
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_updates)
+        logs = [_BufferedLog() for _ in jobs]
+        spans: list[Span | None] = [None] * len(jobs)
+
+        async def _run(index: int, job: tuple[str, str, str]) -> None:
+            async with semaphore:
+                # Started once a slot is free: time spent queueing isn't the record's cost.
+                span = spans[index] = Span("record", record=_record_key(job[0], job[1]))
+                try:
+                    await self._update_record(*job, zone, logs[index], span, budget, skip_fetch=skip_fetch)
+                finally:
+                    span.finish()
+
+        try:
+            await asyncio.gather(*(_run(index, job) for index, job in enumerate(jobs)))
+        finally:
+            # Replay in target order so concurrent runs log exactly like a sequential one.
+            for log in logs:
+                log.flush()
+            trace.children.extend(span for span in spans if span is not None)
 
     async def _update_record(
         self,
         subdomain: str,
         record_type: str,
         target_ip: str,
+        zone: RecordIndex,
+        log: _BufferedLog,
+        span: Span,
+        budget: RetryBudget,
         *,
         skip_fetch: bool = False,
     ) -> None:
@@ -309,48 +718,59 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
         label = f"{subdomain}.{self._domain}" if subdomain else self._domain
 
         try:
-            if skip_fetch and state.current_ip is not None:
-                # IP hasn't changed and we already know the record — skip the API call
-                LOGGER.debug("%s %s record unchanged (skip_fetch), IP still %s", label, record_type, target_ip)
+            if skip_fetch and state.current_ip == target_ip:
+                # IP hasn't changed and the record already holds it — skip the lookup
+                log.debug("%s %s record unchanged (skip_fetch), IP still %s", label, record_type, target_ip)
+                span.attrs["result"] = "unchanged"
                 state.ok = True
                 state.error = None
                 return
 
-            existing = await self._client.get_records(self._domain, record_type, subdomain)
+            existing = zone.get((label, record_type), [])
             current_ip = existing[0].content if existing else None
 
+            if existing:
+                state.record_id = existing[0].id
             if current_ip == target_ip:
-                LOGGER.debug("%s %s record already correct (%s)", label, record_type, target_ip)
+                log.debug("%s %s record already correct (%s)", label, record_type, target_ip)
+                span.attrs["result"] = "correct"
                 state.current_ip = current_ip
                 state.ok = True
                 state.error = None
                 return
 
-            # IP differs — update or create
+            # IP differs — update or create. Writes go through the shared queue so overlapping
+            # refreshes (button, reload, schedule) only send the latest address.
             if existing:
-                LOGGER.info("Updating %s %s record: %s → %s", label, record_type, current_ip, target_ip)
-                await self._client.edit_record_by_name_type(
-                    self._domain, record_type, target_ip, subdomain, DEFAULT_TTL
-                )
+                log.info("Updating %s %s record: %s → %s", label, record_type, current_ip, target_ip)
             else:
-                LOGGER.info("Creating %s %s record: %s", label, record_type, target_ip)
-                await self._client.create_record(self._domain, record_type, target_ip, subdomain, DEFAULT_TTL)
+                log.info("Creating %s %s record: %s", label, record_type, target_ip)
+            with span.child("edit" if existing else "create"):
+                written_ip, record_id = await self._write_queue.async_write(
+                    self._client, (self._domain, subdomain, record_type), target_ip, create=not existing, budget=budget
+                )
+            span.attrs["result"] = "updated" if existing else "created"
+            if record_id is not None:
+                state.record_id = record_id
+            if written_ip != target_ip:
+                log.debug("%s %s write coalesced with a newer one for %s", label, record_type, written_ip)
 
             if state.consecutive_failures:
-                LOGGER.info(
+                log.info(
                     "%s %s record recovered after %d consecutive failures",
                     label,
                     record_type,
                     state.consecutive_failures,
                 )
             state.consecutive_failures = 0
-            state.current_ip = target_ip
+            state.current_ip = written_ip
             state.ok = True
             state.error = None
         except (PorkbunApiError, aiohttp.ClientError, TimeoutError) as err:
-            err_text = _error_text(err)
+            err_text = span.error = _error_text(err)
+            span.attrs["result"] = "failed"
             state.consecutive_failures += 1
-            update_log = LOGGER.error if state.consecutive_failures >= self._failure_threshold else LOGGER.warning
+            update_log = log.error if state.consecutive_failures >= self._failure_threshold else log.warning
             update_log(
                 "Failed to update %s %s (%d consecutive failures): %s",
                 label,
@@ -361,12 +781,12 @@ class PorkbunDdnsCoordinator(DataUpdateCoordinator[DdnsData]):
             state.ok = False
             state.error = err_text
 
-    async def _get_ipv6(self, session: aiohttp.ClientSession) -> str | None:
-        """Detect public IPv6 address via external service."""
+    async def _get_ipv6(self, budget: RetryBudget | None = None) -> str | None:
+        """Detect the public IPv6 address with Porkbun's ping over IPv6; None when IPv6 is unavailable."""
         try:
-            async with session.get(IPV6_DETECT_URL, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    return (await resp.text()).strip()
-        except aiohttp.ClientError, TimeoutError:
-            LOGGER.warning("Failed to detect IPv6 address; skipping IPv6 update")
+            return await self._client.ping_ipv6(hedge=self._hedge_requests, budget=budget)
+        except PorkbunAuthError:
+            raise
+        except (PorkbunApiError, aiohttp.ClientError, TimeoutError) as err:
+            LOGGER.warning("Failed to detect IPv6 address; skipping IPv6 update: %s", _error_text(err))
         return None
@@ -37,4 +37,9 @@ async def async_get_config_entry_diagnostics(
             "records": {key: asdict(state) for key, state in data.records.items()},
             "domain_info": asdict(data.domain_info) if data.domain_info else None,
         },
+        "api": {
+            "circuit": coordinator.api_circuit_state,
+            "endpoints": coordinator.api_stats,
+        },
+        "cycles": coordinator.cycle_traces,
     }
@@ -0,0 +1,124 @@
+"""Request metrics and update-cycle traces collected by the integration."""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+
+class Histogram:
+    """Fixed-bucket histogram; each bucket counts observations up to its upper bound."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize an empty histogram with sorted upper bounds plus an overflow bucket."""
+        self._bounds = tuple(sorted(bounds))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot keyed by bucket upper bound ("+Inf" for overflow)."""
+        labels = [f"{bound:g}" for bound in self._bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "buckets": dict(zip(labels, self._counts, strict=True)),
+        }
+
+
+class EndpointStats:
+    """Counters and histograms for one API endpoint."""
+
+    def __init__(
+        self,
+        latency_bounds: Sequence[float],
+        attempt_bounds: Sequence[float],
+        size_bounds: Sequence[float],
+    ) -> None:
+        """Initialize empty stats."""
+        self.calls = 0
+        self.failures = 0
+        self.latency = Histogram(latency_bounds)
+        self.attempts = Histogram(attempt_bounds)
+        self.response_bytes = Histogram(size_bounds)
+        self.retry_causes: Counter[str] = Counter()
+        self.failure_causes: Counter[str] = Counter()
+
+    def observe_call(self, attempts: int, failure: str | None) -> None:
+        """Record a finished call: how many requests it sent and why it failed, if it did."""
+        self.calls += 1
+        if attempts:
+            self.attempts.observe(attempts)
+        if failure is not None:
+            self.failures += 1
+            self.failure_causes[failure] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "latency_seconds": self.latency.as_dict(),
+            "attempts": self.attempts.as_dict(),
+            "response_bytes": self.response_bytes.as_dict(),
+            "retry_causes": dict(self.retry_causes),
+            "failure_causes": dict(self.failure_causes),
+        }
+
+
+class Span:
+    """A timed step of an update cycle and the steps it ran."""
+
+    def __init__(self, name: str, **attrs: Any) -> None:
+        """Start timing a step."""
+        self.name = name
+        self.attrs = attrs
+        self.started = time.monotonic()
+        self.ended: float | None = None
+        self.error: str | None = None
+        self.children: list[Span] = []
+
+    @contextmanager
+    def child(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """Time a nested step, recording the error it raised, if any."""
+        span = Span(name, **attrs)
+        self.children.append(span)
+        try:
+            yield span
+        except Exception as err:
+            span.error = str(err) or type(err).__name__
+            raise
+        finally:
+            span.finish()
+
+    def finish(self) -> None:
+        """Stop timing; later calls keep the first end time."""
+        if self.ended is None:
+            self.ended = time.monotonic()
+
+    def as_dict(self, origin: float | None = None) -> dict[str, Any]:
+        """Return a JSON-friendly tree with offsets in ms from origin (default: this span's start)."""
+        if origin is None:
+            origin = self.started
+        result: dict[str, Any] = {
+            "name": self.name,
+            "offset_ms": round((self.started - origin) * 1000, 1),
+            "duration_ms": None if self.ended is None else round((self.ended - self.started) * 1000, 1),
+        }
+        if self.attrs:
+            result["attrs"] = dict(self.attrs)
+        if self.error is not None:
+            result["error"] = self.error
+        if self.children:
+            result["children"] = [child.as_dict(origin) for child in self.children]
+        return result
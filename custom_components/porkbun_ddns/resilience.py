@@ -0,0 +1,251 @@
+"""Client-side protections that keep Porkbun API traffic within the server's limits."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by every request made with one API key.
+
+    Callers reserve a token synchronously and then sleep off any debt, so waiters are
+    served in arrival order without a lock. pause() holds every caller until a server
+    Retry-After window has passed.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket refilling at rate tokens per second."""
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left before a server-requested pause ends."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the next seconds, extending any current pause."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        # Don't let the bucket refill while paused, or the resume becomes a burst.
+        self._refill(now)
+        self._tokens = min(self._tokens, 1.0)
+        self._updated = self._paused_until
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        # Tokens only accrue from _updated, which is the end of any pause.
+        delay = self._updated + max(0.0, -self._tokens) / self._rate - now
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+            # A pause may have started (or grown) while this caller was waiting.
+            if (remaining := self.paused_for) > 0:
+                await asyncio.sleep(remaining)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+
+
+def parse_retry_after(value: object, maximum: float) -> float | None:
+    """Return a Retry-After header value in seconds, capped at maximum, or None if unusable."""
+    if not isinstance(value, str) or not (value := value.strip()):
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except TypeError, ValueError:
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return min(max(seconds, 0.0), maximum)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while the API is unreachable, probing with a single request to recover.
+
+    After failure_threshold consecutive transport failures the breaker opens and rejects
+    requests for reset_timeout seconds. It then lets exactly one probe through: success
+    closes it again, failure re-opens it for another reset_timeout.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._probe_in_flight or self.retry_in == 0:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent, claiming the probe slot when half-open."""
+        if self._opened_at is None:
+            return True
+        if self._probe_in_flight or self.retry_in > 0:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after the API answered."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a transport failure; return True if it opened (or re-opened) the breaker."""
+        self._failures += 1
+        if not self._probe_in_flight and self._failures < self._failure_threshold:
+            return False
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        return True
+
+    def release_probe(self) -> None:
+        """Give up the probe slot when the probe ended without an outcome (e.g. cancelled)."""
+        self._probe_in_flight = False
+
+
+class RetryBudget:
+    """Cap the retries one update cycle may spend at a fraction of its first attempts.
+
+    Every request sent counts as a first attempt; a retry is allowed while the retries
+    spent stay below minimum + ratio * first attempts. Once a retry is refused the budget
+    is exhausted and the rest of the cycle's requests should fail fast.
+    """
+
+    def __init__(self, ratio: float, minimum: int) -> None:
+        """Initialize an unspent budget."""
+        self._ratio = ratio
+        self._minimum = minimum
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = False
+
+    def record_attempt(self) -> None:
+        """Count a request's first attempt, which earns ratio retries."""
+        self.attempts += 1
+
+    def try_spend(self) -> bool:
+        """Claim one retry; return False (and exhaust the budget) when none are left."""
+        if self.exhausted or self.retries >= self._minimum + self._ratio * self.attempts:
+            self.exhausted = True
+            return False
+        self.retries += 1
+        return True
+
+
+class LatencyWindow:
+    """Rolling window of recent request latencies."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window keeping the last size samples."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile of the window, or None when it is empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = math.ceil(pct / 100 * len(ordered))
+        return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+class RttEstimator:
+    """Smoothed round-trip time of one endpoint, tracked like TCP's retransmission timeout (RFC 6298).
+
+    The timeout is srtt + 4 * rttvar clamped to [minimum, maximum], or initial before the
+    first sample. Each timed-out request doubles it (up to maximum) until the next sample.
+    """
+
+    def __init__(self, initial: float, minimum: float, maximum: float) -> None:
+        """Initialize an estimator with no samples."""
+        self._initial = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._srtt: float | None = None
+        self._rttvar = 0.0
+        self._backoff = 1
+
+    @property
+    def rto(self) -> float | None:
+        """Return the unclamped srtt + 4 * rttvar, or None before the first sample."""
+        if self._srtt is None:
+            return None
+        return self._srtt + 4 * self._rttvar
+
+    @property
+    def timeout(self) -> float:
+        """Return how long the next request should be allowed to take."""
+        base = self._initial if (rto := self.rto) is None else min(max(rto, self._minimum), self._maximum)
+        return min(base * self._backoff, self._maximum)
+
+    def add(self, seconds: float) -> None:
+        """Fold in the duration of a request that completed, clearing any backoff."""
+        if self._srtt is None:
+            self._srtt = seconds
+            self._rttvar = seconds / 2
+        else:
+            self._rttvar = 0.75 * self._rttvar + 0.25 * abs(self._srtt - seconds)
+            self._srtt = 0.875 * self._srtt + 0.125 * seconds
+        self._backoff = 1
+
+    def backoff(self) -> None:
+        """Double the timeout after a request timed out."""
+        if self.timeout < self._maximum:
+            self._backoff *= 2
@@ -7,10 +7,11 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.const import EntityCategory
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import PorkbunDdnsConfigEntry
@@ -19,7 +20,7 @@ from .coordinator import PorkbunDdnsCoordinator
 PARALLEL_UPDATES = 0
 
 
-_ValueFn = Callable[[PorkbunDdnsCoordinator], str | datetime | None]
+_ValueFn = Callable[[PorkbunDdnsCoordinator], StateType | datetime]
 _AttrsFn = Callable[[PorkbunDdnsCoordinator], dict[str, Any]]
 
 
@@ -29,6 +30,8 @@ class _SensorDef:
     translation_key: str
     value_fn: _ValueFn
     device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    unit: str | None = None
     entity_category: EntityCategory | None = None
     enabled_default: bool = True
     attrs_fn: _AttrsFn | None = None
@@ -46,6 +49,10 @@ class _DdnsSensor(CoordinatorEntity[PorkbunDdnsCoordinator], SensorEntity):
 
         if entity_def.device_class is not None:
             self._attr_device_class = entity_def.device_class
+        if entity_def.state_class is not None:
+            self._attr_state_class = entity_def.state_class
+        if entity_def.unit is not None:
+            self._attr_native_unit_of_measurement = entity_def.unit
         if entity_def.entity_category is not None:
             self._attr_entity_category = entity_def.entity_category
 
@@ -53,7 +60,7 @@ class _DdnsSensor(CoordinatorEntity[PorkbunDdnsCoordinator], SensorEntity):
         self._attrs_fn = entity_def.attrs_fn
 
     @property
-    def native_value(self) -> str | datetime | None:
+    def native_value(self) -> StateType | datetime:
         return self._value_fn(self.coordinator)
 
     @property
@@ -71,11 +78,7 @@ def _managed_records_attrs(coordinator: PorkbunDdnsCoordinator) -> dict[str, lis
 
 
 def _next_update(coordinator: PorkbunDdnsCoordinator) -> datetime | None:
-    last_updated = coordinator.data.last_updated
-    interval = coordinator.update_interval
-    if last_updated is None or interval is None:
-        return None
-    return last_updated + interval
+    return coordinator.next_update
 
 
 def _domain_expiry(coordinator: PorkbunDdnsCoordinator) -> datetime | None:
@@ -88,6 +91,38 @@ def _domain_expiry(coordinator: PorkbunDdnsCoordinator) -> datetime | None:
         return None
 
 
+def _api_requests(coordinator: PorkbunDdnsCoordinator) -> int:
+    return sum(stats["calls"] for stats in coordinator.api_stats.values())
+
+
+def _api_requests_attrs(coordinator: PorkbunDdnsCoordinator) -> dict[str, Any]:
+    return {
+        endpoint: {
+            "calls": stats["calls"],
+            "failures": stats["failures"],
+            "retries": sum(stats["retry_causes"].values()),
+        }
+        for endpoint, stats in coordinator.api_stats.items()
+    }
+
+
+def _recent_median_ms(stats: dict[str, Any]) -> float | None:
+    if (recent := stats.get("recent_latency_seconds")) is None:
+        return None
+    median: float = recent["p50"]
+    return round(median * 1000, 1)
+
+
+def _api_latency(coordinator: PorkbunDdnsCoordinator) -> float | None:
+    # A lifetime mean flattens out after a few cycles; the slowest recent median shows regressions.
+    medians = [median for stats in coordinator.api_stats.values() if (median := _recent_median_ms(stats)) is not None]
+    return max(medians, default=None)
+
+
+def _api_latency_attrs(coordinator: PorkbunDdnsCoordinator) -> dict[str, Any]:
+    return {endpoint: _recent_median_ms(stats) for endpoint, stats in coordinator.api_stats.items()}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PorkbunDdnsConfigEntry,
@@ -124,6 +159,27 @@ async def async_setup_entry(
             entity_category=EntityCategory.DIAGNOSTIC,
             enabled_default=False,
         ),
+        # API metrics are per account: entries sharing an API key report the same numbers.
+        _SensorDef(
+            unique_id=f"{domain_name}_api_requests",
+            translation_key="api_requests",
+            value_fn=_api_requests,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            enabled_default=False,
+            attrs_fn=_api_requests_attrs,
+        ),
+        _SensorDef(
+            unique_id=f"{domain_name}_api_latency",
+            translation_key="api_latency",
+            value_fn=_api_latency,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=UnitOfTime.MILLISECONDS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            enabled_default=False,
+            attrs_fn=_api_latency_attrs,
+        ),
     ]
 
     if coordinator.ipv4_enabled:
@@ -0,0 +1,277 @@
+"""Integration-wide state shared by every Porkbun DDNS config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .api import PorkbunClient
+from .const import (
+    API_DNS_CACHE_TTL,
+    API_MAX_CONCURRENT_REQUESTS,
+    DATA_CLIENTS,
+    DATA_IP_CACHE,
+    DATA_WRITE_QUEUE,
+    DEFAULT_TTL,
+    DOMAIN,
+)
+from .resilience import RetryBudget
+
+
+@dataclass
+class _ClientLease:
+    """A shared client, its dedicated session and the config entries currently using it."""
+
+    client: PorkbunClient
+    session: aiohttp.ClientSession
+    ipv6_session: aiohttp.ClientSession
+    entry_ids: set[str] = field(default_factory=set)
+
+    async def async_close(self) -> None:
+        """Close the lease's sessions."""
+        await self.session.close()
+        await self.ipv6_session.close()
+
+
+def _async_create_session(
+    keepalive_timeout: float, family: socket.AddressFamily = socket.AF_UNSPEC
+) -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for the Porkbun API.
+
+    Keeping Porkbun traffic off Home Assistant's shared pool means its connections aren't
+    evicted by other integrations, and idle ones are kept across a whole update interval.
+    family=AF_INET6 limits it to IPv6, which IPv6 detection relies on.
+    """
+    connector = aiohttp.TCPConnector(
+        ssl=get_default_context(),
+        family=family,
+        limit_per_host=API_MAX_CONCURRENT_REQUESTS,
+        ttl_dns_cache=API_DNS_CACHE_TTL,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector, headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE})
+
+
+def _leases(hass: HomeAssistant) -> dict[tuple[str, str], _ClientLease]:
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (leases := domain_data.get(DATA_CLIENTS)) is not None:
+        return cast(dict[tuple[str, str], _ClientLease], leases)
+    created: dict[tuple[str, str], _ClientLease] = {}
+    domain_data[DATA_CLIENTS] = created
+
+    async def _async_close_sessions(_: Event) -> None:
+        # Entries aren't unloaded on shutdown, so close whatever sessions are still open.
+        for lease in list(created.values()):
+            await lease.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_sessions)
+    return created
+
+
+def async_acquire_client(
+    hass: HomeAssistant, entry_id: str, api_key: str, secret_key: str, *, keepalive_timeout: float
+) -> PorkbunClient:
+    """Return the client shared by every entry using these credentials.
+
+    The session's keepalive_timeout is fixed by the entry that creates the client; entries
+    that join later with a longer update interval keep it, since the connector can't be
+    retuned while in use. Their connections are still re-opened by the optional warm-up.
+    """
+    leases = _leases(hass)
+    key = (api_key, secret_key)
+    if (lease := leases.get(key)) is None:
+        session = _async_create_session(keepalive_timeout)
+        # Opens no connections until an entry with IPv6 enabled pings over it.
+        ipv6_session = _async_create_session(keepalive_timeout, socket.AF_INET6)
+        client = PorkbunClient(session, api_key, secret_key, ipv6_session=ipv6_session)
+        lease = leases[key] = _ClientLease(client, session, ipv6_session)
+    lease.entry_ids.add(entry_id)
+    return lease.client
+
+
+async def async_release_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Stop tracking entry_id and close clients that no entry uses any more."""
+    leases = _leases(hass)
+    for key, lease in list(leases.items()):
+        lease.entry_ids.discard(entry_id)
+        if not lease.entry_ids:
+            del leases[key]
+            await lease.async_close()
+
+
+type IpLookup = tuple[str | None, float]
+
+
+class PublicIpCache:
+    """Short-lived, single-flight cache of public IP lookups shared by all entries.
+
+    Entries on one account poll at different points of the interval, so a lookup is kept
+    for a while after it answers rather than only shared while in flight.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._results: dict[tuple[str, ...], IpLookup] = {}
+        self._pending: dict[tuple[str, ...], asyncio.Task[IpLookup]] = {}
+
+    async def async_lookup(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[str | None]],
+        *,
+        max_age: float,
+        newer_than: float = float("-inf"),
+    ) -> IpLookup:
+        """Return (address, fetched_at) for key, fetching at most once across concurrent callers.
+
+        A cached result is reused while it is younger than max_age and was fetched after
+        newer_than, so a caller never gets back the same lookup it saw on its last cycle.
+        max_age=0 always waits for a lookup that starts no earlier than this call.
+        """
+        cached = self._results.get(key)
+        if cached is not None and time.monotonic() - cached[1] < max_age and cached[1] > newer_than:
+            return cached
+        if (pending := self._pending.get(key)) is None:
+            # A regular task, not a background one: the refresh awaits it, so it is part of the update.
+            pending = self._hass.async_create_task(
+                self._async_fetch(key, fetch), f"porkbun_ddns public IP lookup {key[0]}"
+            )
+            # The task starts eagerly and may already be finished; only track it while in flight.
+            if not pending.done():
+                self._pending[key] = pending
+        # Shield the shared lookup so one cancelled caller doesn't cancel it for everyone.
+        return await asyncio.shield(pending)
+
+    async def _async_fetch(self, key: tuple[str, ...], fetch: Callable[[], Awaitable[str | None]]) -> IpLookup:
+        try:
+            result = self._results[key] = (await fetch(), time.monotonic())
+        finally:
+            self._pending.pop(key, None)
+        return result
+
+
+def async_get_ip_cache(hass: HomeAssistant) -> PublicIpCache:
+    """Return the integration-wide public IP cache."""
+    domain_data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_IP_CACHE)
+    if not isinstance(cache, PublicIpCache):
+        cache = domain_data[DATA_IP_CACHE] = PublicIpCache(hass)
+    return cache
+
+
+# (domain, subdomain, record type)
+type RecordKey = tuple[str, str, str]
+
+
+@dataclass
+class _RecordWrite:
+    """A write waiting to be sent; callers that coalesce into it share its outcome."""
+
+    client: PorkbunClient
+    content: str
+    create: bool
+    budget: RetryBudget | None
+    done: asyncio.Future[tuple[str, str | None]]
+
+
+class RecordWriteQueue:
+    """Per-record DNS write queue shared by all entries, coalescing writes to the latest content.
+
+    At most one write per record is in flight. Writes arriving meanwhile merge into a single
+    queued write holding the most recent content, sent once the in-flight one finishes, so a
+    flapping address costs one edit per in-flight window rather than one per caller.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty queue."""
+        self._hass = hass
+        self._in_flight: dict[RecordKey, _RecordWrite] = {}
+        self._queued: dict[RecordKey, _RecordWrite] = {}
+        self._workers: dict[RecordKey, asyncio.Task[None]] = {}
+
+    async def async_write(
+        self,
+        client: PorkbunClient,
+        key: RecordKey,
+        content: str,
+        *,
+        create: bool,
+        budget: RetryBudget | None = None,
+    ) -> tuple[str, str | None]:
+        """Set a record's content; return the content actually written and the ID of a created record.
+
+        The written content is the latest any caller asked for, which may not be content.
+        """
+        in_flight = self._in_flight.get(key)
+        if (write := self._queued.get(key)) is not None:
+            write.client, write.content, write.budget = client, content, budget
+            # Create only if every caller found the record missing.
+            write.create = write.create and create
+        elif in_flight is not None and in_flight.content == content:
+            write = in_flight
+        else:
+            write = self._queued[key] = _RecordWrite(client, content, create, budget, self._hass.loop.create_future())
+            if key not in self._workers:
+                # A regular task, not a background one: the refresh awaits the write it carries.
+                worker = self._hass.async_create_task(
+                    self._async_drain(key), f"porkbun_ddns record write {key[1] or '@'}.{key[0]} {key[2]}"
+                )
+                # The worker starts eagerly and may already be finished; only track it while running.
+                if not worker.done():
+                    self._workers[key] = worker
+        # Shield the shared write so one cancelled caller doesn't cancel it for everyone.
+        return await asyncio.shield(write.done)
+
+    async def _async_drain(self, key: RecordKey) -> None:
+        domain, subdomain, record_type = key
+        written = False
+        try:
+            while (write := self._queued.pop(key, None)) is not None:
+                self._in_flight[key] = write
+                try:
+                    record_id: str | None = None
+                    # A write queued behind a successful one must not create the record twice.
+                    if write.create and not written:
+                        record_id = await write.client.create_record(
+                            domain, record_type, write.content, subdomain, DEFAULT_TTL, budget=write.budget
+                        )
+                    else:
+                        await write.client.edit_record_by_name_type(
+                            domain, record_type, write.content, subdomain, DEFAULT_TTL, budget=write.budget
+                        )
+                except asyncio.CancelledError:
+                    # Cancelled (e.g. on shutdown): release everyone sharing the write in flight.
+                    write.done.cancel()
+                    raise
+                except Exception as err:
+                    write.done.set_exception(err)
+                else:
+                    written = True
+                    write.done.set_result((write.content, record_id))
+                finally:
+                    del self._in_flight[key]
+        finally:
+            self._workers.pop(key, None)
+            # ...and anyone waiting on a write that was never sent.
+            if (queued := self._queued.pop(key, None)) is not None:
+                queued.done.cancel()
+
+
+def async_get_write_queue(hass: HomeAssistant) -> RecordWriteQueue:
+    """Return the integration-wide DNS record write queue."""
+    domain_data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    queue = domain_data.get(DATA_WRITE_QUEUE)
+    if not isinstance(queue, RecordWriteQueue):
+        queue = domain_data[DATA_WRITE_QUEUE] = RecordWriteQueue(hass)
+    return queue
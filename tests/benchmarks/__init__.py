@@ -0,0 +1 @@
+"""Benchmarks for Porkbun DDNS, run against the local API stand-in."""
@@ -0,0 +1,140 @@
+"""Fixtures and result reporting for the benchmarks.
+
+Benchmarks are deselected by default; run them with ``pytest -m benchmark tests/benchmarks``.
+Results are printed as one JSON document at the end of the run, and also written to the
+file named by PORKBUN_BENCH_OUTPUT when it is set, so CI can compare runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from custom_components.porkbun_ddns.api import PorkbunClient
+
+from ..fake_api import FakePorkbunApi
+
+# Benchmarks measure the client and coordinator, not the token bucket pacing them.
+UNPACED = {"rate_limit": 1_000_000.0, "rate_burst": 1_000_000}
+
+_RESULTS: list[dict[str, Any]] = []
+
+
+def record_result(result: dict[str, Any]) -> None:
+    """Add a result to the report written at the end of the run."""
+    _RESULTS.append(result)
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median": round(statistics.median(samples) * 1000, 3),
+        "min": round(min(samples) * 1000, 3),
+        "max": round(max(samples) * 1000, 3),
+    }
+
+
+class Benchmark:
+    """Times an async operation and records wall time, CPU time and allocations."""
+
+    async def measure(
+        self, name: str, run: Callable[[], Awaitable[object]], *, rounds: int = 20, **params: Any
+    ) -> dict[str, Any]:
+        """Run once to warm up, then time rounds runs and trace allocations of one more.
+
+        CPU time is the whole process's, so it includes the in-process stand-in serving the requests.
+        """
+        await run()
+        wall: list[float] = []
+        cpu: list[float] = []
+        for _ in range(rounds):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            await run()
+            wall.append(time.perf_counter() - wall_start)
+            cpu.append(time.process_time() - cpu_start)
+
+        # Tracing slows every allocation down, so it gets a pass of its own.
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            await run()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "name": name,
+            "params": params,
+            "rounds": rounds,
+            "wall_ms": _summary(wall),
+            "cpu_ms": _summary(cpu),
+            "alloc_peak_kib": round((peak - before) / 1024, 1),
+            "alloc_retained_kib": round((current - before) / 1024, 1),
+        }
+        record_result(result)
+        return result
+
+
+@pytest.fixture
+def bench() -> Benchmark:
+    return Benchmark()
+
+
+@pytest.fixture
+async def fake_client(fake_porkbun: FakePorkbunApi) -> AsyncGenerator[PorkbunClient]:
+    """A real client talking to the stand-in, without rate limit pacing."""
+    async with aiohttp.ClientSession() as session:
+        yield PorkbunClient(
+            session,
+            fake_porkbun.api_key,
+            fake_porkbun.secret_key,
+            api_base=fake_porkbun.base_url,
+            ipv6_session=session,
+            ipv6_api_base=fake_porkbun.ipv6_base_url,
+            **UNPACED,
+        )
+
+
+@pytest.fixture
+def porkbun_via_fake(fake_porkbun: FakePorkbunApi) -> Generator[FakePorkbunApi]:
+    """Point the clients the integration creates at the stand-in."""
+    client_cls = partial(
+        PorkbunClient, api_base=fake_porkbun.base_url, ipv6_api_base=fake_porkbun.ipv6_base_url, **UNPACED
+    )
+    with (
+        patch("custom_components.porkbun_ddns.shared.PorkbunClient", client_cls),
+        # The stand-in listens on 127.0.0.1 over plain HTTP, so the IPv6-only connector can't reach it.
+        patch("custom_components.porkbun_ddns.shared._async_create_session", lambda *_: aiohttp.ClientSession()),
+    ):
+        yield fake_porkbun
+
+
+def _report() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": _RESULTS,
+    }
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    terminalreporter.write_line(json.dumps(_report()))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _RESULTS and (path := os.environ.get("PORKBUN_BENCH_OUTPUT")):
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump(_report(), out, indent=2)
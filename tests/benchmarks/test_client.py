@@ -0,0 +1,51 @@
+"""Benchmarks for PorkbunClient request handling and response parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.porkbun_ddns.api import PorkbunClient
+
+from ..conftest import MOCK_DOMAIN, MOCK_IPV4
+from ..fake_api import FakePorkbunApi
+from .conftest import Benchmark
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS_PER_ROUND = 50
+
+
+async def test_request_handling(bench: Benchmark, fake_client: PorkbunClient) -> None:
+    async def run() -> None:
+        for _ in range(REQUESTS_PER_ROUND):
+            await fake_client._request("ping")
+
+    await bench.measure("request", run, requests=REQUESTS_PER_ROUND)
+
+
+@pytest.mark.parametrize("records", [10, 1000])
+async def test_get_records(
+    bench: Benchmark, fake_porkbun: FakePorkbunApi, fake_client: PorkbunClient, records: int
+) -> None:
+    for _ in range(records):
+        fake_porkbun.add_record(MOCK_DOMAIN, "www", "A", MOCK_IPV4)
+
+    async def run() -> None:
+        assert len(await fake_client.get_records(MOCK_DOMAIN, "A", "www")) == records
+
+    await bench.measure("get_records", run, records=records)
+
+
+@pytest.mark.parametrize("domains", [100, 5000])
+async def test_get_domain_info(
+    bench: Benchmark, fake_porkbun: FakePorkbunApi, fake_client: PorkbunClient, domains: int
+) -> None:
+    for i in range(domains - 1):
+        fake_porkbun.add_domain(f"d{i}.com", api_access=False)
+    # MOCK_DOMAIN was added first, so look up the last domain to scan every page.
+    last = f"d{domains - 2}.com"
+
+    async def run() -> None:
+        assert await fake_client.get_domain_info(last) is not None
+
+    await bench.measure("get_domain_info", run, domains=domains)
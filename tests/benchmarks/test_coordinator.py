@@ -0,0 +1,39 @@
+"""Benchmarks for a full coordinator update cycle."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.porkbun_ddns.const import CONF_SUBDOMAINS
+from custom_components.porkbun_ddns.coordinator import PorkbunDdnsCoordinator
+
+from ..conftest import MOCK_DOMAIN, MOCK_IPV4, make_entry
+from ..fake_api import FakePorkbunApi
+from .conftest import Benchmark
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("skip_fetch", [False, True])
+@pytest.mark.parametrize("subdomains", [1, 50, 500])
+async def test_update_cycle(
+    hass: HomeAssistant, bench: Benchmark, porkbun_via_fake: FakePorkbunApi, subdomains: int, skip_fetch: bool
+) -> None:
+    names = [f"host{i}" for i in range(subdomains)]
+    for name in ["", *names]:
+        porkbun_via_fake.add_record(MOCK_DOMAIN, name, "A", MOCK_IPV4)
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_SUBDOMAINS: names}))
+
+    async def run() -> None:
+        if not skip_fetch:
+            # Looks like an IP change, so every record is checked against a fresh zone fetch.
+            coordinator._last_ipv4 = None
+        await coordinator._async_update_data()
+
+    result = await bench.measure("update_cycle", run, subdomains=subdomains, skip_fetch=skip_fetch)
+
+    assert coordinator.all_ok
+    assert coordinator.record_count == subdomains + 1
+    # Only the warm-up cycle fetches the zone when skip_fetch applies.
+    assert porkbun_via_fake.calls["dns/retrieve"] == (1 if skip_fetch else result["rounds"] + 2)
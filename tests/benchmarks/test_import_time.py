@@ -0,0 +1,36 @@
+"""Benchmark for how long loading the integration takes on a cold start."""
+
+from __future__ import annotations
+
+import pytest
+
+from ..conftest import import_times
+from ..test_imports import ON_DEMAND_MODULES, PACKAGE, RUNTIME_MODULES
+from .conftest import record_result
+
+pytestmark = pytest.mark.benchmark
+
+# Loaded by a running Home Assistant before any custom integration is imported.
+CORE_MODULES = (
+    "aiohttp",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+@pytest.mark.parametrize(("scenario", "preload"), [("cold", ()), ("core_loaded", CORE_MODULES)])
+def test_import_time(scenario: str, preload: tuple[str, ...]) -> None:
+    # Home Assistant imports config_flow, repairs and diagnostics with the integration itself.
+    loaded = import_times(*RUNTIME_MODULES, *sorted(ON_DEMAND_MODULES), preload=preload)
+
+    own = {name: times for name, times in loaded.items() if name.startswith(PACKAGE)}
+    record_result(
+        {
+            "name": "import_time",
+            "params": {"scenario": scenario},
+            "total_ms": round(sum(times[0] for times in loaded.values()) / 1000, 3),
+            "integration_self_ms": round(sum(times[0] for times in own.values()) / 1000, 3),
+            "modules_self_ms": {name: round(times[0] / 1000, 3) for name, times in sorted(own.items())},
+        }
+    )
@@ -0,0 +1,143 @@
+"""Scale harness: many config entries sharing one event loop and one Porkbun account."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import statistics
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.setup import async_setup_component
+
+from custom_components.porkbun_ddns.const import DOMAIN
+
+from ..conftest import MOCK_IPV4, make_entry
+from ..fake_api import FakePorkbunApi
+from .conftest import record_result
+
+pytestmark = pytest.mark.benchmark
+
+CYCLES = 3
+LAG_PROBE_INTERVAL = 0.001
+
+
+class _LoopLagProbe:
+    """Measures how late a short sleep wakes up, i.e. how long the loop was kept busy."""
+
+    def __init__(self) -> None:
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self.lags.append(time.perf_counter() - start - LAG_PROBE_INTERVAL)
+
+    async def __aenter__(self) -> _LoopLagProbe:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+
+def _memory_by_source(diffs: list[tracemalloc.StatisticDiff]) -> Counter[str]:
+    """Group retained bytes by integration module, Home Assistant and everything else."""
+    sizes: Counter[str] = Counter()
+    for diff in diffs:
+        path = Path(diff.traceback[0].filename)
+        if DOMAIN in path.parts:
+            sizes[path.stem] += diff.size_diff
+        elif "homeassistant" in path.parts:
+            sizes["homeassistant"] += diff.size_diff
+        else:
+            sizes["other"] += diff.size_diff
+    return sizes
+
+
+@pytest.mark.parametrize("entries", [10, 100, 1000])
+async def test_many_entries(hass: HomeAssistant, porkbun_via_fake: FakePorkbunApi, entries: int) -> None:
+    config_entries = []
+    for i in range(entries):
+        domain = f"d{i}.com"
+        porkbun_via_fake.add_domain(domain)
+        porkbun_via_fake.add_record(domain, "", "A", MOCK_IPV4)
+        config_entries.append(make_entry(hass, domain_name=domain))
+
+    # Set up the way Home Assistant boots: every entry of the integration at once.
+    # With no startup delay, this includes each entry's first cycle.
+    started = time.perf_counter()
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    setup_ms = (time.perf_counter() - started) * 1000
+    coordinators = [entry.runtime_data for entry in config_entries]
+    assert all(coordinator.all_ok for coordinator in coordinators)
+
+    writes = 0
+    write_ha_state = Entity._async_write_ha_state
+
+    def _counting_write(entity: Entity) -> None:
+        nonlocal writes
+        writes += 1
+        write_ha_state(entity)
+
+    wall: list[float] = []
+    cpu: list[float] = []
+    lag_max: list[float] = []
+    with patch.object(Entity, "_async_write_ha_state", _counting_write):
+        for _ in range(CYCLES):
+            # Every entry refreshing together is the worst case for the shared loop.
+            async with _LoopLagProbe() as probe:
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+                await hass.async_block_till_done()
+                wall.append(time.perf_counter() - wall_start)
+                cpu.append(time.process_time() - cpu_start)
+            lag_max.append(max(probe.lags, default=0.0))
+    assert all(coordinator.last_update_success for coordinator in coordinators)
+
+    # Memory is traced over a second setup, since tracing would distort the timings above.
+    for entry in config_entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        await asyncio.gather(*(hass.config_entries.async_setup(entry.entry_id) for entry in config_entries))
+        await hass.async_block_till_done()
+        gc.collect()
+        by_source = _memory_by_source(tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    result: dict[str, Any] = {
+        "name": "scale",
+        "params": {"entries": entries},
+        "setup_ms": round(setup_ms, 1),
+        "cycle_wall_ms": round(statistics.median(wall) * 1000, 1),
+        # Process CPU over wall time: how much of a cycle the loop (and the in-process stand-in) was busy.
+        "cycle_loop_occupancy": round(statistics.median(cpu) / statistics.median(wall), 3),
+        "cycle_loop_lag_max_ms": round(max(lag_max) * 1000, 3),
+        "state_writes_per_cycle": writes / CYCLES,
+        "memory_per_entry_kib": round(sum(by_source.values()) / entries / 1024, 2),
+        "memory_peak_per_entry_kib": round(peak / entries / 1024, 2),
+        "memory_per_entry_kib_by_source": {
+            source: round(size / entries / 1024, 2) for source, size in by_source.most_common()
+        },
+    }
+    record_result(result)
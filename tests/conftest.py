@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import subprocess
+import sys
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -23,6 +27,9 @@ from custom_components.porkbun_ddns.const import (
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
 )
+from custom_components.porkbun_ddns.resilience import CircuitState
+
+from .fake_api import FakePorkbunApi
 
 MOCK_API_KEY = "pk1_test_key"
 MOCK_SECRET_KEY = "sk1_test_secret"
@@ -30,6 +37,8 @@ MOCK_DOMAIN = "example.com"
 MOCK_IPV4 = "1.2.3.4"
 MOCK_IPV6 = "2001:db8::1"
 
+REPO_ROOT = Path(__file__).parents[1]
+
 
 @pytest.fixture(autouse=True)
 def _enable_custom_integrations(enable_custom_integrations):
@@ -89,21 +98,57 @@ async def enable_entity(
     return entity_id
 
 
+def import_times(*modules: str, preload: tuple[str, ...] = ()) -> dict[str, tuple[int, int]]:
+    """Import modules in a fresh interpreter; return {module: (self µs, cumulative µs)} for each one loaded.
+
+    Modules in preload are imported first and left out of the result, like those already
+    loaded by a running Home Assistant.
+    """
+    imports = [f"import {module}" for module in preload]
+    imports += ["print('---', file=sys.stderr)", *(f"import {module}" for module in modules)]
+    result = subprocess.run(  # noqa: S603 - runs this interpreter on a fixed snippet
+        [sys.executable, "-X", "importtime", "-c", "import sys; " + "; ".join(imports)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.partition("---\n")[2].splitlines():
+        self_us, _, rest = line.removeprefix("import time:").partition("|")
+        cumulative_us, _, name = rest.partition("|")
+        if self_us.strip().isdigit() and cumulative_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
 @pytest.fixture
 def mock_porkbun_client() -> Generator[AsyncMock]:
     with (
         patch(
-            "custom_components.porkbun_ddns.coordinator.PorkbunClient",
+            "custom_components.porkbun_ddns.shared.PorkbunClient",
             autospec=True,
         ) as mock_cls,
         patch(
-            "custom_components.porkbun_ddns.coordinator.async_get_clientsession",
+            "custom_components.porkbun_ddns.shared._async_create_session",
+            return_value=AsyncMock(spec=aiohttp.ClientSession),
         ),
     ):
         client = mock_cls.return_value
         client.ping = AsyncMock(return_value=MOCK_IPV4)
+        client.ping_ipv6 = AsyncMock(return_value=MOCK_IPV6)
         client.get_records = AsyncMock(return_value=[])
+        client.get_record_index = AsyncMock(return_value={})
         client.create_record = AsyncMock(return_value="12345")
         client.edit_record_by_name_type = AsyncMock()
         client.get_domain_info = AsyncMock(return_value=None)
+        client.circuit_state = CircuitState.CLOSED
+        client.endpoint_stats.return_value = {}
         yield client
+
+
+@pytest.fixture
+async def fake_porkbun(socket_enabled: None) -> AsyncGenerator[FakePorkbunApi]:
+    async with FakePorkbunApi(MOCK_API_KEY, MOCK_SECRET_KEY, ipv4=MOCK_IPV4, ipv6=MOCK_IPV6) as api:
+        api.add_domain(MOCK_DOMAIN)
+        yield api
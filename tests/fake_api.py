@@ -0,0 +1,249 @@
+"""In-memory stand-in for the Porkbun v3 API, served locally by aiohttp.
+
+Point PorkbunClient's api_base (and ipv6_api_base) at base_url / ipv6_base_url to exercise
+the real request path. Zone and domain state live in memory; latency and 429/5xx/malformed
+responses are injected per request from a seeded RNG so runs are reproducible, or scripted
+for the next few requests with fail_next().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import random
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal, Self
+
+from aiohttp import web
+
+API_PREFIX = "/api/json/v3"
+IPV6_PREFIX = "/ipv6"
+LIST_ALL_PAGE_SIZE = 1000
+
+type Latency = Callable[[random.Random], float]
+type Fault = Literal["rate_limit", "server_error", "malformed"]
+
+
+def fixed_latency(seconds: float) -> Latency:
+    """Answer every request after the same delay."""
+    return lambda _rng: seconds
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Latency:
+    """Long-tailed latency around median seconds, as real API round trips tend to be."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+@dataclass
+class Faults:
+    """Per-request fault injection; may be changed while the server runs."""
+
+    latency: Latency = fixed_latency(0.0)
+    rate_limit_rate: float = 0.0  # share of requests answered 429
+    server_error_rate: float = 0.0  # share of requests answered 503
+    malformed_rate: float = 0.0  # share of requests answered 200 with a non-JSON body
+    retry_after: str | None = "1"  # Retry-After header sent with 429s
+
+
+@dataclass
+class FakeRecord:
+    """A DNS record held by the fake API."""
+
+    id: str
+    name: str
+    type: str
+    content: str
+    ttl: str = "600"
+
+    def as_json(self) -> dict[str, str]:
+        """Return the record as Porkbun serialises it."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "content": self.content,
+            "ttl": self.ttl,
+            "prio": "0",
+            "notes": "",
+        }
+
+
+class FakePorkbunApi:
+    """Porkbun v3 API stand-in: ping, dns/retrieve, retrieveByNameType, create, editByNameType, listAll."""
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        *,
+        ipv4: str = "1.2.3.4",
+        ipv6: str = "2001:db8::1",
+        faults: Faults | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Initialize a server with no domains; call start() (or use async with) to serve it."""
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.ipv4 = ipv4
+        self.ipv6 = ipv6
+        self.faults = faults or Faults()
+        self.zones: dict[str, list[FakeRecord]] = {}
+        self.domains: dict[str, dict[str, Any]] = {}
+        self.calls: Counter[str] = Counter()
+        self.connections: set[object] = set()
+        self._scripted: deque[Fault] = deque()
+        self._rng = random.Random(seed)  # noqa: S311 - reproducible fault injection, not security
+        self._ids = itertools.count(100000)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self.ipv6_base_url = ""
+
+    def add_domain(self, domain: str, *, expire_date: str = "2030-01-01 00:00:00", api_access: bool = True) -> None:
+        """Register a domain on the account; only domains with API access get a zone."""
+        self.domains[domain] = {
+            "domain": domain,
+            "status": "ACTIVE",
+            "tld": domain.rsplit(".", 1)[-1],
+            "createDate": "2020-01-01 00:00:00",
+            "expireDate": expire_date,
+            "securityLock": "1",
+            "whoisPrivacy": "1",
+            "autoRenew": "1",
+            "notLocal": 0,
+        }
+        if api_access:
+            self.zones.setdefault(domain, [])
+
+    def add_record(self, domain: str, subdomain: str, record_type: str, content: str) -> FakeRecord:
+        """Add a record to a domain's zone."""
+        name = f"{subdomain}.{domain}" if subdomain else domain
+        record = FakeRecord(str(next(self._ids)), name, record_type, content)
+        self.zones[domain].append(record)
+        return record
+
+    def fail_next(self, *faults: Fault) -> None:
+        """Answer the next requests with these faults, in order, before the random rates apply."""
+        self._scripted.extend(faults)
+
+    def records(self, domain: str, subdomain: str = "", record_type: str | None = None) -> list[FakeRecord]:
+        """Return a domain's records for one name, optionally of one type."""
+        name = f"{subdomain}.{domain}" if subdomain else domain
+        return [r for r in self.zones.get(domain, []) if r.name == name and record_type in (None, r.type)]
+
+    async def start(self) -> None:
+        """Serve the API on an ephemeral localhost port."""
+        app = web.Application()
+        for prefix, ipv6 in ((API_PREFIX, False), (IPV6_PREFIX + API_PREFIX, True)):
+            app.router.add_post(prefix + "/{endpoint:.+}", self._make_handler(ipv6))
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}{API_PREFIX}"
+        self.ipv6_base_url = f"http://127.0.0.1:{port}{IPV6_PREFIX}{API_PREFIX}"
+
+    async def stop(self) -> None:
+        """Stop serving and drop open connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> Self:
+        """Start serving."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop serving."""
+        await self.stop()
+
+    def _make_handler(self, ipv6: bool) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+        async def _handle(request: web.Request) -> web.StreamResponse:
+            return await self._handle(request, ipv6)
+
+        return _handle
+
+    async def _handle(self, request: web.Request, ipv6: bool) -> web.StreamResponse:
+        parts = request.match_info["endpoint"].strip("/").split("/")
+        name = "/".join(parts[:2])
+        self.calls[name] += 1
+        if request.transport is not None:
+            self.connections.add(request.transport.get_extra_info("peername"))
+
+        if (delay := self.faults.latency(self._rng)) > 0:
+            await asyncio.sleep(delay)
+        if (fault := self._next_fault()) == "rate_limit":
+            headers = {"Retry-After": self.faults.retry_after} if self.faults.retry_after else None
+            return _error("Rate limit exceeded.", 429, headers)
+        if fault == "server_error":
+            return web.Response(status=503, text="<html><body>503 Service Temporarily Unavailable</body></html>")
+        if fault == "malformed":
+            return web.Response(status=200, text='{"status": "SUCC')
+
+        try:
+            body = await request.json()
+        except ValueError:
+            return _error("Malformed request body.", 400)
+        if not isinstance(body, dict) or (body.get("apikey"), body.get("secretapikey")) != (
+            self.api_key,
+            self.secret_key,
+        ):
+            return _error("Invalid API key. (002)", 403)
+
+        if name == "ping":
+            return _success(yourIp=self.ipv6 if ipv6 else self.ipv4)
+        if name == "domain/listAll":
+            start = int(body.get("start", 0) or 0)
+            domains = list(self.domains.values())[start : start + LIST_ALL_PAGE_SIZE]
+            return _success(domains=domains)
+        if len(parts) < 3 or parts[2] not in self.zones:
+            return _error("Domain is not opted in to API access.", 400)
+        return self._handle_dns(parts[1], parts[2], parts[3:], body)
+
+    def _next_fault(self) -> Fault | None:
+        if self._scripted:
+            return self._scripted.popleft()
+        roll = self._rng.random()
+        rates: tuple[tuple[Fault, float], ...] = (
+            ("rate_limit", self.faults.rate_limit_rate),
+            ("server_error", self.faults.server_error_rate),
+            ("malformed", self.faults.malformed_rate),
+        )
+        for fault, rate in rates:
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def _handle_dns(self, action: str, domain: str, args: list[str], body: dict[str, Any]) -> web.Response:
+        if action == "retrieve":
+            return _success(records=[r.as_json() for r in self.zones[domain]])
+        if action == "retrieveByNameType" and args:
+            matches = self.records(domain, args[1] if len(args) > 1 else "", args[0])
+            return _success(records=[r.as_json() for r in matches])
+        if action == "create":
+            record = self.add_record(domain, str(body.get("name", "")), str(body["type"]), str(body["content"]))
+            record.ttl = str(body.get("ttl", record.ttl))
+            return _success(id=int(record.id))
+        if action == "editByNameType" and args:
+            matches = self.records(domain, args[1] if len(args) > 1 else "", args[0])
+            if not matches:
+                return _error("Could not find the record to edit.", 400)
+            for record in matches:
+                record.content = str(body["content"])
+                record.ttl = str(body.get("ttl", record.ttl))
+            return _success()
+        return _error("Unsupported endpoint.", 404)
+
+
+def _success(**payload: Any) -> web.Response:
+    return web.json_response({"status": "SUCCESS", **payload})
+
+
+def _error(message: str, status: int, headers: dict[str, str] | None = None) -> web.Response:
+    return web.json_response({"status": "ERROR", "message": message}, status=status, headers=headers)
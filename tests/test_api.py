@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
 
-from custom_components.porkbun_ddns.api import PorkbunApiError, PorkbunAuthError, PorkbunClient
-from custom_components.porkbun_ddns.const import API_REQUEST_TIMEOUT
+from custom_components.porkbun_ddns.api import (
+    PorkbunApiError,
+    PorkbunAuthError,
+    PorkbunCircuitOpenError,
+    PorkbunClient,
+    PorkbunRetryBudgetError,
+)
+from custom_components.porkbun_ddns.const import (
+    API_HEDGE_DEFAULT_DELAY,
+    API_HEDGE_MIN_SAMPLES,
+    API_REQUEST_RETRY_BASE,
+    API_REQUEST_RETRY_BASE_MIN,
+    API_REQUEST_TIMEOUT,
+    API_REQUEST_TIMEOUT_MAX,
+    API_REQUEST_TIMEOUT_MIN,
+    API_WARM_UP_WINDOW,
+    PORKBUN_API_BASE_IPV6,
+)
+from custom_components.porkbun_ddns.resilience import RetryBudget
 
 API_KEY = "pk1_test"
 SECRET_KEY = "sk1_test"
@@ -70,6 +88,38 @@ async def test_ping_auth_error() -> None:
         await _client(session).ping()
 
 
+async def test_ping_ipv6_uses_ipv6_session() -> None:
+    session = MagicMock(spec=aiohttp.ClientSession)
+    ipv6_session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "2001:db8::1"}))
+    client = PorkbunClient(session, API_KEY, SECRET_KEY, ipv6_session=ipv6_session)
+
+    assert await client.ping_ipv6() == "2001:db8::1"
+    session.post.assert_not_called()
+    assert ipv6_session.post.call_args.args[0] == f"{PORKBUN_API_BASE_IPV6}/ping"
+    assert list(client.endpoint_stats()) == ["ping (IPv6)"]
+
+
+async def test_ping_ipv6_rejects_ipv4_answer() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    with pytest.raises(PorkbunApiError, match="non-IPv6"):
+        await _client(session).ping_ipv6()
+
+
+async def test_ipv6_failures_do_not_open_ipv4_circuit() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    ipv6_session = MagicMock(spec=aiohttp.ClientSession)
+    ipv6_session.post.side_effect = aiohttp.ClientConnectionError("Network is unreachable")
+    client = PorkbunClient(session, API_KEY, SECRET_KEY, ipv6_session=ipv6_session)
+
+    with patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()):
+        for _ in range(3):
+            with pytest.raises((aiohttp.ClientConnectionError, PorkbunCircuitOpenError)):
+                await client.ping_ipv6()
+
+    assert client.circuit_state == "closed"
+    assert await client.ping() == "1.2.3.4"
+
+
 async def test_ping_network_error() -> None:
     session = MagicMock(spec=aiohttp.ClientSession)
     session.post.side_effect = aiohttp.ClientConnectionError("Connection refused")
@@ -108,6 +158,30 @@ async def test_get_records_paths(
         assert records[0].record_type == "A"
 
 
+async def test_get_record_index_fetches_whole_zone() -> None:
+    payload = {
+        "status": "SUCCESS",
+        "records": [
+            BASE_RECORD,
+            {**BASE_RECORD, "id": "456", "name": "WWW.example.com", "content": "5.6.7.8"},
+            {**BASE_RECORD, "id": "789", "type": "AAAA", "content": "2001:db8::1"},
+        ],
+    }
+    session = _make_session(_mock_response(payload))
+    index = await _client(session).get_record_index("example.com")
+
+    assert session.post.call_count == 1
+    assert session.post.call_args.args[0].endswith("/dns/retrieve/example.com")
+    assert [r.id for r in index[("example.com", "A")]] == ["123"]
+    assert [r.id for r in index[("www.example.com", "A")]] == ["456"]
+    assert [r.id for r in index[("example.com", "AAAA")]] == ["789"]
+
+
+async def test_get_all_records_treats_no_records_as_empty() -> None:
+    session = _make_session(_mock_response({"status": "ERROR", "message": "No records found"}))
+    assert await _client(session).get_all_records("example.com") == []
+
+
 @pytest.mark.parametrize("subdomain", ["", "www"])
 async def test_create_record_paths(subdomain: str) -> None:
     session = _make_session(_mock_response({"status": "SUCCESS", "id": "789"}))
@@ -175,6 +249,61 @@ async def test_get_domain_info(domains: list[dict[str, str]], expected_found: bo
         assert info.auto_renew is True
 
 
+def _domain_page(names: list[str]) -> dict:
+    return {
+        "status": "SUCCESS",
+        "domains": [{"domain": name, "status": "ACTIVE", "expireDate": "", "whoisPrivacy": "0"} for name in names],
+    }
+
+
+def _paged_session(pages: list[dict]) -> MagicMock:
+    session = MagicMock(spec=aiohttp.ClientSession)
+    contexts = []
+    for page in pages:
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=_mock_response(page))
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(ctx)
+    session.post.side_effect = contexts
+    return session
+
+
+@pytest.mark.parametrize(
+    ("target", "expected_starts"),
+    [
+        ("d5.com", ["0"]),  # found on the first page: later pages are never requested
+        ("d1500.com", ["0", "1000"]),
+        ("missing.com", ["0", "1000"]),  # short final page ends the scan
+    ],
+)
+async def test_get_domain_info_paginates_and_stops_early(target: str, expected_starts: list[str]) -> None:
+    session = _paged_session(
+        [
+            _domain_page([f"d{i}.com" for i in range(1000)]),
+            _domain_page([f"d{i}.com" for i in range(1000, 1600)]),
+        ]
+    )
+    info = await _client(session).get_domain_info(target)
+
+    assert (info is not None) is (target != "missing.com")
+    assert [call.kwargs["json"]["start"] for call in session.post.call_args_list] == expected_starts
+
+
+async def test_iter_domains_walks_every_page() -> None:
+    session = _paged_session(
+        [
+            _domain_page([f"d{i}.com" for i in range(1000)]),
+            _domain_page([f"d{i}.com" for i in range(1000, 2000)]),
+            _domain_page([]),
+        ]
+    )
+    domains = [info.domain async for info in _client(session).iter_domains()]
+
+    assert len(domains) == 2000
+    assert domains[-1] == "d1999.com"
+    assert session.post.call_count == 3
+
+
 async def test_request_passes_timeout() -> None:
     session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
     await _client(session).ping()
@@ -184,6 +313,34 @@ async def test_request_passes_timeout() -> None:
     assert timeout.total == API_REQUEST_TIMEOUT
 
 
+async def test_request_limits_concurrent_requests() -> None:
+    in_flight = 0
+    peak = 0
+    response = _mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"})
+
+    async def _enter(*_: object) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        return response
+
+    async def _exit(*_: object) -> bool:
+        nonlocal in_flight
+        in_flight -= 1
+        return False
+
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(side_effect=_enter)
+    ctx.__aexit__ = AsyncMock(side_effect=_exit)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.post.return_value = ctx
+    client = PorkbunClient(session, API_KEY, SECRET_KEY, max_concurrent_requests=2)
+
+    assert await asyncio.gather(*(client.ping() for _ in range(5))) == ["1.2.3.4"] * 5
+    assert peak == 2
+
+
 async def test_request_retries_on_connection_error_then_succeeds() -> None:
     response = _mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"})
     success_ctx = MagicMock()
@@ -231,6 +388,28 @@ async def test_request_retries_on_http_503_then_succeeds() -> None:
     assert sleep_mock.await_count == 1
 
 
+async def test_request_retries_drawn_from_shared_budget() -> None:
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.post.side_effect = aiohttp.ClientConnectionError("Connection reset")
+    client = _client(session)
+    budget = RetryBudget(ratio=0.0, minimum=1)
+
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()),
+        patch("custom_components.porkbun_ddns.api.secrets.randbelow", return_value=0),
+    ):
+        # The only retry in the budget is spent; the second failure surfaces as-is.
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.ping(budget=budget)
+        assert session.post.call_count == 2
+        # Later requests in the same cycle fail fast without being sent.
+        with pytest.raises(PorkbunRetryBudgetError):
+            await client.get_all_records("example.com", budget=budget)
+
+    assert session.post.call_count == 2
+    assert client.endpoint_stats()["dns/retrieve"]["failure_causes"] == {"retry_budget": 1}
+
+
 async def test_request_timeout_raises_after_retries() -> None:
     session = MagicMock(spec=aiohttp.ClientSession)
     ctx = MagicMock()
@@ -249,6 +428,121 @@ async def test_request_timeout_raises_after_retries() -> None:
     assert sleep_mock.await_count == 2
 
 
+async def test_request_metrics_per_endpoint() -> None:
+    error_response = _mock_response({"status": "ERROR", "message": "Service temporarily unavailable"}, status=503)
+    success_response = _mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"})
+    success_response.content_length = 512
+    contexts = []
+    for response in (error_response, success_response):
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=response)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(ctx)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.post.side_effect = [*contexts, aiohttp.ClientConnectionError("Connection reset"), TimeoutError()]
+    client = _client(session)
+
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()),
+        patch("custom_components.porkbun_ddns.api.secrets.randbelow", return_value=0),
+        patch("custom_components.porkbun_ddns.api.API_REQUEST_MAX_ATTEMPTS", 2),
+    ):
+        assert await client.ping() == "1.2.3.4"
+        with pytest.raises(TimeoutError):
+            await client.get_all_records("example.com")
+
+    stats = client.endpoint_stats()
+    assert list(stats) == ["dns/retrieve", "ping"]
+    ping = stats["ping"]
+    assert (ping["calls"], ping["failures"]) == (1, 0)
+    assert ping["retry_causes"] == {"http_503": 1}
+    assert ping["attempts"]["buckets"]["2"] == 1
+    assert ping["latency_seconds"]["count"] == 2
+    assert ping["response_bytes"]["count"] == 1
+    assert ping["response_bytes"]["buckets"]["1024"] == 1
+    zone = stats["dns/retrieve"]
+    assert (zone["calls"], zone["failures"]) == (1, 1)
+    assert zone["retry_causes"] == {"connection": 1}
+    assert zone["failure_causes"] == {"timeout": 1}
+    assert zone["latency_seconds"]["count"] == 0
+
+
+async def test_request_timeout_and_backoff_follow_observed_latency() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    client = _client(session)
+    assert client.request_timeout("ping") == API_REQUEST_TIMEOUT
+    assert client.retry_delay("ping", 1) == API_REQUEST_RETRY_BASE
+
+    samples = iter(x for _ in range(5) for x in (100.0, 100.1, 100.2))
+    with patch("custom_components.porkbun_ddns.api.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: next(samples)
+        for _ in range(5):
+            await client.ping()
+
+    # A fast, steady endpoint fails over sooner than the fixed defaults.
+    assert client.request_timeout("ping") == API_REQUEST_TIMEOUT_MIN
+    assert client.retry_delay("ping", 2) == 2 * API_REQUEST_RETRY_BASE_MIN
+    assert session.post.call_args.kwargs["timeout"].total == API_REQUEST_TIMEOUT_MIN
+
+    session.post.side_effect = TimeoutError()
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()) as sleep_mock,
+        patch("custom_components.porkbun_ddns.api.secrets.randbelow", return_value=0),
+        pytest.raises(TimeoutError),
+    ):
+        await client.ping()
+
+    # Each timeout doubles the next attempt's allowance, like TCP's retransmission timer.
+    timeouts = [call.kwargs["timeout"].total for call in session.post.call_args_list[-3:]]
+    assert timeouts == [API_REQUEST_TIMEOUT_MIN, 2 * API_REQUEST_TIMEOUT_MIN, 4 * API_REQUEST_TIMEOUT_MIN]
+    assert [call.args[0] for call in sleep_mock.await_args_list] == [API_REQUEST_RETRY_BASE_MIN, 1.0]
+    assert client.request_timeout("ping") == API_REQUEST_TIMEOUT_MAX
+
+
+async def test_endpoint_stats_report_recent_latency() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    client = _client(session)
+
+    # One slow request, then three fast ones push it out of a three-sample window.
+    samples = iter(x for elapsed in (5.0, 0.5, 0.5, 0.25) for x in (100.0, 100.0 + elapsed, 100.0 + elapsed))
+    with (
+        patch("custom_components.porkbun_ddns.api.time") as mock_time,
+        patch("custom_components.porkbun_ddns.api.API_LATENCY_WINDOW", 3),
+    ):
+        mock_time.monotonic.side_effect = lambda: next(samples)
+        for _ in range(4):
+            await client.ping()
+
+    ping = client.endpoint_stats()["ping"]
+    assert ping["recent_latency_seconds"] == {"p50": 0.5, "p95": 0.5}
+    assert ping["latency_seconds"]["sum"] > 5
+
+
+async def test_ipv6_backoff_uses_ipv6_latency() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    ipv6_session = MagicMock(spec=aiohttp.ClientSession)
+    ipv6_session.post.side_effect = TimeoutError()
+    client = PorkbunClient(session, API_KEY, SECRET_KEY, ipv6_session=ipv6_session)
+
+    samples = iter(x for _ in range(5) for x in (100.0, 100.1, 100.2))
+    with patch("custom_components.porkbun_ddns.api.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: next(samples)
+        for _ in range(5):
+            await client.ping()
+
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()) as sleep_mock,
+        patch("custom_components.porkbun_ddns.api.secrets.randbelow", return_value=0),
+        patch("custom_components.porkbun_ddns.api.API_REQUEST_MAX_ATTEMPTS", 2),
+        pytest.raises(TimeoutError),
+    ):
+        await client.ping_ipv6()
+
+    # The fast IPv4 path must not shorten the backoff for the unmeasured IPv6 path.
+    assert client.retry_delay("ping", 1) == API_REQUEST_RETRY_BASE_MIN
+    assert [call.args[0] for call in sleep_mock.await_args_list] == [API_REQUEST_RETRY_BASE]
+
+
 @pytest.mark.parametrize(
     ("json_value", "text"),
     [
@@ -292,3 +586,188 @@ async def test_request_retries_on_null_body_5xx_then_succeeds() -> None:
 
     assert session.post.call_count == 2
     assert sleep_mock.await_count == 1
+
+
+async def test_request_honours_retry_after_on_429() -> None:
+    limited_response = _mock_response({"status": "ERROR", "message": "Rate limit exceeded"}, status=429)
+    limited_response.headers = {"Retry-After": "20"}
+    limited_ctx = MagicMock()
+    limited_ctx.__aenter__ = AsyncMock(return_value=limited_response)
+    limited_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    success_ctx = MagicMock()
+    success_ctx.__aenter__ = AsyncMock(return_value=_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    success_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.post.side_effect = [limited_ctx, success_ctx]
+    client = _client(session)
+
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()) as sleep_mock,
+        patch("custom_components.porkbun_ddns.api.secrets.randbelow", return_value=0),
+    ):
+        assert await client.ping() == "1.2.3.4"
+
+    assert session.post.call_count == 2
+    delays = [call.args[0] for call in sleep_mock.await_args_list]
+    assert delays[0] == API_REQUEST_RETRY_BASE
+    assert max(delays) == pytest.approx(20, abs=0.5)
+
+
+async def test_request_rate_limits_shared_client() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    client = PorkbunClient(session, API_KEY, SECRET_KEY, rate_limit=1.0, rate_burst=2)
+
+    with patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()) as sleep_mock:
+        await asyncio.gather(*(client.ping() for _ in range(4)))
+
+    assert session.post.call_count == 4
+    # Two requests fit in the burst; the rest wait their turn at one per second.
+    assert sorted(round(call.args[0]) for call in sleep_mock.await_args_list) == [1, 2]
+
+
+async def test_request_circuit_opens_and_probes() -> None:
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.post.side_effect = aiohttp.ClientConnectionError("Connection refused")
+    client = _client(session)
+
+    with (
+        patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()),
+        patch("custom_components.porkbun_ddns.resilience.time.monotonic", return_value=1000.0) as monotonic,
+    ):
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.ping()
+        # The fifth consecutive failure opens the circuit, so the last retry is never sent.
+        with pytest.raises(PorkbunCircuitOpenError, match="next attempt in 60s"):
+            await client.ping()
+        assert session.post.call_count == 5
+        assert client.circuit_state == "open"
+
+        with pytest.raises(PorkbunCircuitOpenError):
+            await client.ping()
+        assert session.post.call_count == 5
+
+        # After the reset timeout a single probe goes through and closes the circuit.
+        monotonic.return_value = 1060.0
+        session.post.side_effect = None
+        session.post.return_value = _make_session(
+            _mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"})
+        ).post.return_value
+        assert await client.ping() == "1.2.3.4"
+        assert client.circuit_state == "closed"
+
+
+async def test_request_http_5xx_counts_against_circuit() -> None:
+    session = _make_session(_mock_response({"status": "ERROR", "message": "Bad gateway"}, status=502))
+    client = _client(session)
+
+    with patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(PorkbunApiError, match="Bad gateway"):
+            await client.ping()
+        with pytest.raises(PorkbunCircuitOpenError):
+            await client.ping()
+
+    assert session.post.call_count == 5
+
+
+async def test_warm_up_opens_connection_to_api_host() -> None:
+    session = _make_session(_mock_response({}))
+    session.head.return_value = session.post.return_value
+    await _client(session).warm_up()
+
+    session.head.assert_called_once()
+    assert session.head.call_args.args[0] == "https://api-ipv4.porkbun.com/api/json/v3"
+    session.post.assert_not_called()
+
+
+async def test_warm_up_is_coalesced_per_client() -> None:
+    session = _make_session(_mock_response({}))
+    session.head.return_value = session.post.return_value
+    client = _client(session)
+
+    with patch("custom_components.porkbun_ddns.api.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        await client.warm_up()
+        await client.warm_up()
+        assert session.head.call_count == 1
+
+        mock_time.monotonic.return_value = 1000.0 + API_WARM_UP_WINDOW
+        await client.warm_up()
+        assert session.head.call_count == 2
+
+
+async def test_warm_up_is_best_effort() -> None:
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.head.side_effect = aiohttp.ClientConnectionError("Connection refused")
+    client = _client(session)
+
+    await client.warm_up()
+
+    # Warm-up failures don't count against the circuit, and an open circuit skips warm-up entirely.
+    assert client.circuit_state == "closed"
+    session.post.side_effect = aiohttp.ClientConnectionError("Connection refused")
+    with patch("custom_components.porkbun_ddns.api.asyncio.sleep", new=AsyncMock()):
+        for _ in range(2):
+            with pytest.raises((aiohttp.ClientConnectionError, PorkbunCircuitOpenError)):
+                await client.ping()
+    assert client.circuit_state == "open"
+    session.head.reset_mock()
+    await client.warm_up()
+    session.head.assert_not_called()
+
+
+def _stalled_ctx() -> MagicMock:
+    async def _never(*_: object) -> MagicMock:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(side_effect=_never)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return ctx
+
+
+async def test_hedged_request_uses_first_answer_and_cancels_loser() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    answer = session.post.return_value
+    stalled = _stalled_ctx()
+    session.post.side_effect = [stalled, answer]
+    client = _client(session)
+
+    with patch("custom_components.porkbun_ddns.api.API_HEDGE_DEFAULT_DELAY", 0.01):
+        assert await client.ping(hedge=True) == "1.2.3.4"
+        await asyncio.sleep(0)
+
+    assert session.post.call_count == 2
+    # The stalled request was cancelled while entering its context, so it never exits normally.
+    stalled.__aexit__.assert_not_awaited()
+
+
+async def test_hedged_request_not_sent_when_first_answers_in_time() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    assert await _client(session).ping(hedge=True) == "1.2.3.4"
+    assert session.post.call_count == 1
+
+
+async def test_hedged_request_raises_when_every_attempt_fails() -> None:
+    session = _make_session(_mock_response({"status": "ERROR", "message": "Domain not opted in"}))
+    with pytest.raises(PorkbunApiError, match="Domain not opted in"):
+        await _client(session).get_all_records("example.com", hedge=True)
+
+
+async def test_hedge_delay_tracks_observed_p95() -> None:
+    session = _make_session(_mock_response({"status": "SUCCESS", "yourIp": "1.2.3.4"}))
+    client = _client(session)
+    assert client.hedge_delay("ping") == API_HEDGE_DEFAULT_DELAY
+
+    # Each request reads the clock when sent, when the response arrives (metrics) and when it is parsed.
+    samples = iter(x for i in range(API_HEDGE_MIN_SAMPLES) for x in (100.0, 100.1, 100.0 + 0.4 + i * 0.01))
+    with patch("custom_components.porkbun_ddns.api.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: next(samples)
+        for _ in range(API_HEDGE_MIN_SAMPLES):
+            await client.ping()
+
+    assert client.hedge_delay("ping") == pytest.approx(0.49)
+    # Endpoints are tracked without their per-domain arguments.
+    assert client.hedge_delay("dns/retrieve/example.com") == API_HEDGE_DEFAULT_DELAY
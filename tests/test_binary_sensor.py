@@ -32,14 +32,16 @@ async def test_health_sensor_states(
     if inject_failure:
         call_count = 0
 
-        async def _get_records(domain: str, record_type: str, subdomain: str = "") -> list[object]:
+        async def _create_record(
+            domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+        ) -> str:
             nonlocal call_count
             call_count += 1
             if call_count == 2:
                 raise PorkbunApiError("DNS error")
-            return []
+            return "12345"
 
-        mock_porkbun_client.get_records.side_effect = _get_records
+        mock_porkbun_client.create_record.side_effect = _create_record
 
     entry = make_entry(hass, **{CONF_SUBDOMAINS: ["www"]})
     await setup_entry(hass, entry)
@@ -49,6 +51,7 @@ async def test_health_sensor_states(
     assert state.state == expected_state
     assert state.attributes["summary"].startswith(summary_prefix)
     assert state.attributes["managed_subdomains"] == ["@", "www"]
+    assert state.attributes["api_circuit"] == "closed"
     assert len(state.attributes["record_status"]) == 2
     assert ("failed_records" in state.attributes) is has_failed_records
 
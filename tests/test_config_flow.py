@@ -14,17 +14,27 @@ from homeassistant.data_entry_flow import FlowResultType, InvalidData
 from custom_components.porkbun_ddns.api import PorkbunAuthError
 from custom_components.porkbun_ddns.config_flow import CONF_IGNORE_VERIFICATION, _parse_subdomains
 from custom_components.porkbun_ddns.const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
     CONF_DOMAIN,
+    CONF_DOMAIN_INFO_INTERVAL,
     CONF_FAILURE_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
+    CONF_IP_SOURCE_ENTITY,
     CONF_IPV4,
     CONF_IPV6,
     CONF_MANAGE_ROOT,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_SECRET_KEY,
     CONF_STARTUP_DELAY,
     CONF_SUBDOMAINS,
     CONF_UPDATE_INTERVAL,
+    CONF_WARM_UP_CONNECTION,
+    DEFAULT_DOMAIN_INFO_INTERVAL,
     DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_STARTUP_DELAY,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
@@ -302,8 +312,14 @@ async def test_options_flow_updates_and_reloads(
         CONF_IPV4: True,
         CONF_IPV6: True,
         CONF_UPDATE_INTERVAL: 600,
+        CONF_ADAPTIVE_POLLING: False,
+        CONF_MAX_UPDATE_INTERVAL: DEFAULT_MAX_UPDATE_INTERVAL,
         CONF_STARTUP_DELAY: 300,
         CONF_FAILURE_THRESHOLD: 5,
+        CONF_MAX_CONCURRENT_UPDATES: DEFAULT_MAX_CONCURRENT_UPDATES,
+        CONF_DOMAIN_INFO_INTERVAL: DEFAULT_DOMAIN_INFO_INTERVAL,
+        CONF_HEDGE_REQUESTS: False,
+        CONF_WARM_UP_CONNECTION: False,
     }
 
     await hass.async_block_till_done()
@@ -371,6 +387,37 @@ async def test_domain_step_rejects_no_records_combination(hass: HomeAssistant) -
     assert schema_defaults[CONF_DOMAIN] == MOCK_DOMAIN
 
 
+async def test_options_flow_sets_and_clears_ip_source_entity(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    hass.states.async_set("sensor.wan_ip", MOCK_IPV4)
+    entry = make_entry(hass, subdomains=["www"])
+    await setup_entry(hass, entry)
+    user_input = {
+        CONF_SUBDOMAINS: "www",
+        CONF_IPV4: True,
+        CONF_IPV6: False,
+        CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+        CONF_STARTUP_DELAY: DEFAULT_STARTUP_DELAY,
+        CONF_FAILURE_THRESHOLD: DEFAULT_FAILURE_THRESHOLD,
+    }
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**user_input, CONF_IP_SOURCE_ENTITY: "sensor.wan_ip"}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_IP_SOURCE_ENTITY] == "sensor.wan_ip"
+    await hass.async_block_till_done()
+    assert entry.runtime_data.ip_source_entity == "sensor.wan_ip"
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], user_input)
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert CONF_IP_SOURCE_ENTITY not in result["data"]
+
+
 async def test_options_flow_accepts_manage_root_disabled_with_subdomains(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
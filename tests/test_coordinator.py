@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from unittest.mock import ANY, AsyncMock, patch
 
 import aiohttp
 import pytest
@@ -11,11 +14,24 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.porkbun_ddns.api import DnsRecord, PorkbunApiError, PorkbunAuthError
+from custom_components.porkbun_ddns.api import (
+    DnsRecord,
+    DomainInfo,
+    PorkbunApiError,
+    PorkbunAuthError,
+    PorkbunCircuitOpenError,
+    PorkbunRetryBudgetError,
+)
 from custom_components.porkbun_ddns.const import (
+    API_MAX_CONCURRENT_REQUESTS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DOMAIN_INFO_INTERVAL,
     CONF_FAILURE_THRESHOLD,
+    CONF_HEDGE_REQUESTS,
     CONF_IPV6,
     CONF_MANAGE_ROOT,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_STARTUP_DELAY,
     CONF_SUBDOMAINS,
     DATA_FORCE_IMMEDIATE_REFRESH,
@@ -25,6 +41,14 @@ from custom_components.porkbun_ddns.coordinator import PorkbunDdnsCoordinator
 
 from .conftest import MOCK_DOMAIN, MOCK_IPV4, MOCK_IPV6, make_entry
 
+DOMAIN_INFO = DomainInfo(
+    domain=MOCK_DOMAIN,
+    status="ACTIVE",
+    expire_date="2026-02-18 23:59:59",
+    whois_privacy=True,
+    auto_renew=True,
+)
+
 
 @pytest.mark.parametrize(
     ("existing_ip", "expected_create", "expected_edit", "expected_current"),
@@ -43,9 +67,11 @@ async def test_record_sync_paths(
     expected_current: str,
 ) -> None:
     if existing_ip is not None:
-        mock_porkbun_client.get_records.return_value = [
-            DnsRecord(id="123", name=MOCK_DOMAIN, record_type="A", content=existing_ip, ttl="600"),
-        ]
+        mock_porkbun_client.get_record_index.return_value = {
+            (MOCK_DOMAIN, "A"): [
+                DnsRecord(id="123", name=MOCK_DOMAIN, record_type="A", content=existing_ip, ttl="600"),
+            ],
+        }
 
     data = await PorkbunDdnsCoordinator(hass, make_entry(hass))._async_update_data()
 
@@ -163,12 +189,47 @@ async def test_coordinator_ipv6_paths(
 
 async def test_coordinator_domain_info_fetch_error(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
     mock_porkbun_client.get_domain_info.side_effect = PorkbunApiError("Not found")
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass))
 
-    data = await PorkbunDdnsCoordinator(hass, make_entry(hass))._async_update_data()
+    data = await coordinator._async_update_data()
+    await hass.async_block_till_done()
 
     assert data.domain_info is None
     assert data.public_ipv4 == MOCK_IPV4
 
+    # A failed refresh is retried on the next cycle rather than waiting a full interval.
+    mock_porkbun_client.get_domain_info.side_effect = None
+    mock_porkbun_client.get_domain_info.return_value = DOMAIN_INFO
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+    assert coordinator.data.domain_info == DOMAIN_INFO
+
+
+async def test_domain_info_refreshed_on_its_own_interval(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    freezer,
+) -> None:
+    """Registration info is fetched once per domain info interval, not every DDNS cycle."""
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    mock_porkbun_client.get_domain_info.return_value = DOMAIN_INFO
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_DOMAIN_INFO_INTERVAL: 3600}))
+
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+    assert coordinator.data.domain_info == DOMAIN_INFO
+
+    freezer.move_to("2026-02-18 12:30:00+00:00")
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.get_domain_info.await_count == 1
+    assert coordinator.data.domain_info == DOMAIN_INFO
+
+    freezer.move_to("2026-02-18 13:00:01+00:00")
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.get_domain_info.await_count == 2
+
 
 async def test_coordinator_issue_lifecycle(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
     mock_porkbun_client.ping.side_effect = [PorkbunApiError("API disabled"), MOCK_IPV4]
@@ -189,11 +250,85 @@ async def test_coordinator_issue_lifecycle(hass: HomeAssistant, mock_porkbun_cli
     assert issue_reg.async_get_issue(DOMAIN, issue_id) is None
 
 
+@pytest.mark.parametrize("error_cls", [PorkbunCircuitOpenError, PorkbunRetryBudgetError])
+async def test_coordinator_fail_fast_errors_raise_no_issue(
+    hass: HomeAssistant, mock_porkbun_client: AsyncMock, error_cls: type[PorkbunApiError]
+) -> None:
+    """A struggling API is reported on the records but is not an API-access repair issue."""
+    entry = make_entry(hass, **{CONF_FAILURE_THRESHOLD: 1})
+    coordinator = PorkbunDdnsCoordinator(hass, entry)
+    await coordinator._async_update_data()
+
+    mock_porkbun_client.ping.side_effect = error_cls("Porkbun API unavailable")
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert ir.async_get(hass).async_get_issue(DOMAIN, f"api_access_{MOCK_DOMAIN}") is None
+    assert {state.error for state in coordinator.data.records.values()} == {"Porkbun API unavailable"}
+
+
+async def test_cycle_traces_record_phases(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    """Each cycle keeps a span tree of its phases; only the most recent cycles are kept."""
+    mock_porkbun_client.get_domain_info.return_value = DOMAIN_INFO
+    with patch("custom_components.porkbun_ddns.coordinator.CYCLE_TRACE_HISTORY", 2):
+        coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_SUBDOMAINS: ["www"]}))
+
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+
+    (trace,) = coordinator.cycle_traces
+    assert trace["duration_ms"] is not None
+    # Domain info runs in the background, so its span may land anywhere after reconcile.
+    names = [span["name"] for span in trace["children"]]
+    assert "domain_info" in names
+    names.remove("domain_info")
+    assert names == ["startup_delay", "ipv4", "zone_fetch", "reconcile", "issue_registry", "save_state"]
+    records = trace["children"][3]["children"]
+    assert [(span["attrs"], [child["name"] for child in span["children"]]) for span in records] == [
+        ({"record": "@_A", "result": "created"}, ["create"]),
+        ({"record": "www_A", "result": "created"}, ["create"]),
+    ]
+
+    mock_porkbun_client.ping.side_effect = PorkbunApiError("Server error")
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    traces = coordinator.cycle_traces
+    assert len(traces) == 2
+    assert traces[-1]["error"] == "Server error"
+    assert traces[-1]["children"][1] == {
+        "name": "ipv4",
+        "offset_ms": traces[-1]["children"][1]["offset_ms"],
+        "duration_ms": traces[-1]["children"][1]["duration_ms"],
+        "error": "Server error",
+    }
+
+
+async def test_cycle_shares_one_retry_budget(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_SUBDOMAINS: ["www"]}))
+    await coordinator._async_update_data()
+
+    budgets = {
+        id(call.kwargs["budget"])
+        for mock in (
+            mock_porkbun_client.ping,
+            mock_porkbun_client.get_record_index,
+            mock_porkbun_client.create_record,
+        )
+        for call in mock.call_args_list
+    }
+    assert len(budgets) == 1
+
+    await coordinator._async_update_data()
+    # Each cycle starts with a fresh budget.
+    assert id(mock_porkbun_client.ping.call_args.kwargs["budget"]) not in budgets
+
+
 async def test_coordinator_record_update_failure_marks_record(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
 ) -> None:
-    mock_porkbun_client.get_records.side_effect = PorkbunApiError("Record error")
+    mock_porkbun_client.create_record.side_effect = PorkbunApiError("Record error")
 
     record = (await PorkbunDdnsCoordinator(hass, make_entry(hass))._async_update_data()).records["@_A"]
     assert record.ok is False
@@ -223,11 +358,11 @@ async def test_coordinator_record_failure_escalates_and_recovers(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
 ) -> None:
-    mock_porkbun_client.get_records.side_effect = [
+    mock_porkbun_client.create_record.side_effect = [
         PorkbunApiError("Record error"),
         PorkbunApiError("Record error"),
         PorkbunApiError("Record error"),
-        [],
+        "12345",
     ]
     coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass))
 
@@ -242,25 +377,41 @@ async def test_coordinator_record_failure_escalates_and_recovers(
     assert coordinator.data.records["@_A"].consecutive_failures == 0
 
 
-async def test_get_ipv6_success(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.text = AsyncMock(return_value=MOCK_IPV6)
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
+async def test_get_ipv6_uses_porkbun_ipv6_ping(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    assert await PorkbunDdnsCoordinator(hass, make_entry(hass))._get_ipv6() == MOCK_IPV6
+    mock_porkbun_client.ping_ipv6.assert_awaited_once()
+
+
+@pytest.mark.parametrize("error", [aiohttp.ClientError("No IPv6"), PorkbunApiError("Not IPv6")])
+async def test_get_ipv6_failure(hass: HomeAssistant, mock_porkbun_client: AsyncMock, error: Exception) -> None:
+    mock_porkbun_client.ping_ipv6.side_effect = error
 
-    session = MagicMock()
-    session.get = MagicMock(return_value=mock_response)
+    assert await PorkbunDdnsCoordinator(hass, make_entry(hass))._get_ipv6() is None
 
-    result = await PorkbunDdnsCoordinator(hass, make_entry(hass))._get_ipv6(session)
-    assert result == MOCK_IPV6
 
+async def test_ipv4_and_ipv6_detected_concurrently(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    started: list[str] = []
+    both_started = asyncio.Event()
 
-async def test_get_ipv6_failure(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
-    session = MagicMock()
-    session.get = MagicMock(side_effect=aiohttp.ClientError("No IPv6"))
+    def _lookup(family: str, address: str) -> Callable[..., Awaitable[str]]:
+        async def _detect(**_: object) -> str:
+            started.append(family)
+            if len(started) == 2:
+                both_started.set()
+            # Neither lookup finishes until the other has started.
+            await both_started.wait()
+            return address
 
-    assert await PorkbunDdnsCoordinator(hass, make_entry(hass))._get_ipv6(session) is None
+        return _detect
+
+    mock_porkbun_client.ping.side_effect = _lookup("A", MOCK_IPV4)
+    mock_porkbun_client.ping_ipv6.side_effect = _lookup("AAAA", MOCK_IPV6)
+
+    data = await PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_IPV6: True}))._async_update_data()
+
+    assert sorted(started) == ["A", "AAAA"]
+    assert (data.public_ipv4, data.public_ipv6) == (MOCK_IPV4, MOCK_IPV6)
+    assert set(data.records) == {"@_A", "@_AAAA"}
 
 
 async def test_graceful_degradation_returns_stale_data(
@@ -284,20 +435,231 @@ async def test_graceful_degradation_returns_stale_data(
     assert coordinator._consecutive_update_failures == 1
 
 
+async def test_update_interval_adapts_to_ip_stability(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    freezer,
+) -> None:
+    """Polling backs off while the IP holds and returns to the floor after a change or failure."""
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    entry = make_entry(hass, **{CONF_ADAPTIVE_POLLING: True, CONF_MAX_UPDATE_INTERVAL: 3600})
+    coordinator = PorkbunDdnsCoordinator(hass, entry)
+
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+    freezer.tick(timedelta(hours=2))
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(minutes=12)
+
+    freezer.tick(timedelta(days=1))
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=3600)
+
+    mock_porkbun_client.ping.side_effect = TimeoutError()
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+    # The IP held through the failure, so polling backs off again straight away.
+    mock_porkbun_client.ping.side_effect = None
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=3600)
+
+    mock_porkbun_client.ping.return_value = "5.6.7.8"
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+
+async def test_update_interval_fixed_by_default(hass: HomeAssistant, mock_porkbun_client: AsyncMock, freezer) -> None:
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    # A maximum alone doesn't turn adaptive polling on.
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_MAX_UPDATE_INTERVAL: 3600}))
+
+    await coordinator._async_update_data()
+    freezer.tick(timedelta(days=1))
+    await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+
+async def test_first_update_after_startup_delay_spreads_entries(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    freezer,
+) -> None:
+    """Entries started together wait once for an offset fixed by their ID, then poll every interval."""
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    entries = [make_entry(hass, domain_name=f"d{i}.com", **{CONF_STARTUP_DELAY: 300}) for i in range(20)]
+    coordinators = [PorkbunDdnsCoordinator(hass, entry) for entry in entries]
+
+    freezer.tick(timedelta(seconds=300))
+    intervals: list[timedelta] = []
+    for coordinator in coordinators:
+        await coordinator._async_update_data()
+        assert coordinator.update_interval is not None
+        intervals.append(coordinator.update_interval)
+    assert all(timedelta(seconds=300) <= interval < timedelta(seconds=600) for interval in intervals)
+    assert len(set(intervals)) > len(intervals) // 2
+
+    again = PorkbunDdnsCoordinator(hass, entries[0])
+    freezer.tick(timedelta(seconds=300))
+    await again._async_update_data()
+    assert again.update_interval == intervals[0]
+
+    await coordinators[0]._async_update_data()
+    assert coordinators[0].update_interval == timedelta(seconds=300)
+
+
 async def test_skip_fetch_when_ip_unchanged(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
 ) -> None:
-    """When IP hasn't changed, skip_fetch avoids redundant get_records calls."""
+    """When IP hasn't changed, skip_fetch avoids redundant zone fetches."""
     coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass))
 
-    # First call — IP is new, get_records is called
+    # First call — IP is new, the zone is fetched
     await coordinator._async_update_data()
-    first_get_records_count = mock_porkbun_client.get_records.call_count
+    first_fetch_count = mock_porkbun_client.get_record_index.call_count
 
-    # Second call — same IP, get_records should be skipped
+    # Second call — same IP, the zone fetch should be skipped
     await coordinator._async_update_data()
-    assert mock_porkbun_client.get_records.call_count == first_get_records_count
+    assert mock_porkbun_client.get_record_index.call_count == first_fetch_count
+
+
+@pytest.mark.parametrize("hedge", [False, True])
+async def test_hedge_option_applies_to_reads(hass: HomeAssistant, mock_porkbun_client: AsyncMock, hedge: bool) -> None:
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_HEDGE_REQUESTS: hedge}))
+    await coordinator._async_update_data()
+
+    mock_porkbun_client.ping.assert_awaited_once_with(hedge=hedge, budget=ANY)
+    mock_porkbun_client.get_record_index.assert_awaited_once_with(MOCK_DOMAIN, hedge=hedge, budget=ANY)
+
+
+async def test_zone_fetched_once_per_cycle(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    """All records are resolved from a single whole-zone fetch, never per record."""
+    subdomains = [f"host{i}" for i in range(40)]
+    mock_porkbun_client.get_record_index.return_value = {
+        (f"host0.{MOCK_DOMAIN}", "A"): [
+            DnsRecord(id="1", name=f"host0.{MOCK_DOMAIN}", record_type="A", content=MOCK_IPV4, ttl="600"),
+        ],
+        (f"host1.{MOCK_DOMAIN}", "A"): [
+            DnsRecord(id="2", name=f"host1.{MOCK_DOMAIN}", record_type="A", content="9.9.9.9", ttl="600"),
+        ],
+    }
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_SUBDOMAINS: subdomains}))
+
+    data = await coordinator._async_update_data()
+
+    assert mock_porkbun_client.get_record_index.call_count == 1
+    assert mock_porkbun_client.get_records.call_count == 0
+    assert mock_porkbun_client.edit_record_by_name_type.call_count == 1
+    assert mock_porkbun_client.create_record.call_count == 39  # apex + 38 missing subdomains
+    assert all(state.current_ip == MOCK_IPV4 for state in data.records.values())
+
+
+async def test_records_reconciled_concurrently_within_limit(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    """Record writes overlap, but never beyond the configured concurrency limit."""
+    in_flight = 0
+    peak = 0
+
+    async def _create_record(
+        domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+    ) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if subdomain == "bad":
+            raise PorkbunApiError("Record error")
+        return "12345"
+
+    mock_porkbun_client.create_record.side_effect = _create_record
+    entry = make_entry(hass, **{CONF_SUBDOMAINS: ["a", "bad", "c", "d", "e"], CONF_MAX_CONCURRENT_UPDATES: 3})
+
+    data = await PorkbunDdnsCoordinator(hass, entry)._async_update_data()
+
+    assert peak == 3
+    assert list(data.records) == ["@_A", "a_A", "bad_A", "c_A", "d_A", "e_A"]
+    assert data.records["bad_A"].ok is False
+    assert all(state.ok for key, state in data.records.items() if key != "bad_A")
+
+
+async def test_concurrency_capped_at_account_request_slots(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    """Older entries saved with a higher limit can't exceed the account's request slots."""
+    in_flight = 0
+    peak = 0
+
+    async def _create_record(
+        domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+    ) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return "12345"
+
+    mock_porkbun_client.create_record.side_effect = _create_record
+    subdomains = [f"sub{i}" for i in range(10)]
+    entry = make_entry(hass, **{CONF_SUBDOMAINS: subdomains, CONF_MAX_CONCURRENT_UPDATES: 16})
+
+    await PorkbunDdnsCoordinator(hass, entry)._async_update_data()
+
+    assert peak == API_MAX_CONCURRENT_REQUESTS
+
+
+async def test_concurrent_record_logging_follows_target_order(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    """Log lines are emitted in record order even when later records finish first."""
+
+    async def _create_record(
+        domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+    ) -> str:
+        # The apex finishes last so unbuffered logging would print it last.
+        for _step in range(5 if not subdomain else 0):
+            await asyncio.sleep(0)
+        return "12345"
+
+    mock_porkbun_client.create_record.side_effect = _create_record
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass, **{CONF_SUBDOMAINS: ["www", "vpn"]}))
+
+    with patch("custom_components.porkbun_ddns.coordinator.LOGGER") as logger:
+        await coordinator._async_update_data()
+
+    created = [call.args[1] for call in logger.info.call_args_list if call.args[0].startswith("Creating")]
+    assert created == [MOCK_DOMAIN, f"www.{MOCK_DOMAIN}", f"vpn.{MOCK_DOMAIN}"]
+
+
+async def test_failed_write_is_retried_when_ip_unchanged(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+) -> None:
+    """A record whose write failed is re-fetched next cycle even though the IP is stable."""
+    mock_porkbun_client.get_record_index.return_value = {
+        (MOCK_DOMAIN, "A"): [DnsRecord(id="1", name=MOCK_DOMAIN, record_type="A", content="9.9.9.9", ttl="600")],
+    }
+    mock_porkbun_client.edit_record_by_name_type.side_effect = [PorkbunApiError("Edit failed"), None]
+    coordinator = PorkbunDdnsCoordinator(hass, make_entry(hass))
+
+    data = await coordinator._async_update_data()
+    assert data.records["@_A"].ok is False
+
+    data = await coordinator._async_update_data()
+    assert mock_porkbun_client.get_record_index.call_count == 2
+    assert data.records["@_A"].ok is True
+    assert data.records["@_A"].current_ip == MOCK_IPV4
 
 
 async def test_manage_root_disabled_skips_apex(
@@ -315,9 +677,7 @@ async def test_manage_root_disabled_skips_apex(
     create_call = mock_porkbun_client.create_record.call_args
     # create_record(self._domain, record_type, target_ip, subdomain, ttl) — subdomain is positional 4
     assert create_call.args[3] == "www"
-    # The apex (subdomain="") must never be queried or created.
-    for call in mock_porkbun_client.get_records.call_args_list:
-        assert call.args[2] != ""
+    # The apex (subdomain="") must never be created.
     for call in mock_porkbun_client.create_record.call_args_list:
         assert call.args[3] != ""
 
@@ -334,7 +694,7 @@ async def test_manage_root_disabled_with_no_subdomains_runs_cleanly(
 
     assert data.records == {}
     assert data.last_updated is not None
-    assert mock_porkbun_client.get_records.call_count == 0
+    assert mock_porkbun_client.get_record_index.call_count == 0
     assert mock_porkbun_client.create_record.call_count == 0
     assert mock_porkbun_client.edit_record_by_name_type.call_count == 0
 
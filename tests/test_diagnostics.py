@@ -30,6 +30,7 @@ async def test_diagnostics(hass: HomeAssistant, mock_porkbun_client: AsyncMock)
     assert result["options"][CONF_SUBDOMAINS] == ["www"]
     assert result["coordinator"]["domain"] == MOCK_DOMAIN
     assert result["coordinator"]["record_count"] >= 1
+    assert [cycle["name"] for cycle in result["cycles"]] == ["cycle"]
 
 
 async def test_diagnostics_includes_manage_root(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
@@ -40,3 +41,14 @@ async def test_diagnostics_includes_manage_root(hass: HomeAssistant, mock_porkbu
     result = await async_get_config_entry_diagnostics(hass, entry)
 
     assert result["options"][CONF_MANAGE_ROOT] is False
+
+
+async def test_diagnostics_includes_api_metrics(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    stats = {"ping": {"calls": 1, "failures": 0}}
+    mock_porkbun_client.endpoint_stats.return_value = stats
+    entry = make_entry(hass)
+    await setup_entry(hass, entry)
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["api"] == {"circuit": "closed", "endpoints": stats}
@@ -0,0 +1,143 @@
+"""Tests running the real API client against the local Porkbun stand-in."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncGenerator
+from contextlib import suppress
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from custom_components.porkbun_ddns.api import PorkbunApiError, PorkbunAuthError, PorkbunClient
+
+from .conftest import MOCK_API_KEY, MOCK_DOMAIN, MOCK_IPV4, MOCK_IPV6
+from .fake_api import LIST_ALL_PAGE_SIZE, FakePorkbunApi, Fault, fixed_latency
+
+WRONG_SECRET_KEY = "sk1_wrong"
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession]:
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _client(api: FakePorkbunApi, session: aiohttp.ClientSession, *, secret_key: str | None = None) -> PorkbunClient:
+    client = PorkbunClient(
+        session,
+        MOCK_API_KEY,
+        secret_key or api.secret_key,
+        api_base=api.base_url,
+        rate_limit=1000,
+        rate_burst=1000,
+        ipv6_session=session,
+        ipv6_api_base=api.ipv6_base_url,
+    )
+    # Retries back off for seconds; the fake answers instantly, so skip the wait.
+    client._sleep_before_retry = AsyncMock()  # type: ignore[method-assign]
+    return client
+
+
+async def test_ping_over_each_session(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+
+    assert await client.ping() == MOCK_IPV4
+    assert await client.ping_ipv6() == MOCK_IPV6
+
+
+async def test_record_round_trip(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+    fake_porkbun.add_record(MOCK_DOMAIN, "", "A", "9.9.9.9")
+
+    record_id = await client.create_record(MOCK_DOMAIN, "A", MOCK_IPV4, "www")
+    await client.edit_record_by_name_type(MOCK_DOMAIN, "A", MOCK_IPV4)
+
+    index = await client.get_record_index(MOCK_DOMAIN)
+    assert index[(MOCK_DOMAIN, "A")][0].content == MOCK_IPV4
+    assert index[(f"www.{MOCK_DOMAIN}", "A")][0].id == record_id
+    assert [r.content for r in await client.get_records(MOCK_DOMAIN, "A", "www")] == [MOCK_IPV4]
+
+
+async def test_unknown_domain_and_missing_record(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+
+    with pytest.raises(PorkbunApiError, match="not opted in"):
+        await client.get_all_records("other.com")
+    with pytest.raises(PorkbunApiError, match="Could not find"):
+        await client.edit_record_by_name_type(MOCK_DOMAIN, "A", MOCK_IPV4, "missing")
+
+
+async def test_wrong_secret_is_auth_error(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session, secret_key=WRONG_SECRET_KEY)
+
+    with pytest.raises(PorkbunAuthError):
+        await client.ping()
+    assert fake_porkbun.calls["ping"] == 1
+
+
+@pytest.mark.parametrize("fault", ["rate_limit", "server_error"])
+async def test_injected_fault_is_retried(
+    fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession, fault: Fault
+) -> None:
+    client = _client(fake_porkbun, session)
+    fake_porkbun.faults.retry_after = None
+    fake_porkbun.fail_next(fault)
+
+    assert await client.ping() == MOCK_IPV4
+    assert fake_porkbun.calls["ping"] == 2
+
+
+async def test_malformed_success_is_not_retried(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+    fake_porkbun.fail_next("malformed")
+
+    with pytest.raises(PorkbunApiError, match="Invalid API response"):
+        await client.ping()
+    assert fake_porkbun.calls["ping"] == 1
+
+
+async def test_faults_are_reproducible_for_a_seed(socket_enabled: None, session: aiohttp.ClientSession) -> None:
+    async def failed_pings(seed: int) -> int:
+        async with FakePorkbunApi(MOCK_API_KEY, "sk", seed=seed) as api:
+            api.faults.server_error_rate = 0.5
+            client = _client(api, session)
+            for _ in range(10):
+                # A ping can run out of attempts; what matters is that the same requests fail.
+                with suppress(PorkbunApiError):
+                    await client.ping()
+            return api.calls["ping"] - 10
+
+    assert await failed_pings(7) == await failed_pings(7)
+
+
+async def test_latency_is_injected(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+    fake_porkbun.faults.latency = fixed_latency(0.05)
+
+    started = time.monotonic()
+    await client.ping()
+
+    assert time.monotonic() - started >= 0.05
+
+
+async def test_domain_lookup_pages_list_all(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+    for i in range(LIST_ALL_PAGE_SIZE + 5):
+        fake_porkbun.add_domain(f"d{i}.com", api_access=False)
+
+    info = await client.get_domain_info(f"d{LIST_ALL_PAGE_SIZE + 2}.com")
+
+    assert info is not None
+    assert fake_porkbun.calls["domain/listAll"] == 2
+    assert await client.get_domain_info("absent.com") is None
+
+
+async def test_connections_are_reused(fake_porkbun: FakePorkbunApi, session: aiohttp.ClientSession) -> None:
+    client = _client(fake_porkbun, session)
+
+    for _ in range(5):
+        await client.ping()
+
+    assert len(fake_porkbun.connections) == 1
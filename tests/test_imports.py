@@ -0,0 +1,18 @@
+"""Tests for what loading the integration imports."""
+
+from __future__ import annotations
+
+from custom_components.porkbun_ddns import PLATFORMS
+
+from .conftest import import_times
+
+PACKAGE = "custom_components.porkbun_ddns"
+RUNTIME_MODULES = (PACKAGE, *(f"{PACKAGE}.{platform}" for platform in PLATFORMS))
+ON_DEMAND_MODULES = {f"{PACKAGE}.{name}" for name in ("config_flow", "repairs", "diagnostics")}
+
+
+def test_runtime_path_leaves_on_demand_modules_unloaded() -> None:
+    loaded = import_times(*RUNTIME_MODULES)
+
+    assert set(RUNTIME_MODULES) <= loaded.keys()
+    assert not ON_DEMAND_MODULES & loaded.keys()
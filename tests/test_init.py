@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -15,15 +16,22 @@ from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from custom_components.porkbun_ddns import async_remove_config_entry_device
 from custom_components.porkbun_ddns.api import PorkbunApiError, PorkbunAuthError
 from custom_components.porkbun_ddns.const import (
+    API_WARM_UP_LEAD,
     CONF_FAILURE_THRESHOLD,
+    CONF_IP_SOURCE_ENTITY,
     CONF_STARTUP_DELAY,
+    CONF_SUBDOMAINS,
     CONF_UPDATE_INTERVAL,
+    CONF_WARM_UP_CONNECTION,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    IP_SOURCE_SAFETY_INTERVAL,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
 from custom_components.porkbun_ddns.coordinator import PorkbunDdnsCoordinator
 
-from .conftest import MOCK_DOMAIN, MOCK_IPV4, make_entry, setup_entry
+from .conftest import MOCK_DOMAIN, MOCK_IPV4, make_entry, reload_entry, setup_entry
 
 
 async def test_setup_and_unload_entry(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
@@ -93,6 +101,37 @@ async def test_first_refresh_uses_startup_delay(
     assert entry.runtime_data.data.public_ipv4 == MOCK_IPV4
 
 
+async def test_connection_warmed_up_before_each_update(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    freezer,
+) -> None:
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    entry = make_entry(hass, **{CONF_STARTUP_DELAY: 300, CONF_UPDATE_INTERVAL: 3600, CONF_WARM_UP_CONNECTION: True})
+    await setup_entry(hass, entry)
+    mock_porkbun_client.warm_up.assert_not_awaited()
+
+    # Ahead of the delayed first update...
+    freezer.move_to("2026-02-18 12:04:51+00:00")
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.warm_up.await_count == 1
+    assert mock_porkbun_client.ping.await_count == 0
+
+    freezer.move_to("2026-02-18 12:05:01+00:00")
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == 1
+
+    # ...and ahead of every scheduled update after it, which the entry's phase offset may push back.
+    next_update = entry.runtime_data.next_update
+    assert next_update is not None
+    async_fire_time_changed(hass, next_update - timedelta(seconds=API_WARM_UP_LEAD - 1))
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.warm_up.await_count == 2
+    assert mock_porkbun_client.ping.await_count == 1
+
+
 @pytest.mark.parametrize(
     ("identifiers", "can_remove"),
     [
@@ -116,3 +155,117 @@ async def test_remove_config_entry_device_rules(
     )
 
     assert await async_remove_config_entry_device(hass, entry, device) is can_remove
+
+
+async def test_record_state_persisted_and_restored(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    entry = make_entry(hass, **{CONF_SUBDOMAINS: ["www"]})
+    await setup_entry(hass, entry)
+
+    stored = hass_storage[f"{STORAGE_KEY}.{entry.entry_id}"]["data"]
+    assert stored == {
+        "domain": MOCK_DOMAIN,
+        "last_ipv4": MOCK_IPV4,
+        "last_ipv6": None,
+        "records": {
+            "@_A": {"record_id": "12345", "current_ip": MOCK_IPV4},
+            "www_A": {"record_id": "12345", "current_ip": MOCK_IPV4},
+        },
+    }
+
+    # After a restart with the same public IP, nothing is read from or written to the zone.
+    mock_porkbun_client.get_record_index.reset_mock()
+    mock_porkbun_client.create_record.reset_mock()
+    await reload_entry(hass, entry)
+
+    mock_porkbun_client.get_record_index.assert_not_awaited()
+    mock_porkbun_client.create_record.assert_not_awaited()
+    assert entry.runtime_data.data.records["www_A"].record_id == "12345"
+    assert entry.runtime_data.all_ok
+
+
+@pytest.mark.parametrize(
+    ("stored", "expected_records"),
+    [
+        # Saved for another domain (entry re-pointed): ignore it entirely.
+        ({"domain": "other.com", "last_ipv4": MOCK_IPV4, "records": {"@_A": {"current_ip": MOCK_IPV4}}}, set()),
+        # Records that are no longer managed are dropped.
+        (
+            {
+                "domain": MOCK_DOMAIN,
+                "last_ipv4": MOCK_IPV4,
+                "records": {"@_A": {"current_ip": MOCK_IPV4}, "old_A": {"current_ip": MOCK_IPV4}},
+            },
+            {"@_A"},
+        ),
+    ],
+)
+async def test_restore_ignores_stale_state(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    hass_storage: dict[str, Any],
+    stored: dict[str, Any],
+    expected_records: set[str],
+) -> None:
+    entry = make_entry(hass)
+    hass_storage[f"{STORAGE_KEY}.{entry.entry_id}"] = {"version": STORAGE_VERSION, "data": stored}
+    coordinator = PorkbunDdnsCoordinator(hass, entry)
+
+    await coordinator._async_setup()
+
+    assert set(coordinator.data.records) == expected_records
+
+
+async def test_remove_entry_deletes_stored_state(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    entry = make_entry(hass)
+    await setup_entry(hass, entry)
+    assert f"{STORAGE_KEY}.{entry.entry_id}" in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{STORAGE_KEY}.{entry.entry_id}" not in hass_storage
+
+
+async def test_ip_source_entity_triggers_debounced_update(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    hass.states.async_set("sensor.wan_ip", MOCK_IPV4)
+    entry = make_entry(hass, **{CONF_IP_SOURCE_ENTITY: "sensor.wan_ip"})
+    await setup_entry(hass, entry)
+    coordinator = entry.runtime_data
+    assert coordinator.update_interval == timedelta(seconds=IP_SOURCE_SAFETY_INTERVAL)
+    pings = mock_porkbun_client.ping.await_count
+
+    # Already published, unavailable, or not an address: nothing to do.
+    for state in (MOCK_IPV4, "unavailable", "not-an-ip", "2001:db8::2"):
+        hass.states.async_set("sensor.wan_ip", state)
+        await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == pings
+
+    mock_porkbun_client.ping.return_value = "5.6.7.8"
+    hass.states.async_set("sensor.wan_ip", "5.6.7.8")
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == pings + 1
+    assert coordinator.data.public_ipv4 == "5.6.7.8"
+
+    # A second change inside the cooldown waits for it instead of starting another update.
+    mock_porkbun_client.ping.return_value = "9.9.9.9"
+    hass.states.async_set("sensor.wan_ip", "9.9.9.9")
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == pings + 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == pings + 2
+    assert coordinator.data.public_ipv4 == "9.9.9.9"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    hass.states.async_set("sensor.wan_ip", "1.1.1.1")
+    await hass.async_block_till_done()
+    assert mock_porkbun_client.ping.await_count == pings + 2
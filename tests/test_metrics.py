@@ -0,0 +1,60 @@
+"""Tests for request metrics."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.porkbun_ddns.metrics import EndpointStats, Histogram, Span
+
+
+def test_histogram_buckets_by_upper_bound() -> None:
+    histogram = Histogram([1.0, 0.5])
+    for value in (0.1, 0.5, 0.75, 3.0):
+        histogram.observe(value)
+
+    assert histogram.as_dict() == {
+        "count": 4,
+        "sum": 4.35,
+        "buckets": {"0.5": 2, "1": 1, "+Inf": 1},
+    }
+
+
+def test_endpoint_stats_snapshot() -> None:
+    stats = EndpointStats([1.0], range(1, 4), [1024])
+    stats.retry_causes["timeout"] += 1
+    stats.observe_call(2, None)
+    stats.observe_call(3, "connection")
+    stats.observe_call(0, "circuit_open")
+
+    snapshot = stats.as_dict()
+    assert snapshot["calls"] == 3
+    assert snapshot["failures"] == 2
+    # Calls rejected before anything was sent don't count as attempts.
+    assert snapshot["attempts"]["buckets"] == {"1": 0, "2": 1, "3": 1, "+Inf": 0}
+    assert snapshot["retry_causes"] == {"timeout": 1}
+    assert snapshot["failure_causes"] == {"connection": 1, "circuit_open": 1}
+
+
+def test_span_tree_offsets_and_errors() -> None:
+    clock = iter([10.0, 10.5, 11.0, 11.25, 11.75, 12.0])
+    with patch("custom_components.porkbun_ddns.metrics.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: next(clock)
+        root = Span("cycle", started_at="now")
+        with root.child("ipv4"):
+            pass
+        with pytest.raises(TimeoutError), root.child("zone_fetch"):
+            raise TimeoutError
+        root.finish()
+
+    assert root.as_dict() == {
+        "name": "cycle",
+        "offset_ms": 0.0,
+        "duration_ms": 2000.0,
+        "attrs": {"started_at": "now"},
+        "children": [
+            {"name": "ipv4", "offset_ms": 500.0, "duration_ms": 500.0},
+            {"name": "zone_fetch", "offset_ms": 1250.0, "duration_ms": 500.0, "error": "TimeoutError"},
+        ],
+    }
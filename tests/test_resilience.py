@@ -0,0 +1,227 @@
+"""Tests for the client-side API protections."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.porkbun_ddns.resilience import (
+    CircuitBreaker,
+    LatencyWindow,
+    RetryBudget,
+    RttEstimator,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Iterator[_Clock]:
+    clock = _Clock()
+    with (
+        patch("custom_components.porkbun_ddns.resilience.time.monotonic", new=clock),
+        patch("custom_components.porkbun_ddns.resilience.asyncio.sleep", new=clock.sleep),
+    ):
+        yield clock
+
+
+async def test_token_bucket_allows_burst_then_paces(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=2.0, burst=3)
+
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.now == 1000.0
+
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1000.5)
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1001.0)
+
+
+async def test_token_bucket_refills_while_idle(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=1.0, burst=2)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    clock.now += 10  # refill is capped at the burst size
+    for _ in range(2):
+        await bucket.acquire()
+    assert clock.now == 1010.0
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1011.0)
+
+
+async def test_token_bucket_pause_holds_every_caller(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=10.0, burst=5)
+    bucket.pause(30)
+    assert bucket.paused_for == 30
+
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1030.0)
+    assert bucket.paused_for == 0
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1030.1)
+
+
+async def test_token_bucket_pause_started_while_waiting() -> None:
+    bucket = TokenBucket(rate=1000.0, burst=1)
+    await bucket.acquire()
+
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    bucket.pause(0.05)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await waiter
+    assert loop.time() - started >= 0.04
+
+
+async def test_token_bucket_refunds_cancelled_waiter(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=1.0, burst=1)
+    await bucket.acquire()
+
+    with patch(
+        "custom_components.porkbun_ddns.resilience.asyncio.sleep", new=AsyncMock(side_effect=asyncio.CancelledError)
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await bucket.acquire()
+
+    await bucket.acquire()
+    assert clock.now == pytest.approx(1001.0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("5", 5.0),
+        (" 1.5 ", 1.5),
+        ("0", 0.0),
+        ("-3", 0.0),
+        ("3600", 60.0),
+        ("", None),
+        ("soon", None),
+        ("nan", None),
+        (None, None),
+        (7, None),
+    ],
+)
+def test_parse_retry_after(value: object, expected: float | None) -> None:
+    assert parse_retry_after(value, 60.0) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(when, 60.0) == pytest.approx(30, abs=2)
+    past = format_datetime(datetime.now(UTC) - timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(past, 60.0) == 0.0
+
+
+async def test_circuit_breaker_opens_after_threshold(clock: _Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    breaker.record_success()  # only consecutive failures count
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+    assert breaker.retry_in == 60
+
+
+async def test_circuit_breaker_half_open_allows_single_probe(clock: _Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+
+    clock.now += 60
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False  # probe already in flight
+
+    # A failed probe re-opens immediately, regardless of the threshold.
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+
+    clock.now += 60
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow_request() is True
+
+
+async def test_circuit_breaker_released_probe_can_be_retried(clock: _Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.allow_request() is True
+    breaker.release_probe()
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is True
+
+
+def test_latency_window_percentile() -> None:
+    window = LatencyWindow(size=20)
+    assert window.percentile(95) is None
+
+    for ms in range(1, 21):
+        window.add(ms / 1000)
+    assert len(window) == 20
+    assert window.percentile(50) == 0.010
+    assert window.percentile(95) == 0.019
+    assert window.percentile(100) == 0.020
+
+    # Old samples roll out of the window.
+    for _ in range(20):
+        window.add(1.0)
+    assert window.percentile(50) == 1.0
+
+
+def test_rtt_estimator_tracks_latency_and_backs_off() -> None:
+    rtt = RttEstimator(initial=15.0, minimum=1.0, maximum=30.0)
+    assert rtt.rto is None
+    assert rtt.timeout == 15.0
+
+    rtt.add(2.0)
+    assert rtt.timeout == 6.0  # srtt 2 + 4 * rttvar 1
+    rtt.add(2.0)
+    assert rtt.timeout == 5.0  # steady samples shrink the variance
+
+    for expected in (10.0, 20.0, 30.0, 30.0):
+        rtt.backoff()
+        assert rtt.timeout == expected
+
+    # A completed request clears the backoff.
+    rtt.add(0.1)
+    assert rtt.timeout == pytest.approx(5.9125)
+
+
+def test_retry_budget_caps_retries_at_fraction_of_attempts() -> None:
+    budget = RetryBudget(ratio=0.2, minimum=1)
+    for _ in range(10):
+        budget.record_attempt()
+
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+    assert budget.exhausted
+    # Once refused, later attempts don't earn the budget back within the cycle.
+    for _ in range(10):
+        budget.record_attempt()
+    assert budget.try_spend() is False
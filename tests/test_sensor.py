@@ -13,7 +13,14 @@ from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.porkbun_ddns.api import DomainInfo
-from custom_components.porkbun_ddns.const import CONF_FAILURE_THRESHOLD, CONF_MANAGE_ROOT, CONF_SUBDOMAINS
+from custom_components.porkbun_ddns.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_FAILURE_THRESHOLD,
+    CONF_MANAGE_ROOT,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_STARTUP_DELAY,
+    CONF_SUBDOMAINS,
+)
 
 from .conftest import MOCK_DOMAIN, MOCK_IPV4, enable_entity, get_entity_id, make_entry, reload_entry, setup_entry
 
@@ -70,7 +77,7 @@ async def test_managed_subdomains_sensor_omits_apex_when_root_unmanaged(
     assert state.attributes["managed_records"] == [f"www.{MOCK_DOMAIN}"]
 
 
-@pytest.mark.parametrize("suffix", ["A_ip", "domain_expiry"])
+@pytest.mark.parametrize("suffix", ["A_ip", "domain_expiry", "api_requests", "api_latency"])
 async def test_disabled_by_default_sensors(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
@@ -106,6 +113,41 @@ async def test_timestamp_sensor_values(
     assert next_state.state != "Refreshing"
 
 
+async def test_next_update_follows_startup_delay_and_adapted_interval(
+    hass: HomeAssistant,
+    mock_porkbun_client: AsyncMock,
+    freezer: Any,
+) -> None:
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    started = dt_util.utcnow()
+    entry = make_entry(hass, **{CONF_STARTUP_DELAY: 120, CONF_ADAPTIVE_POLLING: True, CONF_MAX_UPDATE_INTERVAL: 3600})
+    await setup_entry(hass, entry)
+    entity_id = get_entity_id(hass, "sensor", f"{MOCK_DOMAIN}_next_update")
+
+    # Before the first update, the deferred update is the next to run.
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert datetime.fromisoformat(state.state) == started + timedelta(seconds=120)
+
+    # After it, the entry's phase offset stretches one interval.
+    freezer.tick(timedelta(seconds=120))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state is not None
+    next_update = datetime.fromisoformat(state.state)
+    assert next_update == entry.runtime_data.next_update
+    assert timedelta(seconds=300) <= next_update - dt_util.utcnow() < timedelta(seconds=600)
+
+    # Once the IP has held for a day, the next update is an hour out.
+    freezer.tick(timedelta(days=1))
+    await entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert datetime.fromisoformat(state.state) == dt_util.utcnow() + timedelta(seconds=3600)
+
+
 async def test_entities_unavailable_after_failed_scheduled_poll(
     hass: HomeAssistant,
     mock_porkbun_client: AsyncMock,
@@ -152,3 +194,34 @@ async def test_domain_expiry_sensor_values(
     state = hass.states.get(expiry_id)
     assert state is not None
     assert (state.state not in {"unknown", "unavailable"}) is expect_available
+
+
+async def test_api_metric_sensor_values(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    mock_porkbun_client.endpoint_stats.return_value = {
+        "dns/retrieve": {
+            "calls": 2,
+            "failures": 0,
+            "retry_causes": {},
+            "recent_latency_seconds": {"p50": 0.25, "p95": 0.4},
+        },
+        "ping": {
+            "calls": 3,
+            "failures": 1,
+            "retry_causes": {"timeout": 2},
+            "recent_latency_seconds": {"p50": 0.1, "p95": 0.2},
+        },
+    }
+    entry = make_entry(hass)
+    await setup_entry(hass, entry)
+    requests_id = await enable_entity(hass, entry, "sensor", f"{MOCK_DOMAIN}_api_requests")
+    latency_id = await enable_entity(hass, entry, "sensor", f"{MOCK_DOMAIN}_api_latency")
+
+    requests = hass.states.get(requests_id)
+    assert requests is not None
+    assert requests.state == "5"
+    assert requests.attributes["ping"] == {"calls": 3, "failures": 1, "retries": 2}
+    latency_state = hass.states.get(latency_id)
+    assert latency_state is not None
+    assert float(latency_state.state) == 250.0
+    assert latency_state.attributes["dns/retrieve"] == 250.0
+    assert latency_state.attributes["ping"] == 100.0
@@ -0,0 +1,238 @@
+"""Tests for integration-wide shared state."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.porkbun_ddns.const import API_MAX_CONCURRENT_REQUESTS, DATA_CLIENTS, DEFAULT_TTL, DOMAIN
+from custom_components.porkbun_ddns.coordinator import PorkbunDdnsCoordinator
+from custom_components.porkbun_ddns.shared import (
+    PublicIpCache,
+    RecordWriteQueue,
+    async_acquire_client,
+    async_get_ip_cache,
+    async_release_client,
+)
+
+from .conftest import MOCK_API_KEY, MOCK_IPV4, MOCK_SECRET_KEY, make_entry, setup_entry
+
+
+async def test_acquire_client_shares_per_credentials(hass: HomeAssistant) -> None:
+    with patch("custom_components.porkbun_ddns.shared._async_create_session"):
+        first = async_acquire_client(hass, "entry1", "pk1", "sk1", keepalive_timeout=60)
+        second = async_acquire_client(hass, "entry2", "pk1", "sk1", keepalive_timeout=60)
+        other = async_acquire_client(hass, "entry3", "pk2", "sk2", keepalive_timeout=60)
+
+    assert first is second
+    assert other is not first
+
+
+async def test_release_client_drops_unused_clients(hass: HomeAssistant) -> None:
+    with patch(
+        "custom_components.porkbun_ddns.shared._async_create_session",
+        side_effect=lambda *_: AsyncMock(spec=aiohttp.ClientSession),
+    ):
+        first = async_acquire_client(hass, "entry1", "pk1", "sk1", keepalive_timeout=60)
+        async_acquire_client(hass, "entry2", "pk1", "sk1", keepalive_timeout=60)
+        session = hass.data[DOMAIN][DATA_CLIENTS][("pk1", "sk1")].session
+
+        await async_release_client(hass, "entry1")
+        assert async_acquire_client(hass, "entry3", "pk1", "sk1", keepalive_timeout=60) is first
+        session.close.assert_not_awaited()
+
+        await async_release_client(hass, "entry2")
+        await async_release_client(hass, "entry3")
+        assert hass.data[DOMAIN][DATA_CLIENTS] == {}
+        session.close.assert_awaited_once()
+        assert async_acquire_client(hass, "entry4", "pk1", "sk1", keepalive_timeout=60) is not first
+
+
+async def test_client_session_uses_dedicated_connector(hass: HomeAssistant) -> None:
+    client = async_acquire_client(hass, "entry1", "pk1", "sk1", keepalive_timeout=330)
+    lease = hass.data[DOMAIN][DATA_CLIENTS][("pk1", "sk1")]
+    session = lease.session
+    connector = session.connector
+
+    assert client._session is session
+    assert isinstance(connector, aiohttp.TCPConnector)
+    assert connector is not async_get_clientsession(hass).connector
+    assert connector.limit_per_host == API_MAX_CONCURRENT_REQUESTS
+    assert connector._keepalive_timeout == 330
+    # IPv6 detection pings the dual-stack host over a connector that can only use IPv6.
+    assert client._ipv6_session is lease.ipv6_session
+    ipv6_connector = lease.ipv6_session.connector
+    assert isinstance(ipv6_connector, aiohttp.TCPConnector)
+    assert ipv6_connector._family == socket.AF_INET6
+
+    await async_release_client(hass, "entry1")
+    assert session.closed
+    assert lease.ipv6_session.closed
+
+
+async def test_client_sessions_closed_on_stop(hass: HomeAssistant) -> None:
+    async_acquire_client(hass, "entry1", "pk1", "sk1", keepalive_timeout=60)
+    session = hass.data[DOMAIN][DATA_CLIENTS][("pk1", "sk1")].session
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert session.closed
+
+
+async def test_entries_share_one_client_until_unloaded(hass: HomeAssistant, mock_porkbun_client: AsyncMock) -> None:
+    first = make_entry(hass)
+    second = make_entry(hass, domain_name="example.org")
+    await setup_entry(hass, first)  # loads every entry of the integration
+
+    assert first.runtime_data._client is second.runtime_data._client
+    lease = hass.data[DOMAIN][DATA_CLIENTS][(MOCK_API_KEY, MOCK_SECRET_KEY)]
+    assert lease.entry_ids == {first.entry_id, second.entry_id}
+
+    await hass.config_entries.async_unload(first.entry_id)
+    assert lease.entry_ids == {second.entry_id}
+
+    await hass.config_entries.async_unload(second.entry_id)
+    assert hass.data[DOMAIN][DATA_CLIENTS] == {}
+
+
+async def test_ip_cache_single_flight(hass: HomeAssistant) -> None:
+    release = asyncio.Event()
+
+    async def _fetch() -> str:
+        await release.wait()
+        return MOCK_IPV4
+
+    fetch = AsyncMock(side_effect=_fetch)
+    cache = PublicIpCache(hass)
+    first = hass.async_create_task(cache.async_lookup(("A", "pk1"), fetch, max_age=0))
+    second = hass.async_create_task(cache.async_lookup(("A", "pk1"), fetch, max_age=0))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first)[0] == (await second)[0] == MOCK_IPV4
+    assert fetch.await_count == 1
+
+
+async def test_ip_cache_max_age_and_newer_than(hass: HomeAssistant) -> None:
+    fetch = AsyncMock(side_effect=[MOCK_IPV4, "5.6.7.8", "9.9.9.9", "10.0.0.1"])
+    cache = PublicIpCache(hass)
+
+    with patch("custom_components.porkbun_ddns.shared.time.monotonic", return_value=100.0):
+        ip, fetched_at = await cache.async_lookup(("A", "pk1"), fetch, max_age=150)
+    with patch("custom_components.porkbun_ddns.shared.time.monotonic", return_value=200.0):
+        # Another entry within its max age reuses the lookup.
+        assert await cache.async_lookup(("A", "pk1"), fetch, max_age=150) == (ip, fetched_at)
+        # The same entry asking again never gets back the lookup it already saw.
+        assert (await cache.async_lookup(("A", "pk1"), fetch, max_age=150, newer_than=fetched_at))[0] == "5.6.7.8"
+        # A forced refresh always looks again.
+        assert (await cache.async_lookup(("A", "pk1"), fetch, max_age=0))[0] == "9.9.9.9"
+    with patch("custom_components.porkbun_ddns.shared.time.monotonic", return_value=300.0):
+        assert (await cache.async_lookup(("A", "pk1"), fetch, max_age=30))[0] == "10.0.0.1"
+
+    assert fetch.await_count == 4
+
+
+async def test_ip_cache_does_not_cache_failures(hass: HomeAssistant) -> None:
+    fetch = AsyncMock(side_effect=[TimeoutError(), MOCK_IPV4])
+    cache = PublicIpCache(hass)
+
+    with pytest.raises(TimeoutError):
+        await cache.async_lookup(("A", "pk1"), fetch, max_age=150)
+    assert (await cache.async_lookup(("A", "pk1"), fetch, max_age=150))[0] == MOCK_IPV4
+
+
+async def test_entries_share_public_ip_lookup(hass: HomeAssistant, mock_porkbun_client: AsyncMock, freezer) -> None:
+    """Domains on one account polling minutes apart share a ping within half an interval."""
+    first = PorkbunDdnsCoordinator(hass, make_entry(hass))
+    second = PorkbunDdnsCoordinator(hass, make_entry(hass, domain_name="example.org"))
+
+    await first._async_update_data()
+    freezer.tick(timedelta(seconds=120))
+    await second._async_update_data()
+    assert mock_porkbun_client.ping.await_count == 1
+
+    # Each entry's own next cycle is further away than that, so it always looks again.
+    freezer.tick(timedelta(seconds=180))
+    await first._async_update_data()
+    assert mock_porkbun_client.ping.await_count == 2
+
+    # The Refresh button asks for a lookup of its own.
+    await second.async_request_refresh()
+    assert mock_porkbun_client.ping.await_count == 3
+    assert async_get_ip_cache(hass) is async_get_ip_cache(hass)
+
+
+async def test_write_queue_coalesces_to_latest_content(hass: HomeAssistant) -> None:
+    release = asyncio.Event()
+
+    async def _create(*_: object, **__: object) -> str:
+        await release.wait()
+        return "12345"
+
+    client = MagicMock()
+    client.create_record = AsyncMock(side_effect=_create)
+    client.edit_record_by_name_type = AsyncMock()
+    queue = RecordWriteQueue(hass)
+    key = ("example.com", "www", "A")
+
+    first = hass.async_create_task(queue.async_write(client, key, MOCK_IPV4, create=True))
+    await asyncio.sleep(0)
+    # Arriving while the create is in flight: a duplicate joins it, later addresses merge.
+    joined = hass.async_create_task(queue.async_write(client, key, MOCK_IPV4, create=True))
+    superseded = hass.async_create_task(queue.async_write(client, key, "5.6.7.8", create=True))
+    latest = hass.async_create_task(queue.async_write(client, key, "9.9.9.9", create=True))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await joined == (MOCK_IPV4, "12345")
+    assert await superseded == await latest == ("9.9.9.9", None)
+    client.create_record.assert_awaited_once_with("example.com", "A", MOCK_IPV4, "www", DEFAULT_TTL, budget=None)
+    # The record exists after the first write, so the merged one is an edit, not a second create.
+    client.edit_record_by_name_type.assert_awaited_once_with(
+        "example.com", "A", "9.9.9.9", "www", DEFAULT_TTL, budget=None
+    )
+
+
+async def test_write_queue_cancellation_releases_waiters(hass: HomeAssistant) -> None:
+    async def _hang(*_: object, **__: object) -> None:
+        await asyncio.Event().wait()
+
+    client = MagicMock()
+    client.edit_record_by_name_type = AsyncMock(side_effect=_hang)
+    queue = RecordWriteQueue(hass)
+    key = ("example.com", "", "A")
+
+    first = hass.async_create_task(queue.async_write(client, key, MOCK_IPV4, create=False))
+    await asyncio.sleep(0)
+    joined = hass.async_create_task(queue.async_write(client, key, MOCK_IPV4, create=False))
+    queued = hass.async_create_task(queue.async_write(client, key, "5.6.7.8", create=False))
+    await asyncio.sleep(0)
+    queue._workers[key].cancel()
+
+    for waiter in (first, joined, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert not queue._in_flight
+    assert not queue._queued
+    assert not queue._workers
+
+
+async def test_write_queue_shares_failures(hass: HomeAssistant) -> None:
+    client = MagicMock()
+    client.edit_record_by_name_type = AsyncMock(side_effect=[TimeoutError(), None])
+    queue = RecordWriteQueue(hass)
+    key = ("example.com", "", "A")
+
+    with pytest.raises(TimeoutError):
+        await queue.async_write(client, key, MOCK_IPV4, create=False)
+    # A failed write leaves nothing behind; the next one is sent normally.
+    assert await queue.async_write(client, key, MOCK_IPV4, create=False) == (MOCK_IPV4, None)
@@ -41,6 +41,8 @@ async def _entity_ids_for_platform(
         (
             Platform.SENSOR,
             {
+                "sensor.example_com_api_latency",
+                "sensor.example_com_api_requests",
                 "sensor.example_com_domain_expiry",
                 "sensor.example_com_last_updated",
                 "sensor.example_com_managed_subdomains",
@@ -0,0 +1,166 @@
+"""Long-run soak test: weeks of simulated time through the real scheduler.
+
+Deselected by default; run it with ``pytest -m soak``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tracemalloc
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.util import dt as dt_util
+from homeassistant.util.event_type import EventType
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.porkbun_ddns.api import DnsRecord, PorkbunApiError, RecordIndex
+from custom_components.porkbun_ddns.const import (
+    CONF_STARTUP_DELAY,
+    CONF_SUBDOMAINS,
+    CYCLE_TRACE_HISTORY,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+
+from .conftest import MOCK_DOMAIN, make_entry, setup_entry
+
+pytestmark = pytest.mark.soak
+
+SOAK_DURATION = timedelta(days=14)
+STEP = timedelta(seconds=60)
+# Timers are fired this far ahead, covering the coordinator's sub-second offset on its refresh timer.
+TIMER_SLACK = timedelta(seconds=1)
+CHECKPOINT = timedelta(days=7)
+IP_CHANGE_EVERY = timedelta(days=3)
+OUTAGE_EVERY = timedelta(days=5)
+OUTAGE_LENGTH = timedelta(hours=2)
+MEMORY_GROWTH_LIMIT = 128 * 1024
+
+
+class _SimulatedNetwork:
+    """A public IP and API outages driven by simulated time, and the zone the API holds."""
+
+    def __init__(self) -> None:
+        self.ip = "198.51.100.1"
+        self.outage: Exception | None = None
+        self.zone: dict[tuple[str, str], DnsRecord] = {}
+        self.pings = 0
+
+    def advance(self, elapsed: timedelta) -> None:
+        self.ip = f"198.51.100.{elapsed // IP_CHANGE_EVERY % 250 + 1}"
+        outage, into = divmod(elapsed, OUTAGE_EVERY)
+        if outage == 0 or into >= OUTAGE_LENGTH:
+            self.outage = None
+        elif outage % 2:
+            self.outage = aiohttp.ClientConnectionError("Network is unreachable")
+        else:
+            self.outage = PorkbunApiError("HTTP 503")
+
+    def _check(self) -> None:
+        if self.outage is not None:
+            raise self.outage
+
+    async def ping(self, **_: object) -> str:
+        self.pings += 1
+        self._check()
+        return self.ip
+
+    async def get_record_index(self, domain: str, **_: object) -> RecordIndex:
+        self._check()
+        return {key: [record] for key, record in self.zone.items()}
+
+    async def create_record(
+        self, domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+    ) -> str:
+        self._check()
+        name = f"{subdomain}.{domain}" if subdomain else domain
+        record = DnsRecord(str(len(self.zone) + 1), name, record_type, content, str(ttl))
+        self.zone[(name, record_type)] = record
+        return record.id
+
+    async def edit_record_by_name_type(
+        self, domain: str, record_type: str, content: str, subdomain: str = "", ttl: int = 600, **_: object
+    ) -> None:
+        self._check()
+        name = f"{subdomain}.{domain}" if subdomain else domain
+        self.zone[(name, record_type)].content = content
+
+
+def _live_timers(hass: HomeAssistant) -> int:
+    return sum(not handle.cancelled() for handle in hass.loop._scheduled)  # type: ignore[attr-defined]
+
+
+def _integration_memory() -> int:
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, f"*{os.sep}{DOMAIN}{os.sep}*")])
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def test_weeks_of_updates_stay_bounded(hass: HomeAssistant, mock_porkbun_client: AsyncMock, freezer) -> None:
+    network = _SimulatedNetwork()
+    # Plain coroutines rather than AsyncMock side effects: a mock's call history would keep every
+    # cycle's arguments alive and show up as the integration's own memory growth.
+    for name in ("ping", "get_record_index", "create_record", "edit_record_by_name_type"):
+        setattr(mock_porkbun_client, name, getattr(network, name))
+
+    freezer.move_to("2026-02-18 12:00:00+00:00")
+    started = dt_util.utcnow()
+    # Let Home Assistant's own periodic timers, already due from fixture setup, re-arm first.
+    await hass.async_block_till_done()
+    timers_before = _live_timers(hass)
+
+    tracemalloc.start()
+    try:
+        entry = make_entry(hass, **{CONF_STARTUP_DELAY: 300, CONF_SUBDOMAINS: ["www"]})
+        await setup_entry(hass, entry)
+        coordinator = entry.runtime_data
+        assert coordinator.data.last_updated is None
+
+        checkpoint: tuple[int, int, dict[EventType[Any] | str, int], int] | None = None
+        while (elapsed := dt_util.utcnow() - started) < SOAK_DURATION:
+            freezer.tick(STEP)
+            network.advance(elapsed + STEP)
+            async_fire_time_changed(hass, dt_util.utcnow() + TIMER_SLACK)
+            # Scheduled refreshes run as background tasks.
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+            if checkpoint is None and elapsed + STEP >= CHECKPOINT:
+                checkpoint = (
+                    _integration_memory(),
+                    _live_timers(hass),
+                    hass.bus.async_listeners(),
+                    len(asyncio.all_tasks()),
+                )
+        memory = _integration_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Every IP change and outage was ridden out and the final address published.
+    assert checkpoint is not None
+    assert coordinator.last_update_success
+    assert coordinator.all_ok
+    assert {record.content for record in network.zone.values()} == {network.ip}
+    assert ir.async_get(hass).async_get_issue(DOMAIN, f"api_access_{MOCK_DOMAIN}") is None
+    assert network.pings >= SOAK_DURATION / timedelta(seconds=DEFAULT_UPDATE_INTERVAL) * 0.9
+
+    # The second week left nothing behind that the first didn't already have.
+    checkpoint_memory, checkpoint_timers, checkpoint_listeners, checkpoint_tasks = checkpoint
+    assert memory - checkpoint_memory < MEMORY_GROWTH_LIMIT
+    assert coordinator.record_count == 2
+    assert len(coordinator.cycle_traces) <= CYCLE_TRACE_HISTORY
+    assert _live_timers(hass) <= checkpoint_timers
+    assert hass.bus.async_listeners() == checkpoint_listeners
+    assert len(asyncio.all_tasks()) <= checkpoint_tasks
+
+    # Unloading releases the startup-delay timer and every scheduled refresh.
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    # Let Home Assistant's own delayed registry saves run too.
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=1))
+    await hass.async_block_till_done()
+    assert _live_timers(hass) <= timers_before